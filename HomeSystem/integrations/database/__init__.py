@@ -28,7 +28,8 @@ from .connection import (
     DatabaseManager, 
     get_database_manager, 
     close_all_connections, 
-    check_database_health
+    check_database_health,
+    get_pool_stats
 )
 
 from .models import (
@@ -49,6 +50,7 @@ __all__ = [
     "get_database_manager", 
     "close_all_connections",
     "check_database_health",
+    "get_pool_stats",
     
     # 数据模型
     "BaseModel",
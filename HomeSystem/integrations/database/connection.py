@@ -1,11 +1,14 @@
 # 数据库连接管理模块
 import os
 import asyncio
+import threading
+import time
 from typing import Dict, Any, Optional, AsyncContextManager, ContextManager
 from contextlib import asynccontextmanager, contextmanager
 import asyncpg
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 import redis
 from loguru import logger
 
@@ -13,11 +16,25 @@ from loguru import logger
 class DatabaseManager:
     """数据库连接管理器，支持 PostgreSQL 和 Redis"""
     
-    def __init__(self):
+    def __init__(self, postgres_config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            postgres_config: PostgreSQL 连接参数，默认从环境变量读取
+        """
         self._config = self._load_config()
-        self.postgres_sync_conn = None
+        if postgres_config:
+            self._config['postgres'] = dict(postgres_config)
+        self.postgres_sync_pool = None
         self.postgres_pool = None
         self.redis_client = None
+        self._sync_pool_lock = threading.Lock()
+        self._sync_pool_slots = None  # 限制同时借出的连接数，连接池耗尽时等待而不是直接报错
+        self._local = threading.local()  # 当前线程借出的连接（嵌套调用复用同一连接）
+        self._last_used: Dict[int, float] = {}  # 池中空闲连接的归还时间，用于借出时判断是否需要健康检查及统计空闲连接数
+        self._sync_pool_stats = {
+            'checkouts': 0, 'waits': 0, 'wait_seconds': 0.0, 'timeouts': 0,
+            'in_use': 0, 'max_in_use': 0, 'health_check_failures': 0
+        }
         
     def _load_config(self) -> Dict[str, Any]:
         """加载数据库配置"""
@@ -29,6 +46,12 @@ class DatabaseManager:
                 'user': os.getenv('DB_USER', 'homesystem'),
                 'password': os.getenv('DB_PASSWORD', 'homesystem123'),
             },
+            'postgres_pool': {
+                'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 1)),
+                'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+                'timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),  # 等待空闲连接的最长时间（秒）
+                'check_idle': float(os.getenv('DB_POOL_CHECK_IDLE', 30)),  # 空闲超过该时间的连接借出前先执行 SELECT 1
+            },
             'redis': {
                 'host': os.getenv('REDIS_HOST', 'localhost'),
                 'port': int(os.getenv('REDIS_PORT', 6379)),
@@ -37,34 +60,149 @@ class DatabaseManager:
             }
         }
     
+    def _init_postgres_sync_pool(self):
+        """初始化 PostgreSQL 同步连接池（首次借出连接时调用）"""
+        with self._sync_pool_lock:
+            if self.postgres_sync_pool is None:
+                pool_config = self._config['postgres_pool']
+                max_size = max(1, pool_config['max_size'])
+                min_size = min(pool_config['min_size'], max_size)
+                self.postgres_sync_pool = psycopg2.pool.ThreadedConnectionPool(
+                    min_size, max_size, **self._config['postgres']
+                )
+                # 登记连接池预先建立的空闲连接，空闲连接数只依据本管理器的借出/归还记录统计
+                preopened = [self.postgres_sync_pool.getconn() for _ in range(min_size)]
+                for conn in preopened:
+                    self._last_used[id(conn)] = time.monotonic()
+                    self.postgres_sync_pool.putconn(conn)
+                self._sync_pool_slots = threading.BoundedSemaphore(max_size)
+                logger.info(f"PostgreSQL 同步连接池已初始化 (min={pool_config['min_size']}, max={max_size})")
+    
+    def _checkout_postgres_sync(self):
+        """从连接池借出一个健康的连接，池已满时等待"""
+        if self.postgres_sync_pool is None:
+            self._init_postgres_sync_pool()
+        
+        pool_config = self._config['postgres_pool']
+        start = time.monotonic()
+        if not self._sync_pool_slots.acquire(blocking=False):
+            with self._sync_pool_lock:
+                self._sync_pool_stats['waits'] += 1
+            acquired = self._sync_pool_slots.acquire(timeout=pool_config['timeout'])
+            with self._sync_pool_lock:
+                self._sync_pool_stats['wait_seconds'] += time.monotonic() - start
+                if not acquired:
+                    self._sync_pool_stats['timeouts'] += 1
+            if not acquired:
+                raise psycopg2.pool.PoolError(f"等待 PostgreSQL 连接超时 ({pool_config['timeout']}秒)")
+        
+        try:
+            conn = self.postgres_sync_pool.getconn()
+            # 空闲较久的连接可能已被服务端或网络断开，借出前检查（新建的连接无需检查）
+            last_used = self._last_used.pop(id(conn), None)
+            idle = time.monotonic() - last_used if last_used is not None else 0
+            if conn.closed or (idle > pool_config['check_idle'] and not self._is_connection_alive(conn)):
+                with self._sync_pool_lock:
+                    self._sync_pool_stats['health_check_failures'] += 1
+                logger.warning("PostgreSQL 连接已失效，重新建立连接")
+                self.postgres_sync_pool.putconn(conn, close=True)
+                conn = self.postgres_sync_pool.getconn()
+            conn.autocommit = False
+        except Exception:
+            self._sync_pool_slots.release()
+            raise
+        
+        with self._sync_pool_lock:
+            self._sync_pool_stats['checkouts'] += 1
+            self._sync_pool_stats['in_use'] += 1
+            self._sync_pool_stats['max_in_use'] = max(self._sync_pool_stats['max_in_use'], self._sync_pool_stats['in_use'])
+        return conn
+    
+    def _checkin_postgres_sync(self, conn):
+        """归还连接，已断开或事务未结束的连接直接关闭"""
+        try:
+            broken = bool(conn.closed) or conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+            if not broken:
+                self._last_used[id(conn)] = time.monotonic()
+            self.postgres_sync_pool.putconn(conn, close=broken)
+            if conn.closed:
+                # 连接池只保留 min_size 个空闲连接，多余的在归还时关闭
+                self._last_used.pop(id(conn), None)
+        except Exception as e:
+            logger.warning(f"归还 PostgreSQL 连接失败: {e}")
+        finally:
+            with self._sync_pool_lock:
+                self._sync_pool_stats['in_use'] -= 1
+            self._sync_pool_slots.release()
+    
+    @staticmethod
+    def _is_connection_alive(conn) -> bool:
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+    
     @contextmanager
-    def get_postgres_sync(self):
-        """获取 PostgreSQL 同步连接上下文管理器"""
-        conn = None
-        cursor = None
+    def get_postgres_connection(self):
+        """
+        从连接池借出 PostgreSQL 同步连接的上下文管理器
+        
+        每个线程借出独立的连接，同一线程内嵌套调用复用该连接，
+        最外层退出时归还。正常退出提交事务，异常时回滚。
+        """
+        conn = getattr(self._local, 'conn', None)
+        outermost = conn is None
+        if outermost:
+            conn = self._checkout_postgres_sync()
+            self._local.conn = conn
+        
         try:
-            if not self.postgres_sync_conn or self.postgres_sync_conn.closed:
-                self.postgres_sync_conn = psycopg2.connect(**self._config['postgres'])
-                self.postgres_sync_conn.autocommit = False
-                logger.debug("创建新的 PostgreSQL 同步连接")
-            
-            conn = self.postgres_sync_conn
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            
-            yield cursor
+            yield conn
             
             # 如果没有异常，提交事务
             conn.commit()
             logger.debug("PostgreSQL 事务已提交")
             
         except Exception as e:
-            if conn:
+            if not conn.closed:
                 conn.rollback()
                 logger.error(f"PostgreSQL 事务已回滚: {e}")
             raise
         finally:
-            if cursor:
-                cursor.close()
+            if outermost:
+                self._local.conn = None
+                self._checkin_postgres_sync(conn)
+    
+    @contextmanager
+    def get_postgres_sync(self):
+        """获取 PostgreSQL 同步连接上下文管理器，返回 RealDictCursor（事务与连接管理同 get_postgres_connection）"""
+        with self.get_postgres_connection() as conn:
+            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            try:
+                yield cursor
+            finally:
+                if not cursor.closed:
+                    cursor.close()
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """获取 PostgreSQL 同步连接池使用情况"""
+        pool_config = self._config['postgres_pool']
+        with self._sync_pool_lock:
+            stats = dict(self._sync_pool_stats)
+            idle = len(self._last_used)
+            stats.update({
+                'initialized': self.postgres_sync_pool is not None,
+                'min_size': pool_config['min_size'],
+                'max_size': pool_config['max_size'],
+                'open_connections': stats['in_use'] + idle,
+                'idle_connections': idle,
+                'avg_wait_ms': round(stats['wait_seconds'] * 1000 / stats['waits'], 1) if stats['waits'] else 0.0
+            })
+            stats['wait_seconds'] = round(stats['wait_seconds'], 3)
+        return stats
     
     async def init_postgres_async(self):
         """初始化 PostgreSQL 异步连接池"""
@@ -107,9 +245,10 @@ class DatabaseManager:
     
     def close_connections(self):
         """关闭所有连接"""
-        if self.postgres_sync_conn and not self.postgres_sync_conn.closed:
-            self.postgres_sync_conn.close()
-            logger.info("PostgreSQL 同步连接已关闭")
+        if self.postgres_sync_pool and not self.postgres_sync_pool.closed:
+            self.postgres_sync_pool.closeall()
+            self._last_used.clear()
+            logger.info("PostgreSQL 同步连接池已关闭")
         
         if self.postgres_pool:
             asyncio.create_task(self.postgres_pool.close())
@@ -119,8 +258,8 @@ class DatabaseManager:
             self.redis_client.close()
             logger.info("Redis 连接已关闭")
     
-    def health_check(self) -> Dict[str, bool]:
-        """检查数据库连接健康状态"""
+    def health_check(self) -> Dict[str, Any]:
+        """检查数据库连接健康状态，附带同步连接池使用情况"""
         health = {
             'postgres_sync': False,
             'postgres_async': False,
@@ -143,6 +282,7 @@ class DatabaseManager:
         except Exception as e:
             logger.warning(f"Redis 连接健康检查失败: {e}")
         
+        health['postgres_sync_pool'] = self.get_pool_stats()
         return health
 
 
@@ -160,6 +300,11 @@ def close_all_connections():
     db_manager.close_connections()
 
 
-def check_database_health() -> Dict[str, bool]:
+def check_database_health() -> Dict[str, Any]:
     """检查数据库健康状态"""
-    return db_manager.health_check()
\ No newline at end of file
+    return db_manager.health_check()
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """获取 PostgreSQL 同步连接池使用情况"""
+    return db_manager.get_pool_stats()
\ No newline at end of file
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+数据库迁移脚本：深度分析摘要列
+
+该脚本为arxiv_papers表添加：
+- has_deep_analysis: BOOLEAN 生成列 - 深度分析结果非空，由数据库自动维护
+- deep_analysis_length: INTEGER 生成列 - 深度分析结果长度，由数据库自动维护
+
+论文列表（浏览页、未分配论文、按任务查看、PaperDataService）只读取这两列，
+不再为每行读取深度分析全文；未执行本迁移时这些查询会报 "column does not exist"。
+
+注意：添加生成列会重写整张表，大表上执行期间arxiv_papers会被锁定，请在低峰期执行。
+"""
+
+import sys
+import os
+from loguru import logger
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from HomeSystem.integrations.database.connection import get_database_manager
+
+
+SUMMARY_COLUMNS = ('has_deep_analysis', 'deep_analysis_length')
+
+
+def add_summary_columns(cursor) -> bool:
+    """添加has_deep_analysis/deep_analysis_length生成列"""
+    try:
+        logger.info("开始添加深度分析摘要生成列（会重写整张表）...")
+
+        cursor.execute("""
+            ALTER TABLE arxiv_papers
+            ADD COLUMN IF NOT EXISTS has_deep_analysis BOOLEAN GENERATED ALWAYS AS (
+                deep_analysis_result IS NOT NULL AND deep_analysis_result <> ''
+            ) STORED
+        """)
+        cursor.execute("""
+            ALTER TABLE arxiv_papers
+            ADD COLUMN IF NOT EXISTS deep_analysis_length INTEGER GENERATED ALWAYS AS (
+                length(deep_analysis_result)
+            ) STORED
+        """)
+
+        logger.info("深度分析摘要生成列添加成功")
+        return True
+
+    except Exception as e:
+        logger.error(f"添加深度分析摘要生成列失败: {e}")
+        return False
+
+
+def validate_migration(cursor) -> bool:
+    """验证迁移结果"""
+    try:
+        logger.info("开始验证迁移结果...")
+
+        cursor.execute("""
+            SELECT column_name, data_type, is_generated
+            FROM information_schema.columns
+            WHERE table_name = 'arxiv_papers' AND column_name = ANY(%s)
+            ORDER BY column_name
+        """, (list(SUMMARY_COLUMNS),))
+
+        columns = {row['column_name']: row for row in cursor.fetchall()}
+        missing_columns = [name for name in SUMMARY_COLUMNS if name not in columns]
+        if missing_columns:
+            logger.error(f"缺少字段: {missing_columns}")
+            return False
+
+        for name, column in columns.items():
+            logger.info(f"字段 {name}: 类型={column['data_type']}, 生成列={column['is_generated']}")
+
+        # 生成列应与深度分析结果一致
+        cursor.execute("""
+            SELECT COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE has_deep_analysis) AS with_analysis,
+                   COUNT(*) FILTER (
+                       WHERE has_deep_analysis IS DISTINCT FROM
+                             (deep_analysis_result IS NOT NULL AND deep_analysis_result <> '')
+                   ) AS mismatched
+            FROM arxiv_papers
+        """)
+
+        counts = cursor.fetchone()
+        logger.info(f"有深度分析结果的记录数: {counts['with_analysis']}/{counts['total']}")
+        if counts['mismatched']:
+            logger.error(f"has_deep_analysis 与深度分析结果不一致的记录数: {counts['mismatched']}")
+            return False
+
+        logger.info("迁移验证完成")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移验证失败: {e}")
+        return False
+
+
+def rollback_migration(cursor) -> bool:
+    """回滚迁移（仅用于测试或紧急情况）"""
+    try:
+        logger.warning("开始回滚迁移...")
+
+        for name in SUMMARY_COLUMNS:
+            cursor.execute(f"ALTER TABLE arxiv_papers DROP COLUMN IF EXISTS {name}")
+
+        logger.warning("迁移回滚完成（论文列表查询依赖这两列，请同时回退代码）")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移回滚失败: {e}")
+        return False
+
+
+def main():
+    """主函数"""
+    logger.info("开始数据库迁移：深度分析摘要列")
+
+    # 检查命令行参数
+    rollback_mode = len(sys.argv) > 1 and sys.argv[1] == '--rollback'
+    if rollback_mode:
+        logger.warning("执行回滚操作")
+
+    try:
+        # 获取数据库管理器
+        db_manager = get_database_manager()
+
+        with db_manager.get_postgres_sync() as cursor:
+            if rollback_mode:
+                if not rollback_migration(cursor):
+                    logger.error("回滚失败")
+                    sys.exit(1)
+                logger.info("回滚成功完成")
+                return
+
+            logger.info("开始正向迁移...")
+
+            # 1. 添加生成列（同时回填现有数据）
+            if not add_summary_columns(cursor):
+                logger.error("添加字段失败，迁移终止")
+                sys.exit(1)
+
+            # 2. 验证迁移结果
+            if not validate_migration(cursor):
+                logger.error("迁移验证失败")
+                sys.exit(1)
+
+            logger.info("数据库迁移成功完成！")
+            logger.info("新增字段:")
+            logger.info("  - has_deep_analysis: 是否有深度分析结果")
+            logger.info("  - deep_analysis_length: 深度分析结果长度")
+
+    except Exception as e:
+        logger.error(f"迁移过程中发生异常: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
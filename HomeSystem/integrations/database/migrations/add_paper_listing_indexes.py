@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+数据库迁移脚本：论文列表游标分页索引
+
+该脚本为arxiv_papers表创建与列表排序键一致的索引：
+- idx_arxiv_papers_created_at_id: (created_at DESC, id DESC) - 浏览页搜索
+- idx_arxiv_papers_unassigned_created: 同上，仅未分配任务的论文 - 未分配论文列表
+- idx_arxiv_papers_analysis_updated: (deep_analysis_updated_at DESC, id DESC)，仅已完成深度分析的论文 - 深度分析列表
+
+没有这些索引时，游标分页每一页仍需对满足条件的所有行做 top-N 排序。
+
+索引使用 CREATE INDEX CONCURRENTLY 创建，不阻塞论文写入；上次中断留下的无效索引会先删除再重建。
+"""
+
+import sys
+import os
+import psycopg2.extras
+from loguru import logger
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from HomeSystem.integrations.database.connection import get_database_manager
+
+
+LISTING_INDEXES = {
+    'idx_arxiv_papers_created_at_id':
+        "ON arxiv_papers(created_at DESC, id DESC)",
+    'idx_arxiv_papers_unassigned_created':
+        "ON arxiv_papers(created_at DESC, id DESC) WHERE task_name IS NULL OR task_name = ''",
+    'idx_arxiv_papers_analysis_updated':
+        "ON arxiv_papers(deep_analysis_updated_at DESC, id DESC) WHERE deep_analysis_status = 'completed'",
+}
+
+
+def drop_invalid_indexes(cursor) -> bool:
+    """删除上次 CONCURRENTLY 创建中断后留下的无效索引"""
+    try:
+        cursor.execute("""
+            SELECT c.relname AS indexname
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = ANY(%s) AND NOT i.indisvalid
+        """, (list(LISTING_INDEXES),))
+
+        for row in cursor.fetchall():
+            logger.warning(f"删除无效索引: {row['indexname']}")
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {row['indexname']}")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"删除无效索引失败: {e}")
+        return False
+
+
+def create_indexes(cursor) -> bool:
+    """并发创建列表排序键索引"""
+    try:
+        logger.info("开始创建列表索引（CONCURRENTLY，不阻塞写入）...")
+
+        for name, definition in LISTING_INDEXES.items():
+            logger.info(f"创建索引 {name}...")
+            cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+
+        cursor.execute("ANALYZE arxiv_papers")
+
+        logger.info("索引创建成功")
+        return True
+
+    except Exception as e:
+        logger.error(f"创建索引失败: {e}")
+        return False
+
+
+def validate_migration(cursor) -> bool:
+    """验证迁移结果"""
+    try:
+        logger.info("开始验证迁移结果...")
+
+        cursor.execute("""
+            SELECT c.relname AS indexname, i.indisvalid
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = ANY(%s)
+            ORDER BY c.relname
+        """, (list(LISTING_INDEXES),))
+
+        indexes = {row['indexname']: row['indisvalid'] for row in cursor.fetchall()}
+        logger.info(f"列表索引: {indexes}")
+
+        missing_indexes = [name for name in LISTING_INDEXES if name not in indexes]
+        invalid_indexes = [name for name, valid in indexes.items() if not valid]
+        if missing_indexes or invalid_indexes:
+            logger.error(f"缺少索引: {missing_indexes}，无效索引: {invalid_indexes}")
+            return False
+
+        logger.info("迁移验证完成")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移验证失败: {e}")
+        return False
+
+
+def rollback_migration(cursor) -> bool:
+    """回滚迁移（仅用于测试或紧急情况）"""
+    try:
+        logger.warning("开始回滚迁移...")
+
+        for name in LISTING_INDEXES:
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+        logger.warning("迁移回滚完成")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移回滚失败: {e}")
+        return False
+
+
+def main():
+    """主函数"""
+    logger.info("开始数据库迁移：论文列表游标分页索引")
+
+    # 检查命令行参数
+    rollback_mode = len(sys.argv) > 1 and sys.argv[1] == '--rollback'
+    if rollback_mode:
+        logger.warning("执行回滚操作")
+
+    try:
+        # 获取数据库管理器
+        db_manager = get_database_manager()
+
+        with db_manager.get_postgres_connection() as conn:
+            # CREATE/DROP INDEX CONCURRENTLY 不能在事务块中执行
+            conn.autocommit = True
+            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+
+            if rollback_mode:
+                if not rollback_migration(cursor):
+                    logger.error("回滚失败")
+                    sys.exit(1)
+                logger.info("回滚成功完成")
+                return
+
+            logger.info("开始正向迁移...")
+
+            # 1. 清理中断留下的无效索引
+            if not drop_invalid_indexes(cursor):
+                logger.error("清理无效索引失败，迁移终止")
+                sys.exit(1)
+
+            # 2. 创建索引
+            if not create_indexes(cursor):
+                logger.error("创建索引失败，迁移终止")
+                sys.exit(1)
+
+            # 3. 验证迁移结果
+            if not validate_migration(cursor):
+                logger.error("迁移验证失败")
+                sys.exit(1)
+
+            logger.info("数据库迁移成功完成！")
+            logger.info("新增索引:")
+            for name in LISTING_INDEXES:
+                logger.info(f"  - {name}")
+
+    except Exception as e:
+        logger.error(f"迁移过程中发生异常: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
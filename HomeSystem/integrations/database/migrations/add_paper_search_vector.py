@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+数据库迁移脚本：论文全文检索
+
+该脚本为arxiv_papers表添加：
+- search_vector: tsvector 生成列 - 按权重合并标题(A)、关键词(B)、研究目标(C)、摘要(D)，由数据库自动维护
+- idx_arxiv_papers_search_vector: search_vector 的GIN索引
+- pg_trgm 扩展及 title/authors/abstract/keywords/research_objectives 的三元组GIN索引（子串和中文匹配）
+
+同时删除从未被查询使用的 idx_arxiv_papers_title_fts / idx_arxiv_papers_abstract_fts 表达式索引。
+
+注意：添加生成列会重写整张表，大表上执行期间arxiv_papers会被锁定，请在低峰期执行。
+"""
+
+import sys
+import os
+from loguru import logger
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from HomeSystem.integrations.database.connection import get_database_manager
+from HomeSystem.integrations.database.paper_search import SEARCH_VECTOR_SQL, SUBSTRING_FIELDS
+
+
+def enable_trgm_extension(cursor) -> bool:
+    """启用pg_trgm扩展"""
+    try:
+        logger.info("启用pg_trgm扩展...")
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        logger.info("pg_trgm扩展已启用")
+        return True
+
+    except Exception as e:
+        logger.error(f"启用pg_trgm扩展失败（需要数据库所有者或超级用户权限）: {e}")
+        return False
+
+
+def add_search_vector_column(cursor) -> bool:
+    """添加search_vector生成列"""
+    try:
+        logger.info("开始添加search_vector生成列（会重写整张表）...")
+
+        cursor.execute(f"""
+            ALTER TABLE arxiv_papers
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED
+        """)
+
+        logger.info("search_vector生成列添加成功")
+        return True
+
+    except Exception as e:
+        logger.error(f"添加search_vector生成列失败: {e}")
+        return False
+
+
+def create_indexes(cursor) -> bool:
+    """创建全文检索和三元组索引，删除未使用的旧表达式索引"""
+    try:
+        logger.info("开始创建索引...")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_arxiv_papers_search_vector
+            ON arxiv_papers USING gin(search_vector)
+        """)
+
+        for field in SUBSTRING_FIELDS:
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_arxiv_papers_{field}_trgm
+                ON arxiv_papers USING gin({field} gin_trgm_ops)
+            """)
+
+        # 旧的表达式索引与查询条件不匹配，从未被使用，只增加写入开销
+        cursor.execute("DROP INDEX IF EXISTS idx_arxiv_papers_title_fts")
+        cursor.execute("DROP INDEX IF EXISTS idx_arxiv_papers_abstract_fts")
+
+        cursor.execute("ANALYZE arxiv_papers")
+
+        logger.info("索引创建成功")
+        return True
+
+    except Exception as e:
+        logger.error(f"创建索引失败: {e}")
+        return False
+
+
+def validate_migration(cursor) -> bool:
+    """验证迁移结果"""
+    try:
+        logger.info("开始验证迁移结果...")
+
+        # 检查生成列是否存在
+        cursor.execute("""
+            SELECT column_name, data_type, is_generated
+            FROM information_schema.columns
+            WHERE table_name = 'arxiv_papers' AND column_name = 'search_vector'
+        """)
+
+        column = cursor.fetchone()
+        if not column:
+            logger.error("search_vector字段不存在")
+            return False
+        logger.info(f"字段 search_vector: 类型={column['data_type']}, 生成列={column['is_generated']}")
+
+        # 统计可检索的记录数
+        cursor.execute("""
+            SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE search_vector != ''::tsvector) AS indexed
+            FROM arxiv_papers
+        """)
+
+        counts = cursor.fetchone()
+        logger.info(f"可全文检索的记录数: {counts['indexed']}/{counts['total']}")
+
+        # 检查索引
+        cursor.execute("""
+            SELECT indexname FROM pg_indexes
+            WHERE tablename = 'arxiv_papers'
+            AND (indexname LIKE '%search_vector%' OR indexname LIKE '%_trgm')
+            ORDER BY indexname
+        """)
+
+        indexes = [row['indexname'] for row in cursor.fetchall()]
+        logger.info(f"检索索引: {indexes}")
+
+        expected_indexes = ['idx_arxiv_papers_search_vector'] + [
+            f'idx_arxiv_papers_{field}_trgm' for field in SUBSTRING_FIELDS
+        ]
+
+        missing_indexes = [idx for idx in expected_indexes if idx not in indexes]
+        if missing_indexes:
+            logger.warning(f"缺少索引: {missing_indexes}")
+        else:
+            logger.info("所有索引检查通过")
+
+        logger.info("迁移验证完成")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移验证失败: {e}")
+        return False
+
+
+def rollback_migration(cursor) -> bool:
+    """回滚迁移（仅用于测试或紧急情况），保留pg_trgm扩展"""
+    try:
+        logger.warning("开始回滚迁移...")
+
+        # 删除索引
+        cursor.execute("DROP INDEX IF EXISTS idx_arxiv_papers_search_vector")
+        for field in SUBSTRING_FIELDS:
+            cursor.execute(f"DROP INDEX IF EXISTS idx_arxiv_papers_{field}_trgm")
+
+        # 删除字段
+        cursor.execute("ALTER TABLE arxiv_papers DROP COLUMN IF EXISTS search_vector")
+
+        # 恢复旧的表达式索引
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_arxiv_papers_title_fts
+            ON arxiv_papers USING gin(to_tsvector('english', title))
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_arxiv_papers_abstract_fts
+            ON arxiv_papers USING gin(to_tsvector('english', abstract))
+        """)
+
+        logger.warning("迁移回滚完成")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移回滚失败: {e}")
+        return False
+
+
+def main():
+    """主函数"""
+    logger.info("开始数据库迁移：论文全文检索")
+
+    # 检查命令行参数
+    rollback_mode = len(sys.argv) > 1 and sys.argv[1] == '--rollback'
+    if rollback_mode:
+        logger.warning("执行回滚操作")
+
+    try:
+        # 获取数据库管理器
+        db_manager = get_database_manager()
+
+        with db_manager.get_postgres_sync() as cursor:
+            if rollback_mode:
+                if not rollback_migration(cursor):
+                    logger.error("回滚失败")
+                    sys.exit(1)
+                logger.info("回滚成功完成")
+                return
+
+            logger.info("开始正向迁移...")
+
+            # 1. 启用pg_trgm扩展
+            if not enable_trgm_extension(cursor):
+                logger.error("启用扩展失败，迁移终止")
+                sys.exit(1)
+
+            # 2. 添加生成列
+            if not add_search_vector_column(cursor):
+                logger.error("添加字段失败，迁移终止")
+                sys.exit(1)
+
+            # 3. 创建索引
+            if not create_indexes(cursor):
+                logger.error("创建索引失败，迁移终止")
+                sys.exit(1)
+
+            # 4. 验证迁移结果
+            if not validate_migration(cursor):
+                logger.error("迁移验证失败")
+                sys.exit(1)
+
+            logger.info("数据库迁移成功完成！")
+            logger.info("新增字段:")
+            logger.info("  - search_vector: 加权全文检索向量（标题A、关键词B、研究目标C、摘要D）")
+
+    except Exception as e:
+        logger.error(f"迁移过程中发生异常: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
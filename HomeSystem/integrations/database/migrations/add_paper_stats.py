@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+数据库迁移脚本：论文增量统计表
+
+该脚本创建：
+- arxiv_paper_stats: 按 (dimension, bucket) 保存论文计数的统计表
+- arxiv_paper_stats_rows / arxiv_paper_stats_apply / arxiv_paper_stats_trigger / arxiv_paper_stats_truncate: 统计函数
+- arxiv_papers_stats_row / arxiv_papers_stats_truncate: arxiv_papers 上维护统计表的触发器
+- idx_arxiv_papers_task_name_created: 任务统计查询首篇/最新论文时间使用的索引
+
+并从现有数据重建统计。统计表只由本脚本创建和重建（--rebuild），Web服务读取统计时
+只检查版本；未执行或统计版本升级后未重新执行时，统计接口回退为直接聚合论文表。
+
+注意：重建期间arxiv_papers的写入会被阻塞，直到事务提交。
+"""
+
+import sys
+import os
+from loguru import logger
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from HomeSystem.integrations.database.connection import get_database_manager
+from HomeSystem.integrations.database.paper_stats import install_paper_stats, rebuild_paper_stats, get_stat
+
+
+def create_stats_objects(cursor) -> bool:
+    """创建统计表、函数、触发器和索引"""
+    try:
+        logger.info("开始创建统计表和触发器...")
+
+        install_paper_stats(cursor)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_name_created
+            ON arxiv_papers(task_name, created_at)
+        """)
+
+        logger.info("统计表和触发器创建成功")
+        return True
+
+    except Exception as e:
+        logger.error(f"创建统计表和触发器失败: {e}")
+        return False
+
+
+def rebuild_stats(cursor) -> bool:
+    """从现有论文数据重建统计"""
+    try:
+        logger.info("开始重建统计（期间论文表写入被阻塞）...")
+        rebuild_paper_stats(cursor)
+        return True
+
+    except Exception as e:
+        logger.error(f"重建统计失败: {e}")
+        return False
+
+
+def validate_migration(cursor) -> bool:
+    """验证统计表与论文表计数一致"""
+    try:
+        logger.info("开始验证迁移结果...")
+
+        cursor.execute("SELECT tgname FROM pg_trigger WHERE tgname LIKE 'arxiv_papers_stats_%' ORDER BY tgname")
+        triggers = [row['tgname'] for row in cursor.fetchall()]
+        logger.info(f"统计触发器: {triggers}")
+        if 'arxiv_papers_stats_row' not in triggers:
+            logger.error("缺少触发器 arxiv_papers_stats_row")
+            return False
+
+        cursor.execute("""
+            SELECT COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE processing_status = 'completed') AS completed,
+                   COUNT(*) FILTER (WHERE dify_document_id IS NOT NULL) AS uploaded
+            FROM arxiv_papers
+        """)
+        actual = cursor.fetchone()
+        stats = get_stat(cursor, 'total')
+
+        logger.info(f"论文总数: 论文表={actual['total']}, 统计表={stats['paper_count']}")
+        mismatched = (
+            actual['total'] != stats['paper_count']
+            or actual['completed'] != stats['completed_count']
+            or actual['uploaded'] != stats['dify_uploaded_count']
+        )
+        if mismatched:
+            logger.error("统计表与论文表计数不一致，请使用 --rebuild 重建")
+            return False
+
+        logger.info("迁移验证完成")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移验证失败: {e}")
+        return False
+
+
+def rollback_migration(cursor) -> bool:
+    """回滚迁移（仅用于测试或紧急情况）"""
+    try:
+        logger.warning("开始回滚迁移...")
+
+        cursor.execute("DROP TRIGGER IF EXISTS arxiv_papers_stats_row ON arxiv_papers")
+        cursor.execute("DROP TRIGGER IF EXISTS arxiv_papers_stats_truncate ON arxiv_papers")
+        cursor.execute("DROP FUNCTION IF EXISTS arxiv_paper_stats_trigger()")
+        cursor.execute("DROP FUNCTION IF EXISTS arxiv_paper_stats_truncate()")
+        cursor.execute("DROP FUNCTION IF EXISTS arxiv_paper_stats_apply(arxiv_papers, INTEGER)")
+        cursor.execute("DROP FUNCTION IF EXISTS arxiv_paper_stats_rows(arxiv_papers)")
+        cursor.execute("DROP TABLE IF EXISTS arxiv_paper_stats")
+        cursor.execute("DROP INDEX IF EXISTS idx_arxiv_papers_task_name_created")
+
+        logger.warning("迁移回滚完成（统计接口将回退为直接聚合论文表）")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移回滚失败: {e}")
+        return False
+
+
+def main():
+    """主函数"""
+    logger.info("开始数据库迁移：论文增量统计表")
+
+    # 检查命令行参数
+    mode = sys.argv[1] if len(sys.argv) > 1 else None
+    if mode == '--rollback':
+        logger.warning("执行回滚操作")
+
+    try:
+        # 获取数据库管理器
+        db_manager = get_database_manager()
+
+        with db_manager.get_postgres_sync() as cursor:
+            if mode == '--rollback':
+                if not rollback_migration(cursor):
+                    logger.error("回滚失败")
+                    sys.exit(1)
+                logger.info("回滚成功完成")
+                return
+
+            if mode == '--rebuild':
+                if not rebuild_stats(cursor) or not validate_migration(cursor):
+                    logger.error("重建失败")
+                    sys.exit(1)
+                logger.info("统计重建成功完成")
+                return
+
+            logger.info("开始正向迁移...")
+
+            # 1. 创建统计表、函数和触发器
+            if not create_stats_objects(cursor):
+                logger.error("创建统计表失败，迁移终止")
+                sys.exit(1)
+
+            # 2. 从现有数据重建统计
+            if not rebuild_stats(cursor):
+                logger.error("重建统计失败，迁移终止")
+                sys.exit(1)
+
+            # 3. 验证迁移结果
+            if not validate_migration(cursor):
+                logger.error("迁移验证失败")
+                sys.exit(1)
+
+            logger.info("数据库迁移成功完成！")
+            logger.info("新增表:")
+            logger.info("  - arxiv_paper_stats: 按状态、任务、分类、日期、深度分析和Dify状态维护的论文计数")
+
+    except Exception as e:
+        logger.error(f"迁移过程中发生异常: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+数据库迁移脚本：关键词/分类数组
+
+该脚本为arxiv_papers表添加：
+- arxiv_parse_terms(text): 把关键词/分类字符串解析为去重后的 TEXT[]（IMMUTABLE）
+- keyword_list: TEXT[] 生成列 - 由 keywords 解析，数据库自动维护
+- category_list: TEXT[] 生成列 - 由 categories 解析，数据库自动维护
+- idx_arxiv_papers_keyword_list / idx_arxiv_papers_category_list: GIN索引
+
+添加生成列时数据库会为所有现有论文计算数组，即完成回填；之后更新增量统计表
+（新增 keyword 维度），研究洞察的关键词频率直接读取统计表。
+
+注意：添加生成列会重写整张表，大表上执行期间arxiv_papers会被锁定，请在低峰期执行。
+"""
+
+import sys
+import os
+from loguru import logger
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+from HomeSystem.integrations.database.connection import get_database_manager
+from HomeSystem.integrations.database.paper_terms import (
+    PARSE_TERMS_FUNCTION_SQL, KEYWORD_LIST_SQL, CATEGORY_LIST_SQL
+)
+from HomeSystem.integrations.database.paper_stats import (
+    install_paper_stats, rebuild_paper_stats, list_stats
+)
+
+
+def add_term_list_columns(cursor) -> bool:
+    """创建解析函数并添加keyword_list/category_list生成列"""
+    try:
+        logger.info("开始添加keyword_list/category_list生成列（会重写整张表）...")
+
+        cursor.execute(PARSE_TERMS_FUNCTION_SQL)
+        cursor.execute(f"""
+            ALTER TABLE arxiv_papers
+            ADD COLUMN IF NOT EXISTS keyword_list TEXT[] GENERATED ALWAYS AS ({KEYWORD_LIST_SQL}) STORED
+        """)
+        cursor.execute(f"""
+            ALTER TABLE arxiv_papers
+            ADD COLUMN IF NOT EXISTS category_list TEXT[] GENERATED ALWAYS AS ({CATEGORY_LIST_SQL}) STORED
+        """)
+
+        logger.info("生成列添加成功")
+        return True
+
+    except Exception as e:
+        logger.error(f"添加生成列失败: {e}")
+        return False
+
+
+def create_indexes(cursor) -> bool:
+    """创建数组GIN索引"""
+    try:
+        logger.info("开始创建索引...")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_arxiv_papers_keyword_list
+            ON arxiv_papers USING gin(keyword_list)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_arxiv_papers_category_list
+            ON arxiv_papers USING gin(category_list)
+        """)
+        cursor.execute("ANALYZE arxiv_papers")
+
+        logger.info("索引创建成功")
+        return True
+
+    except Exception as e:
+        logger.error(f"创建索引失败: {e}")
+        return False
+
+
+def refresh_paper_stats(cursor) -> bool:
+    """升级增量统计表（新增keyword维度）并重建"""
+    try:
+        logger.info("开始更新增量统计表（期间论文表写入被阻塞）...")
+        install_paper_stats(cursor)
+        rebuild_paper_stats(cursor)
+        return True
+
+    except Exception as e:
+        logger.error(f"更新增量统计表失败: {e}")
+        return False
+
+
+def validate_migration(cursor) -> bool:
+    """验证迁移结果"""
+    try:
+        logger.info("开始验证迁移结果...")
+
+        cursor.execute("""
+            SELECT
+                COUNT(*) FILTER (WHERE keywords IS NOT NULL AND keywords != '') AS with_keywords,
+                COUNT(*) FILTER (WHERE cardinality(keyword_list) > 0) AS parsed_keywords,
+                COUNT(*) FILTER (WHERE categories IS NOT NULL AND categories != '') AS with_categories,
+                COUNT(*) FILTER (WHERE cardinality(category_list) > 0) AS parsed_categories
+            FROM arxiv_papers
+        """)
+        counts = cursor.fetchone()
+        logger.info(f"关键词: {counts['parsed_keywords']}/{counts['with_keywords']} 篇论文解析出关键词")
+        logger.info(f"分类: {counts['parsed_categories']}/{counts['with_categories']} 篇论文解析出分类")
+
+        top_keywords = [f"{row['bucket']}({row['paper_count']})" for row in list_stats(cursor, 'keyword', limit=10)]
+        logger.info(f"高频关键词: {', '.join(top_keywords) or '无'}")
+
+        logger.info("迁移验证完成")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移验证失败: {e}")
+        return False
+
+
+def rollback_migration(cursor) -> bool:
+    """回滚迁移（仅用于测试或紧急情况）"""
+    try:
+        logger.warning("开始回滚迁移...")
+
+        # 统计函数引用了keyword_list，先删除统计触发器和统计表
+        cursor.execute("DROP TRIGGER IF EXISTS arxiv_papers_stats_row ON arxiv_papers")
+        cursor.execute("DROP TRIGGER IF EXISTS arxiv_papers_stats_truncate ON arxiv_papers")
+        cursor.execute("DROP TABLE IF EXISTS arxiv_paper_stats")
+
+        cursor.execute("DROP INDEX IF EXISTS idx_arxiv_papers_keyword_list")
+        cursor.execute("DROP INDEX IF EXISTS idx_arxiv_papers_category_list")
+        cursor.execute("ALTER TABLE arxiv_papers DROP COLUMN IF EXISTS keyword_list")
+        cursor.execute("ALTER TABLE arxiv_papers DROP COLUMN IF EXISTS category_list")
+        cursor.execute("DROP FUNCTION IF EXISTS arxiv_parse_terms(TEXT)")
+
+        logger.warning("迁移回滚完成（增量统计表已删除，请同时回退代码）")
+        return True
+
+    except Exception as e:
+        logger.error(f"迁移回滚失败: {e}")
+        return False
+
+
+def main():
+    """主函数"""
+    logger.info("开始数据库迁移：关键词/分类数组")
+
+    # 检查命令行参数
+    rollback_mode = len(sys.argv) > 1 and sys.argv[1] == '--rollback'
+    if rollback_mode:
+        logger.warning("执行回滚操作")
+
+    try:
+        # 获取数据库管理器
+        db_manager = get_database_manager()
+
+        with db_manager.get_postgres_sync() as cursor:
+            if rollback_mode:
+                if not rollback_migration(cursor):
+                    logger.error("回滚失败")
+                    sys.exit(1)
+                logger.info("回滚成功完成")
+                return
+
+            logger.info("开始正向迁移...")
+
+            # 1. 添加生成列（同时回填现有数据）
+            if not add_term_list_columns(cursor):
+                logger.error("添加字段失败，迁移终止")
+                sys.exit(1)
+
+            # 2. 创建索引
+            if not create_indexes(cursor):
+                logger.error("创建索引失败，迁移终止")
+                sys.exit(1)
+
+            # 3. 更新增量统计表
+            if not refresh_paper_stats(cursor):
+                logger.error("更新统计表失败，迁移终止")
+                sys.exit(1)
+
+            # 4. 验证迁移结果
+            if not validate_migration(cursor):
+                logger.error("迁移验证失败")
+                sys.exit(1)
+
+            logger.info("数据库迁移成功完成！")
+            logger.info("新增字段:")
+            logger.info("  - keyword_list: 关键词数组（GIN索引）")
+            logger.info("  - category_list: 分类数组（GIN索引）")
+
+    except Exception as e:
+        logger.error(f"迁移过程中发生异常: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
+from .paper_terms import PARSE_TERMS_FUNCTION_SQL
+
 
 class BaseModel(ABC):
     """数据模型基类，定义通用接口"""
@@ -44,6 +46,26 @@ class BaseModel(ABC):
 class ArxivPaperModel(BaseModel):
     """ArXiv论文数据模型"""
     
+    # 列表查询的窄投影：不含摘要、结构化长文本和深度分析结果，
+    # has_deep_analysis / deep_analysis_length 为数据库生成列，无需读取深度分析全文
+    LIST_COLUMNS = (
+        'id', 'arxiv_id', 'title', 'authors', 'categories', 'processing_status',
+        'created_at', 'published_date', 'research_objectives', 'keywords', 'task_name', 'task_id',
+        'full_paper_relevance_score', 'full_paper_relevance_justification',
+        'dify_document_id', 'deep_analysis_status', 'has_deep_analysis', 'deep_analysis_length'
+    )
+    
+    # 需要展示摘要和结构化摘要的列表使用，仍不含深度分析结果
+    SUMMARY_COLUMNS = LIST_COLUMNS + (
+        'abstract', 'pdf_url', 'updated_at', 'tags', 'metadata',
+        'research_background', 'methods', 'key_findings', 'conclusions', 'limitations', 'future_work'
+    )
+    
+    @classmethod
+    def select_columns(cls, columns: tuple = None) -> str:
+        """生成SELECT列清单，默认使用LIST_COLUMNS"""
+        return ', '.join(columns or cls.LIST_COLUMNS)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.arxiv_id = kwargs.get('arxiv_id', '')
@@ -180,6 +202,9 @@ class ArxivPaperModel(BaseModel):
     
     def get_create_table_sql(self) -> str:
         return """
+        -- 子串/中文搜索兜底使用 pg_trgm 三元组索引
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        
         CREATE TABLE IF NOT EXISTS arxiv_papers (
             id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
             arxiv_id VARCHAR(50) UNIQUE NOT NULL,
@@ -225,6 +250,31 @@ class ArxivPaperModel(BaseModel):
         ALTER TABLE arxiv_papers ADD COLUMN IF NOT EXISTS deep_analysis_created_at TIMESTAMP DEFAULT NULL;
         ALTER TABLE arxiv_papers ADD COLUMN IF NOT EXISTS deep_analysis_updated_at TIMESTAMP DEFAULT NULL;
         
+        -- 深度分析摘要列（数据库自动维护，列表查询无需读取深度分析全文）
+        ALTER TABLE arxiv_papers ADD COLUMN IF NOT EXISTS has_deep_analysis BOOLEAN GENERATED ALWAYS AS (
+            deep_analysis_result IS NOT NULL AND deep_analysis_result <> ''
+        ) STORED;
+        ALTER TABLE arxiv_papers ADD COLUMN IF NOT EXISTS deep_analysis_length INTEGER GENERATED ALWAYS AS (
+            length(deep_analysis_result)
+        ) STORED;
+        
+        -- 关键词/分类数组（数据库自动维护，解析规则见 paper_terms.arxiv_parse_terms）
+        """ + PARSE_TERMS_FUNCTION_SQL + """
+        ALTER TABLE arxiv_papers ADD COLUMN IF NOT EXISTS keyword_list TEXT[] GENERATED ALWAYS AS (
+            arxiv_parse_terms(keywords)
+        ) STORED;
+        ALTER TABLE arxiv_papers ADD COLUMN IF NOT EXISTS category_list TEXT[] GENERATED ALWAYS AS (
+            arxiv_parse_terms(categories)
+        ) STORED;
+        
+        -- 全文检索向量（数据库自动维护，表达式与 paper_search.SEARCH_VECTOR_SQL 一致）
+        ALTER TABLE arxiv_papers ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(keywords, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(research_objectives, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(abstract, '')), 'D')
+        ) STORED;
+        
         -- 创建索引
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_arxiv_id ON arxiv_papers(arxiv_id);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_status ON arxiv_papers(processing_status);
@@ -232,6 +282,10 @@ class ArxivPaperModel(BaseModel):
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_created_at ON arxiv_papers(created_at);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_published_date ON arxiv_papers(published_date);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_status_created ON arxiv_papers(processing_status, created_at);
+        -- 列表游标分页的排序键索引
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_created_at_id ON arxiv_papers(created_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_unassigned_created ON arxiv_papers(created_at DESC, id DESC) WHERE task_name IS NULL OR task_name = '';
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_analysis_updated ON arxiv_papers(deep_analysis_updated_at DESC, id DESC) WHERE deep_analysis_status = 'completed';
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_keywords ON arxiv_papers(keywords);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_research_objectives ON arxiv_papers(research_objectives);
         
@@ -239,6 +293,7 @@ class ArxivPaperModel(BaseModel):
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_name ON arxiv_papers(task_name);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_id ON arxiv_papers(task_id);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_name_id ON arxiv_papers(task_name, task_id);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_name_created ON arxiv_papers(task_name, created_at);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_full_paper_relevance_score ON arxiv_papers(full_paper_relevance_score);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_full_paper_relevance_score_desc ON arxiv_papers(full_paper_relevance_score DESC);
         
@@ -253,6 +308,14 @@ class ArxivPaperModel(BaseModel):
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_deep_analysis_status ON arxiv_papers(deep_analysis_status);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_deep_analysis_created_at ON arxiv_papers(deep_analysis_created_at);
         CREATE INDEX IF NOT EXISTS idx_arxiv_papers_deep_analysis_updated_at ON arxiv_papers(deep_analysis_updated_at);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_search_vector ON arxiv_papers USING gin(search_vector);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_title_trgm ON arxiv_papers USING gin(title gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_authors_trgm ON arxiv_papers USING gin(authors gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_abstract_trgm ON arxiv_papers USING gin(abstract gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_keywords_trgm ON arxiv_papers USING gin(keywords gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_research_objectives_trgm ON arxiv_papers USING gin(research_objectives gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_keyword_list ON arxiv_papers USING gin(keyword_list);
+        CREATE INDEX IF NOT EXISTS idx_arxiv_papers_category_list ON arxiv_papers USING gin(category_list);
         
         -- 创建更新时间戳触发器
         CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -1,7 +1,7 @@
 # 数据库操作接口
 import json
 import time
-from typing import List, Optional, Dict, Any, Type, Union
+from typing import List, Optional, Dict, Any, Type, Union, Set, Iterable
 from loguru import logger
 
 from .connection import DatabaseManager, get_database_manager
@@ -98,13 +98,14 @@ class DatabaseOperations:
             return None
     
     def list_all(self, model_class: Type[BaseModel], limit: int = 100, offset: int = 0, 
-                 order_by: str = 'created_at DESC') -> List[BaseModel]:
-        """列出所有记录"""
+                 order_by: str = 'created_at DESC', columns: Optional[Iterable[str]] = None) -> List[BaseModel]:
+        """列出所有记录，columns 指定只读取的列（未读取的字段保持模型默认值）"""
         try:
             model_instance = model_class()
             table_name = model_instance.table_name
             
-            sql = f"SELECT * FROM {table_name} ORDER BY {order_by} LIMIT %s OFFSET %s"
+            select_clause = ', '.join(columns) if columns else '*'
+            sql = f"SELECT {select_clause} FROM {table_name} ORDER BY {order_by} LIMIT %s OFFSET %s"
             
             with self.db_manager.get_postgres_sync() as cursor:
                 cursor.execute(sql, (limit, offset))
@@ -190,20 +191,78 @@ class DatabaseOperations:
             logger.error(f"检查记录存在性失败: {e}")
             return False
     
+    def existing_ids(self, model_class: Type[BaseModel], field_name: str, values: Iterable[Any]) -> Set[Any]:
+        """批量检查记录是否存在，一次查询返回已存在的字段值集合"""
+        try:
+            unique_values = [value for value in dict.fromkeys(values) if value is not None]
+            if not unique_values:
+                return set()
+            
+            model_instance = model_class()
+            table_name = model_instance.table_name
+            
+            sql = f"SELECT {field_name} FROM {table_name} WHERE {field_name} = ANY(%s)"
+            
+            with self.db_manager.get_postgres_sync() as cursor:
+                cursor.execute(sql, (unique_values,))
+                return {row[field_name] for row in cursor.fetchall()}
+                
+        except Exception as e:
+            logger.error(f"批量检查记录存在性失败: {e}")
+            return set()
+    
+    def get_by_field_values(self, model_class: Type[BaseModel], field_name: str, values: Iterable[Any],
+                            columns: Optional[List[str]] = None) -> Dict[Any, Dict[str, Any]]:
+        """
+        根据字段值列表批量获取记录的指定列
+        
+        Args:
+            model_class: 模型类
+            field_name: 匹配字段
+            values: 字段值列表
+            columns: 需要返回的列，默认全部列；匹配字段总是包含在内
+            
+        Returns:
+            Dict: 字段值 -> 行数据字典
+        """
+        try:
+            unique_values = [value for value in dict.fromkeys(values) if value is not None]
+            if not unique_values:
+                return {}
+            
+            model_instance = model_class()
+            table_name = model_instance.table_name
+            
+            if columns:
+                selected = [field_name] + [column for column in columns if column != field_name]
+                select_clause = ', '.join(selected)
+            else:
+                select_clause = '*'
+            
+            sql = f"SELECT {select_clause} FROM {table_name} WHERE {field_name} = ANY(%s)"
+            
+            with self.db_manager.get_postgres_sync() as cursor:
+                cursor.execute(sql, (unique_values,))
+                return {row[field_name]: dict(row) for row in cursor.fetchall()}
+                
+        except Exception as e:
+            logger.error(f"批量获取记录失败: {e}")
+            return {}
+    
     def count(self, model_class: Type[BaseModel], where_clause: str = None, params: tuple = None) -> int:
         """统计记录数量"""
         try:
             model_instance = model_class()
             table_name = model_instance.table_name
             
-            sql = f"SELECT COUNT(*) FROM {table_name}"
+            sql = f"SELECT COUNT(*) AS total FROM {table_name}"
             if where_clause:
                 sql += f" WHERE {where_clause}"
             
             with self.db_manager.get_postgres_sync() as cursor:
                 cursor.execute(sql, params or ())
                 result = cursor.fetchone()
-                return result[0] if result else 0
+                return result['total'] if result else 0
                 
         except Exception as e:
             logger.error(f"统计记录数量失败: {e}")
@@ -278,6 +337,17 @@ class CacheOperations:
             logger.error(f"Redis GET 操作失败: {e}")
             return None
     
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """批量获取值，顺序与keys一致"""
+        if not keys:
+            return []
+        try:
+            redis_client = self._get_redis()
+            return redis_client.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis MGET 操作失败: {e}")
+            return [None] * len(keys)
+    
     def delete(self, key: str) -> bool:
         """删除键"""
         try:
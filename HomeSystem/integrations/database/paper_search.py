@@ -0,0 +1,102 @@
+# 论文全文检索
+"""
+arxiv_papers 全文检索
+
+search_vector 是数据库维护的生成列，按权重合并 title(A)、keywords(B)、research_objectives(C)、
+abstract(D) 的 tsvector，并建有GIN索引。检索时用 websearch_to_tsquery 解析查询（支持引号短语、
+or、-排除），按 ts_rank 排序；英文分词器切不开的中文和词内片段，通过 pg_trgm 索引支持的
+ILIKE 子串匹配兜底。摘要高亮片段只为当前页的论文生成，避免对全部命中行执行 ts_headline。
+
+使用示例:
+    from HomeSystem.integrations.database.paper_search import PaperSearch
+
+    search = PaperSearch("diffusion policy")
+    cursor.execute(f"SELECT arxiv_id, {search.rank_sql} AS search_rank FROM arxiv_papers "
+                   f"WHERE {search.where_sql} ORDER BY search_rank DESC LIMIT 20",
+                   search.rank_params + search.where_params)
+    snippets = search.fetch_snippets(cursor, [row['arxiv_id'] for row in cursor.fetchall()])
+"""
+import html
+from typing import Any, Dict, Iterable, List
+
+# 文本检索配置，需与 search_vector 生成表达式一致
+SEARCH_CONFIG = 'english'
+
+# search_vector 生成列表达式（建表、迁移脚本共用）
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(keywords, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(research_objectives, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(abstract, '')), 'D')"
+)
+
+# 子串兜底匹配的字段，每个字段都有 gin_trgm_ops 索引
+SUBSTRING_FIELDS = ('title', 'authors', 'abstract', 'keywords', 'research_objectives')
+
+# ts_headline 高亮标记，先输出占位符，HTML转义后再替换为<mark>
+_SNIPPET_START = '[[['
+_SNIPPET_STOP = ']]]'
+SNIPPET_OPTIONS = (
+    f"StartSel=\"{_SNIPPET_START}\", StopSel=\"{_SNIPPET_STOP}\", "
+    "MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=\" … \""
+)
+
+
+class PaperSearch:
+    """一次论文检索的SQL片段和参数"""
+
+    def __init__(self, query: str):
+        self.query = query.strip()
+        self.pattern = f"%{self._escape_like(self.query)}%"
+
+    @property
+    def where_sql(self) -> str:
+        """WHERE条件：全文匹配或任一字段子串匹配"""
+        substring_sql = " OR ".join(f"{field} ILIKE %s" for field in SUBSTRING_FIELDS)
+        return f"(search_vector @@ websearch_to_tsquery('{SEARCH_CONFIG}', %s) OR {substring_sql})"
+
+    @property
+    def where_params(self) -> List[Any]:
+        return [self.query] + [self.pattern] * len(SUBSTRING_FIELDS)
+
+    @property
+    def rank_sql(self) -> str:
+        """相关度表达式，只有子串命中的论文排在全文命中之后"""
+        return f"ts_rank(search_vector, websearch_to_tsquery('{SEARCH_CONFIG}', %s))"
+
+    @property
+    def rank_params(self) -> List[Any]:
+        return [self.query]
+
+    def fetch_snippets(self, cursor, arxiv_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        为指定论文生成摘要高亮片段
+
+        Args:
+            cursor: RealDictCursor
+            arxiv_ids: 当前页的论文ID
+
+        Returns:
+            Dict[str, str]: arxiv_id -> 片段HTML（已转义，命中词用<mark>包裹），摘要为空的论文不返回
+        """
+        arxiv_ids = list(arxiv_ids)
+        if not arxiv_ids:
+            return {}
+        cursor.execute(f"""
+            SELECT arxiv_id,
+                   ts_headline('{SEARCH_CONFIG}', abstract, websearch_to_tsquery('{SEARCH_CONFIG}', %s), %s) AS snippet
+            FROM arxiv_papers
+            WHERE arxiv_id = ANY(%s) AND abstract IS NOT NULL AND abstract != ''
+        """, (self.query, SNIPPET_OPTIONS, arxiv_ids))
+        return {row['arxiv_id']: self.render_snippet(row['snippet']) for row in cursor.fetchall()}
+
+    @staticmethod
+    def render_snippet(raw: str) -> str:
+        """转义片段文本并把高亮占位符替换为<mark>标签"""
+        escaped = html.escape(raw or '')
+        return escaped.replace(html.escape(_SNIPPET_START), '<mark>').replace(html.escape(_SNIPPET_STOP), '</mark>')
+
+    @staticmethod
+    def _escape_like(text: str) -> str:
+        """转义LIKE通配符，用户输入的 % 和 _ 按字面匹配"""
+        return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
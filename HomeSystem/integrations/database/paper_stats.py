@@ -0,0 +1,306 @@
+# 论文统计表
+"""
+arxiv_papers 增量统计
+
+arxiv_paper_stats 按 (dimension, bucket) 保存论文计数，例如 ('status', 'completed')、('task', 任务名)、
+('created_day', '2025-01-31')。arxiv_papers 上的行级触发器在插入、删除和相关字段更新时
+增减对应行，统计接口直接读取这些计数，不再扫描论文表。
+
+每篇论文对各维度的贡献由 SQL 函数 arxiv_paper_stats_rows 计算，触发器和全量重建共用，
+保证增量结果与重建结果一致。所有写入都会更新 ('total', '') 这一行，并发写入在该行上排队。
+
+统计表、触发器的创建和全量重建只由 migrations/add_paper_stats.py 执行；读取路径只检查版本，
+不会在请求中执行DDL或锁表重建。
+
+维度:
+    total                      全部论文（bucket 为空字符串）
+    status                     processing_status
+    task / task_id             非空的 task_name / task_id
+    category                   非空的 categories
+    created_day                created_at 日期（YYYY-MM-DD）
+    unassigned_status / unassigned_category / unassigned_day
+                               同上，仅统计未分配任务（task_name 为空）的论文
+    deep_status                非空的 deep_analysis_status
+    dify_dataset               非空的 dify_dataset_id
+    dify_day                   dify_upload_time 日期
+    flag                       has_task_name、has_deep_analysis_result
+    field                      非空的结构化字段名（research_background 等）
+    keyword                    keyword_list 中的每个关键词（见 paper_terms.py）
+
+使用示例:
+    from HomeSystem.integrations.database.paper_stats import paper_stats_ready, get_stat
+
+    with db_manager.get_postgres_sync() as cursor:
+        if paper_stats_ready(cursor):
+            total = get_stat(cursor, 'total')['paper_count']
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+# 每个维度行上维护的计数列
+MEASURES = (
+    'paper_count', 'completed_count', 'pending_count', 'failed_count',
+    'structured_count', 'dify_uploaded_count', 'dify_characters'
+)
+
+# 统计口径版本，函数定义变化时递增；版本不一致时 paper_stats_ready 返回False，需重新执行迁移
+PAPER_STATS_VERSION = 2
+
+# 结构化字段完整性统计的字段
+STRUCTURED_FIELDS = (
+    'research_background', 'research_objectives', 'methods', 'key_findings', 'conclusions', 'keywords'
+)
+
+PAPER_STATS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS arxiv_paper_stats (
+    dimension VARCHAR(32) NOT NULL,
+    bucket TEXT NOT NULL DEFAULT '',
+    paper_count BIGINT NOT NULL DEFAULT 0,
+    completed_count BIGINT NOT NULL DEFAULT 0,
+    pending_count BIGINT NOT NULL DEFAULT 0,
+    failed_count BIGINT NOT NULL DEFAULT 0,
+    structured_count BIGINT NOT NULL DEFAULT 0,
+    dify_uploaded_count BIGINT NOT NULL DEFAULT 0,
+    dify_characters BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, bucket)
+);
+CREATE INDEX IF NOT EXISTS idx_arxiv_paper_stats_count
+    ON arxiv_paper_stats(dimension, paper_count DESC, bucket);
+"""
+
+_FIELD_BUCKETS_SQL = ",\n            ".join(
+    f"('field', CASE WHEN p.{field} IS NOT NULL THEN '{field}' END)" for field in STRUCTURED_FIELDS
+)
+
+PAPER_STATS_FUNCTIONS_SQL = f"""
+-- 一篇论文对各统计行的贡献（bucket 为NULL的维度不计入）
+CREATE OR REPLACE FUNCTION arxiv_paper_stats_rows(p arxiv_papers)
+RETURNS TABLE (
+    dimension VARCHAR(32), bucket TEXT,
+    paper_count BIGINT, completed_count BIGINT, pending_count BIGINT, failed_count BIGINT,
+    structured_count BIGINT, dify_uploaded_count BIGINT, dify_characters BIGINT
+) AS $$
+    SELECT d.dimension::VARCHAR(32), d.bucket,
+           1::BIGINT,
+           (p.processing_status = 'completed')::INT::BIGINT,
+           (p.processing_status = 'pending')::INT::BIGINT,
+           (p.processing_status = 'failed')::INT::BIGINT,
+           (p.research_objectives IS NOT NULL)::INT::BIGINT,
+           (p.dify_document_id IS NOT NULL)::INT::BIGINT,
+           COALESCE(p.dify_character_count, 0)::BIGINT
+    FROM (VALUES
+            ('total', ''),
+            ('status', COALESCE(p.processing_status, '')),
+            ('task', NULLIF(p.task_name, '')),
+            ('task_id', p.task_id),
+            ('category', NULLIF(p.categories, '')),
+            ('created_day', to_char(p.created_at, 'YYYY-MM-DD')),
+            ('unassigned_status', CASE WHEN COALESCE(p.task_name, '') = '' THEN COALESCE(p.processing_status, '') END),
+            ('unassigned_category', CASE WHEN COALESCE(p.task_name, '') = '' THEN NULLIF(p.categories, '') END),
+            ('unassigned_day', CASE WHEN COALESCE(p.task_name, '') = '' THEN to_char(p.created_at, 'YYYY-MM-DD') END),
+            ('deep_status', p.deep_analysis_status),
+            ('dify_dataset', p.dify_dataset_id),
+            ('dify_day', to_char(p.dify_upload_time, 'YYYY-MM-DD')),
+            ('flag', CASE WHEN p.task_name IS NOT NULL THEN 'has_task_name' END),
+            ('flag', CASE WHEN p.deep_analysis_result IS NOT NULL THEN 'has_deep_analysis_result' END),
+            {_FIELD_BUCKETS_SQL}
+         UNION ALL
+         SELECT DISTINCT 'keyword'::TEXT, keyword FROM unnest(p.keyword_list) AS keyword
+         ) AS d(dimension, bucket)
+    WHERE d.bucket IS NOT NULL
+$$ LANGUAGE sql STABLE;
+
+-- 按 delta（+1 / -1）把一篇论文的贡献累加到统计表
+CREATE OR REPLACE FUNCTION arxiv_paper_stats_apply(p arxiv_papers, delta INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO arxiv_paper_stats AS s ({', '.join(('dimension', 'bucket') + MEASURES)})
+    SELECT r.dimension, r.bucket, {', '.join(f'r.{m} * delta' for m in MEASURES)}
+    FROM arxiv_paper_stats_rows(p) r
+    ON CONFLICT (dimension, bucket) DO UPDATE SET
+        {', '.join(f'{m} = s.{m} + EXCLUDED.{m}' for m in MEASURES)};
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION arxiv_paper_stats_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF (
+            OLD.processing_status, OLD.task_name, OLD.task_id, OLD.categories, OLD.created_at,
+            OLD.deep_analysis_status, OLD.dify_dataset_id, OLD.dify_document_id IS NULL,
+            OLD.dify_character_count, OLD.dify_upload_time::DATE, OLD.deep_analysis_result IS NULL, OLD.keyword_list,
+            {', '.join(f'OLD.{field} IS NULL' for field in STRUCTURED_FIELDS)}
+        ) IS NOT DISTINCT FROM (
+            NEW.processing_status, NEW.task_name, NEW.task_id, NEW.categories, NEW.created_at,
+            NEW.deep_analysis_status, NEW.dify_dataset_id, NEW.dify_document_id IS NULL,
+            NEW.dify_character_count, NEW.dify_upload_time::DATE, NEW.deep_analysis_result IS NULL, NEW.keyword_list,
+            {', '.join(f'NEW.{field} IS NULL' for field in STRUCTURED_FIELDS)}
+        ) THEN
+            -- 只改了与统计无关的字段（如 updated_at、正文内容）
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM arxiv_paper_stats_apply(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM arxiv_paper_stats_apply(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION arxiv_paper_stats_truncate()
+RETURNS TRIGGER AS $$
+BEGIN
+    TRUNCATE arxiv_paper_stats;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PAPER_STATS_TRIGGERS_SQL = """
+DROP TRIGGER IF EXISTS arxiv_papers_stats_row ON arxiv_papers;
+CREATE TRIGGER arxiv_papers_stats_row
+    AFTER INSERT OR UPDATE OR DELETE ON arxiv_papers
+    FOR EACH ROW
+    EXECUTE FUNCTION arxiv_paper_stats_trigger();
+
+DROP TRIGGER IF EXISTS arxiv_papers_stats_truncate ON arxiv_papers;
+CREATE TRIGGER arxiv_papers_stats_truncate
+    AFTER TRUNCATE ON arxiv_papers
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION arxiv_paper_stats_truncate();
+"""
+
+_ready = False
+_ready_lock = threading.Lock()
+_warned = False
+
+
+def paper_stats_ready(cursor) -> bool:
+    """
+    只读检查统计表和触发器是否已由迁移创建且为当前版本
+
+    不执行任何DDL或重建：统计表缺失或版本过旧时记录一次警告（提示执行
+    migrations/add_paper_stats.py）并返回False，调用方应回退到直接聚合论文表。
+    确认就绪一次后，本进程内后续调用直接返回True
+
+    Args:
+        cursor: RealDictCursor
+
+    Returns:
+        bool: 统计表是否可用
+    """
+    global _ready, _warned
+    if _ready:
+        return True
+
+    cursor.execute("""
+        SELECT obj_description(to_regclass('arxiv_paper_stats'), 'pg_class') AS version,
+               EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'arxiv_papers_stats_row') AS trigger_exists
+    """)
+    state = cursor.fetchone()
+    if state['version'] == str(PAPER_STATS_VERSION) and state['trigger_exists']:
+        with _ready_lock:
+            _ready = True
+        return True
+
+    with _ready_lock:
+        warn, _warned = not _warned, True
+    if warn:
+        logger.warning(
+            f"论文统计表 arxiv_paper_stats 不存在或版本不是 {PAPER_STATS_VERSION}（当前: {state['version']}），"
+            f"统计接口回退为直接聚合论文表；请执行 migrations/add_paper_stats.py"
+        )
+    return False
+
+
+def install_paper_stats(cursor):
+    """创建或更新统计表、函数和触发器，并写入版本号（不重建数据）"""
+    cursor.execute(PAPER_STATS_TABLE_SQL)
+    cursor.execute(PAPER_STATS_FUNCTIONS_SQL)
+    cursor.execute(PAPER_STATS_TRIGGERS_SQL)
+    cursor.execute(f"COMMENT ON TABLE arxiv_paper_stats IS '{PAPER_STATS_VERSION}'")
+
+
+def rebuild_paper_stats(cursor) -> int:
+    """
+    从 arxiv_papers 全量重建统计表（修复或首次创建时使用）
+
+    重建期间锁定论文表的写入，事务提交后释放
+
+    Returns:
+        int: 重建后的统计行数
+    """
+    cursor.execute("LOCK TABLE arxiv_papers IN SHARE ROW EXCLUSIVE MODE")
+    cursor.execute("TRUNCATE arxiv_paper_stats")
+    cursor.execute(f"""
+        INSERT INTO arxiv_paper_stats ({', '.join(('dimension', 'bucket') + MEASURES)})
+        SELECT r.dimension, r.bucket, {', '.join(f'SUM(r.{m})' for m in MEASURES)}
+        FROM arxiv_papers p, LATERAL arxiv_paper_stats_rows(p) r
+        GROUP BY r.dimension, r.bucket
+    """)
+    rows = cursor.rowcount
+    logger.info(f"论文统计表重建完成，共 {rows} 个统计行")
+    return rows
+
+
+def get_stat(cursor, dimension: str, bucket: str = '') -> Dict[str, int]:
+    """读取单个统计行，不存在时各计数为0"""
+    cursor.execute(f"""
+        SELECT {', '.join(MEASURES)} FROM arxiv_paper_stats
+        WHERE dimension = %s AND bucket = %s
+    """, (dimension, bucket))
+    row = cursor.fetchone()
+    return {m: int(row[m]) for m in MEASURES} if row else {m: 0 for m in MEASURES}
+
+
+def list_stats(cursor, dimension: str, order_by: str = 'paper_count DESC, bucket',
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    读取一个维度下所有计数大于0的统计行
+
+    Args:
+        order_by: 排序子句，只能使用统计表的列名
+        limit: 最多返回的行数
+    """
+    sql = f"""
+        SELECT bucket, {', '.join(MEASURES)} FROM arxiv_paper_stats
+        WHERE dimension = %s AND paper_count > 0
+        ORDER BY {order_by}
+    """
+    params: List[Any] = [dimension]
+    if limit:
+        sql += " LIMIT %s"
+        params.append(limit)
+    cursor.execute(sql, params)
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def list_recent_days(cursor, dimension: str, days: int, descending: bool = False) -> List[Dict[str, Any]]:
+    """读取按日维度最近 days 天（含今天）的计数，bucket 转为日期类型的 day 字段"""
+    cursor.execute(f"""
+        SELECT bucket::DATE AS day, {', '.join(MEASURES)} FROM arxiv_paper_stats
+        WHERE dimension = %s AND paper_count > 0
+          AND bucket >= to_char(CURRENT_DATE - (%s - 1), 'YYYY-MM-DD')
+        ORDER BY bucket {'DESC' if descending else 'ASC'}
+    """, (dimension, days))
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def list_recent_months(cursor, dimension: str, months: int) -> List[Dict[str, Any]]:
+    """把按日维度最近 months 个月的计数汇总为月度计数，month 为月初时间戳"""
+    cursor.execute("""
+        SELECT DATE_TRUNC('month', bucket::TIMESTAMP) AS month, SUM(paper_count) AS paper_count
+        FROM arxiv_paper_stats
+        WHERE dimension = %s AND paper_count > 0
+          AND bucket >= to_char(NOW() - %s * INTERVAL '1 month', 'YYYY-MM-DD')
+        GROUP BY 1
+        ORDER BY 1
+    """, (dimension, months))
+    return [dict(row) for row in cursor.fetchall()]
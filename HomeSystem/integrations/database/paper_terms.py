@@ -0,0 +1,61 @@
+# 论文关键词和分类数组
+"""
+arxiv_papers 关键词/分类数组
+
+keywords 和 categories 以字符串保存，格式不统一（PostgreSQL数组文本 {"a","b"}、JSON数组、逗号/分号/竖线分隔）。
+keyword_list 和 category_list 是由 arxiv_parse_terms 解析出的 TEXT[] 生成列（去重、保持原顺序），
+任何写入路径都会由数据库同步更新，并建有GIN索引：
+
+    keyword_list @> ARRAY['diffusion']::text[]            包含某个关键词的论文
+    category_list @> arxiv_parse_terms('cs.AI, cs.LG')    同时属于这些分类的论文
+
+关键词频率由增量统计表的 keyword 维度维护（见 paper_stats.py），不再逐行解析。
+
+使用示例:
+    from HomeSystem.integrations.database.paper_terms import keyword_filter_sql, category_filter_sql
+
+    cursor.execute(f"SELECT arxiv_id FROM arxiv_papers WHERE {keyword_filter_sql()}", ("robotics",))
+"""
+
+# 解析函数需要在生成列之前创建；IMMUTABLE 才能用于生成列和索引
+PARSE_TERMS_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION arxiv_parse_terms(raw TEXT)
+RETURNS TEXT[] AS $$
+    SELECT ARRAY(
+        SELECT term FROM (
+            SELECT btrim(btrim(part), '"''') AS term, MIN(ord) AS ord
+            FROM unnest(
+                CASE
+                    WHEN btrim(raw) ~ '^\{.*\}$' THEN ARRAY(
+                        SELECT COALESCE(m[1], m[2])
+                        FROM regexp_matches(btrim(raw), '"((?:[^"\\]|\\.)*)"|([^,{}"]+)', 'g') AS m)
+                    WHEN btrim(raw) ~ '^\[.*\]$' THEN ARRAY(
+                        SELECT COALESCE(m[1], m[2])
+                        FROM regexp_matches(btrim(raw), '"((?:[^"\\]|\\.)*)"|([^,\[\]"]+)', 'g') AS m)
+                    WHEN raw LIKE '%,%' THEN string_to_array(raw, ',')
+                    WHEN raw LIKE '%;%' THEN string_to_array(raw, ';')
+                    WHEN raw LIKE '%|%' THEN string_to_array(raw, '|')
+                    ELSE ARRAY[raw]
+                END
+            ) WITH ORDINALITY AS u(part, ord)
+            GROUP BY 1
+        ) t
+        WHERE term <> ''
+        ORDER BY ord
+    )
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+# 生成列表达式（建表、迁移脚本共用）
+KEYWORD_LIST_SQL = "arxiv_parse_terms(keywords)"
+CATEGORY_LIST_SQL = "arxiv_parse_terms(categories)"
+
+
+def keyword_filter_sql() -> str:
+    """包含指定关键词（精确匹配，一个参数）的WHERE条件，使用 keyword_list 的GIN索引"""
+    return "keyword_list @> ARRAY[%s]::text[]"
+
+
+def category_filter_sql() -> str:
+    """属于指定分类的WHERE条件，参数按同一规则解析，如 'cs.AI, cs.LG' 需同时包含两个分类"""
+    return "category_list @> arxiv_parse_terms(%s)"
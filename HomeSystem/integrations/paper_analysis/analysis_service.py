@@ -15,6 +15,8 @@ from typing import Dict, Any, Optional, Tuple
 from loguru import logger
 
 from HomeSystem.utility.arxiv.arxiv import ArxivData
+from HomeSystem.utility.arxiv.ocr_engine_pool import prewarm_ocr_engine_pool
+from HomeSystem.utility.arxiv.pdf_store import PDFStore
 
 
 class PaperAnalysisService:
@@ -51,6 +53,10 @@ class PaperAnalysisService:
         
         # 初始化时验证配置
         self._validate_configuration()
+        
+        # 使用本地OCR时在后台预热共享的PPStructureV3引擎池（数量由PADDLEOCR_POOL_PREWARM控制）
+        if not self.default_config.get('enable_remote_ocr', False):
+            prewarm_ocr_engine_pool()
     
     def _validate_configuration(self) -> None:
         """验证服务配置"""
@@ -245,17 +251,14 @@ class PaperAnalysisService:
                     'arxiv_id': arxiv_id
                 })
             
-            # 下载PDF到指定路径
-            arxiv_data.downloadPdf(save_path=paper_folder_path)
-            
-            # 检查下载结果并重命名为标准格式
-            pdf_files = [f for f in os.listdir(paper_folder_path) if f.endswith('.pdf')]
-            if pdf_files:
-                # 重命名为标准格式
-                actual_pdf_path = os.path.join(paper_folder_path, pdf_files[0])
-                if actual_pdf_path != pdf_path and os.path.exists(actual_pdf_path):
-                    os.rename(actual_pdf_path, pdf_path)
-                    logger.info(f"📁 PDF重命名为标准格式: {pdf_path}")
+            # 经由共享PDF存储下载（其他流程已下载过时直接复用），再链接到论文目录的标准文件名
+            arxiv_data.downloadPdf()
+            if arxiv_data.pdf_path:
+                PDFStore.link_to(arxiv_data.pdf_path, pdf_path)
+            else:
+                with open(pdf_path, 'wb') as f:
+                    f.write(arxiv_data.pdf)
+            arxiv_data.clearPdf()
             
             # 验证下载结果
             if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0:
@@ -322,9 +325,10 @@ class PaperAnalysisService:
                 'arxiv_id': arxiv_id
             })
             
-            # 从文件加载PDF
-            with open(pdf_path, 'rb') as f:
-                arxiv_data.pdf = f.read()
+            # 从文件加载PDF（内存映射，不复制文件内容）
+            arxiv_data.pdf_path = pdf_path
+            if not arxiv_data.load_from_pdf():
+                raise Exception(f"加载PDF文件失败: {pdf_path}")
             
             # 获取OCR配置
             effective_config = {**self.default_config, **(config or {})}
@@ -17,6 +17,9 @@ ArXiv 学术论文搜索和下载工具
     arxiv = ArxivTool()
     results = arxiv.arxivSearch("machine learning", num_results=10)
     
+    # 异步版本（连接池 + 限流）
+    results = await arxiv.arxivSearchAsync("machine learning", num_results=10)
+    
     # 使用增强版本（支持数据库）
     from HomeSystem.utility.arxiv import EnhancedArxivTool
     
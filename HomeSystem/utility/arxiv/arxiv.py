@@ -9,12 +9,29 @@ import io
 from typing import Optional
 from enum import Enum
 
+import asyncio
+import json
+import mmap
+import shutil
+import tarfile
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 import requests
 import xml.etree.ElementTree as ET
 import urllib.parse
 import time
 import feedparser
 
+from .arxiv_client import (
+    HTTPX_AVAILABLE, arxiv_api_rate_limiter, get_async_arxiv_client, ARXIV_MAX_RESULTS_PER_REQUEST
+)
+from .search_cache import ArxivSearchCache
+from .ocr_engine_pool import get_ocr_engine_pool
+from .pdf_store import get_pdf_store
+if HTTPX_AVAILABLE:
+    import httpx
+
 # 基础PDF处理导入
 import fitz  # PyMuPDF - 基础包，肯定有的
 
@@ -32,6 +49,157 @@ except ImportError:
 from pathlib import Path
 
 
+# 线程内复用的HTTP会话，保持与ArXiv的长连接
+_http_local = threading.local()
+
+
+def get_http_session() -> requests.Session:
+    """获取当前线程的 requests 会话"""
+    session = getattr(_http_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        _http_local.session = session
+    return session
+
+
+# 有ArXiv ID的论文经由共享PDF存储下载（data/pdf_store）
+PDF_STORE_ENABLED = os.getenv('PDF_STORE_ENABLED', 'true').lower() == 'true'
+
+# 远程OCR流式结果格式（result.json + imgs/*）
+REMOTE_OCR_TAR_MIMETYPE = 'application/x-tar'
+
+
+# === PyMuPDF 文本提取（支持多进程按页段并行） ===
+
+# 正则在模块导入时编译，每个工作进程只编译一次
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_SPACES_RE = re.compile(r'[ \t]+')
+
+# 页数达到该值时才启用多进程，页数少时进程通信开销大于收益
+PYMUPDF_PARALLEL_MIN_PAGES = 64
+
+_pymupdf_pool: Optional[ProcessPoolExecutor] = None
+_pymupdf_pool_workers = 0
+_pymupdf_pool_lock = threading.Lock()
+
+
+def _extract_pymupdf_page_text(page) -> str:
+    """提取并清理单页文本"""
+    # 兼容不同版本的PyMuPDF
+    if hasattr(page, 'get_text'):
+        text = page.get_text()
+    elif hasattr(page, 'getText'):
+        text = page.getText()
+    else:
+        text = ""
+    
+    clean_text = text.strip()
+    if clean_text:
+        clean_text = _BLANK_LINES_RE.sub('\n\n', clean_text)  # 规范化空行
+        clean_text = _SPACES_RE.sub(' ', clean_text)  # 合并多余空格
+    return clean_text
+
+
+def _extract_pymupdf_page_range(pdf_path: str, start_page: int, end_page: int) -> list[tuple[int, str]]:
+    """
+    工作进程：独立打开文档，提取 [start_page, end_page) 范围内的页面文本
+    
+    Returns:
+        list: [(页码, 清理后的文本), ...]，失败的页面文本为空
+    """
+    results = []
+    with fitz.open(pdf_path) as pdf_document:
+        for page_num in range(start_page, end_page):
+            try:
+                results.append((page_num, _extract_pymupdf_page_text(pdf_document[page_num])))
+            except Exception as e:
+                logger.warning(f"处理第{page_num + 1}页失败: {e}")
+                results.append((page_num, ""))
+    return results
+
+
+def _get_pymupdf_pool(workers: int) -> ProcessPoolExecutor:
+    """获取共享的文本提取进程池，工作进程数变化时重建"""
+    global _pymupdf_pool, _pymupdf_pool_workers
+    with _pymupdf_pool_lock:
+        if _pymupdf_pool is None or _pymupdf_pool_workers != workers:
+            if _pymupdf_pool is not None:
+                _pymupdf_pool.shutdown(wait=False)
+            _pymupdf_pool = ProcessPoolExecutor(max_workers=workers)
+            _pymupdf_pool_workers = workers
+        return _pymupdf_pool
+
+
+def _split_page_ranges(total_pages: int, parts: int) -> list[tuple[int, int]]:
+    """将页面均匀切分为连续的页段"""
+    parts = max(1, min(parts, total_pages))
+    size, remainder = divmod(total_pages, parts)
+    ranges = []
+    start = 0
+    for index in range(parts):
+        end = start + size + (1 if index < remainder else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+# === 部分下载：HTTP Range 只获取前若干页 ===
+
+# 首次请求的文件头部字节数，不足时按倍数增长
+PARTIAL_FETCH_INITIAL_BYTES = 1024 * 1024
+# 文件尾部字节数（交叉引用表、页面树，pdfTeX 还会把字体和对象流写在末尾）
+PARTIAL_FETCH_TAIL_BYTES = 512 * 1024
+# 已下载字节占比超过该值仍不满足字符预算时放弃，由调用方完整下载
+PARTIAL_FETCH_MAX_FRACTION = 0.5
+
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+)')
+
+
+# === 混合提取：文本层质量检测 ===
+
+# 少于该字符数的页面视为扫描页或纯图片页
+HYBRID_MIN_PAGE_CHARS = 200
+# 可识别字符（非替换符、非私有区字形）占比下限
+HYBRID_MIN_VALID_CHAR_RATIO = 0.9
+# 形似单词的词元占比下限，公式密集页也能达到
+HYBRID_MIN_WORD_RATIO = 0.4
+# 不合格页面占比超过该值时直接整篇结构化OCR
+HYBRID_FULL_OCR_RATIO = 0.5
+# 相邻不合格页面之间间隔不超过该页数时合并为一段OCR，减少OCR调用次数
+HYBRID_MERGE_GAP = 2
+
+_CID_GLYPH_RE = re.compile(r'\(cid:\d+\)')
+_WORD_LIKE_RE = re.compile(r'[A-Za-z]{2,}|[\u4e00-\u9fff]')
+
+
+def _is_text_layer_usable(text: str) -> bool:
+    """判断单页文本层能否直接使用（非扫描页、非字体映射缺失导致的乱码）"""
+    if len(text) < HYBRID_MIN_PAGE_CHARS:
+        return False
+    
+    # 缺少ToUnicode映射的字体会输出 (cid:123) 或替换符/私有区字符
+    text = _CID_GLYPH_RE.sub('\ufffd', text)
+    invalid_chars = sum(1 for ch in text if ch == '\ufffd' or '\ue000' <= ch <= '\uf8ff'
+                        or not (ch.isprintable() or ch.isspace()))
+    if 1 - invalid_chars / len(text) < HYBRID_MIN_VALID_CHAR_RATIO:
+        return False
+    
+    tokens = text.split()
+    word_tokens = sum(1 for token in tokens if _WORD_LIKE_RE.search(token))
+    return bool(tokens) and word_tokens / len(tokens) >= HYBRID_MIN_WORD_RATIO
+
+
+def _group_page_runs(pages: list[int], merge_gap: int = HYBRID_MERGE_GAP) -> list[tuple[int, int]]:
+    """将页码列表合并为连续页段 [(首页, 末页), ...]，间隔不超过 merge_gap 的页段合并"""
+    runs = []
+    for page_num in sorted(pages):
+        if runs and page_num - runs[-1][1] <= merge_gap + 1:
+            runs[-1] = (runs[-1][0], page_num)
+        else:
+            runs.append((page_num, page_num))
+    return runs
+
+
 class ArxivSearchMode(Enum):
     """ArXiv搜索模式枚举"""
     LATEST = "latest"                    # 最新论文 (按提交日期降序)
@@ -66,7 +234,9 @@ class ArxivData:
         # 获取pdf链接
         self.pdf_link = self.link.replace("abs", "pdf") if self.link else ""
 
+        # PDF内容：从文件加载时为内存映射的memoryview，仅在内存中时为bytes
         self.pdf = None
+        self._pdf_mmap: Optional[mmap.mmap] = None
 
         self.pdf_path = None
 
@@ -136,8 +306,7 @@ class ArxivData:
         
         # 加载PDF到内存用于OCR
         try:
-            with open(pdf_path, 'rb') as f:
-                self.pdf = f.read()
+            self._load_pdf_file(pdf_path)
             logger.info(f"成功加载PDF文件: {pdf_path}")
             
             # 根据参数决定是否执行OCR和元数据提取
@@ -240,8 +409,7 @@ class ArxivData:
             return False
         
         try:
-            with open(self.pdf_path, 'rb') as f:
-                self.pdf = f.read()
+            self._load_pdf_file(self.pdf_path)
             logger.info(f"成功从 {self.pdf_path} 加载PDF内容")
             return True
         except Exception as e:
@@ -458,30 +626,15 @@ class ArxivData:
         """
         return f"标题: {self.title}\n发布时间: {self.published_date}\n链接: {self.link}\n摘要: {self.snippet}"
 
-    def downloadPdf(self, save_path: Optional[str] = None, use_standard_path: bool = False, check_existing: bool = False):
+    def _resolve_pdf_path(self, save_path: Optional[str] = None, use_standard_path: bool = False) -> Optional[str]:
         """
-        下载PDF并保存到指定路径
+        根据下载参数确定PDF文件保存路径
 
-        Args:
-            save_path: PDF保存路径（优先级最高）
-            use_standard_path: 是否使用标准目录结构（当save_path为None时生效）
-            check_existing: 是否检查文件已存在（避免重复下载）
         Returns:
-            bytes: PDF内容
-        Raises:
-            RequestException: 当下载失败时抛出
-            IOError: 当文件保存失败时抛出
+            Optional[str]: PDF文件路径，为None时只下载到内存
         """
-        if not self.pdf_link:
-            raise ValueError("PDF链接不能为空")
-
-        # 决定实际的保存路径
-        actual_save_path = None
-        pdf_path = None
-        
         if save_path is not None:
             # 优先使用用户指定的路径（保持原有行为）
-            actual_save_path = save_path
             # 去除标题中的非法字符
             pdf_title = (self.title or '无标题').replace("/", "_")
             pdf_title = pdf_title.replace(":", "_")
@@ -491,86 +644,370 @@ class ArxivData:
             pdf_title = pdf_title.replace("<", "_")
             pdf_title = pdf_title.replace(">", "_")
             pdf_title = pdf_title.replace("|", "_")
-            pdf_path = os.path.join(actual_save_path, pdf_title + ".pdf")
+            return os.path.join(save_path, pdf_title + ".pdf")
         elif use_standard_path:
             # 使用标准目录结构
             try:
                 pdf_path = self.get_default_pdf_path()
-                actual_save_path = pdf_path.parent
                 # 确保目录存在
-                actual_save_path.mkdir(parents=True, exist_ok=True)
-                pdf_path = str(pdf_path)  # 转换为字符串路径
+                pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                return str(pdf_path)  # 转换为字符串路径
             except ValueError as e:
                 logger.error(f"无法使用标准路径: {e}")
-                actual_save_path = None
+        return None
+
+    def _load_pdf_file(self, pdf_path: str):
+        """
+        以内存映射方式加载PDF文件，内容不复制到Python堆中
+
+        Returns:
+            memoryview: 映射到文件的只读PDF内容（空文件时为bytes）
+        """
+        self.clearPdf()
+        with open(pdf_path, 'rb') as f:
+            try:
+                pdf_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # 空文件无法映射
+                self.pdf = f.read()
+                self.pdf_path = str(pdf_path)
+                return self.pdf
+        self._pdf_mmap = pdf_mmap
+        self.pdf = memoryview(pdf_mmap)
+        self.pdf_path = str(pdf_path)
+        return self.pdf
+
+    def _open_pdf_document(self):
+        """
+        打开当前PDF，不写临时文件
+
+        已映射文件时直接按路径打开，仅在内存中时通过stream打开
+        """
+        if self._pdf_mmap is not None and self.pdf_path and os.path.exists(self.pdf_path):
+            return fitz.open(self.pdf_path)
+        pdf_stream = self.pdf if isinstance(self.pdf, (bytes, bytearray)) else bytes(self.pdf)
+        return fitz.open(stream=pdf_stream, filetype="pdf")
+
+    def _load_existing_pdf(self, pdf_path: str):
+        """读取已存在的PDF文件，失败时返回None"""
+        logger.info(f"PDF文件已存在，跳过下载: {pdf_path}")
+        try:
+            return self._load_pdf_file(pdf_path)
+        except Exception as e:
+            logger.warning(f"读取现有PDF文件失败: {e}，将重新下载")
+            return None
+
+    def downloadPdf(self, save_path: Optional[str] = None, use_standard_path: bool = False, check_existing: bool = False):
+        """
+        下载PDF并保存到指定路径
+
+        Args:
+            save_path: PDF保存路径（优先级最高）
+            use_standard_path: 是否使用标准目录结构（当save_path为None时生效）
+            check_existing: 是否检查文件已存在（避免重复下载）
+        Returns:
+            bytes: PDF内容
+        Raises:
+            RequestException: 当下载失败时抛出
+            IOError: 当文件保存失败时抛出
+        """
+        if not self.pdf_link:
+            raise ValueError("PDF链接不能为空")
+
+        # 决定实际的保存路径
+        pdf_path = self._resolve_pdf_path(save_path, use_standard_path)
         
         # 检查文件是否已存在
         if check_existing and pdf_path and os.path.exists(pdf_path):
-            logger.info(f"PDF文件已存在，跳过下载: {pdf_path}")
-            # 读取现有文件并返回内容
+            existing_pdf = self._load_existing_pdf(pdf_path)
+            if existing_pdf is not None:
+                return existing_pdf
+
+        # 有ArXiv ID时经由共享PDF存储下载，同一版本只下载一次，论文目录中的文件为硬链接
+        if self.arxiv_id and PDF_STORE_ENABLED:
             try:
-                with open(pdf_path, 'rb') as f:
-                    self.pdf = f.read()
-                    self.pdf_path = pdf_path
-                    return self.pdf
-            except Exception as e:
-                logger.warning(f"读取现有PDF文件失败: {e}，将重新下载")
+                pdf_store = get_pdf_store()
+                store_path = pdf_store.fetch(self.arxiv_id, self._pdf_version(), self._download_pdf_file)
+                if pdf_path is None:
+                    return self._load_pdf_file(store_path)
+                pdf_store.link_to(store_path, pdf_path)
+                logger.info(f"PDF已保存到: {pdf_path}")
+                return self._load_pdf_file(pdf_path)
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"PDF下载失败: {str(e)}")
+            except IOError as e:
+                raise Exception(f"PDF保存失败: {str(e)}")
 
         try:
-            # 发送HEAD请求获取文件大小
-            head = requests.head(self.pdf_link)
-            total_size = int(head.headers.get('content-length', 0))
-
-            # 使用流式请求下载
-            response = requests.get(self.pdf_link, stream=True)
+            # 使用流式请求下载，文件大小直接取自响应头
+            response = get_http_session().get(self.pdf_link, stream=True, timeout=60)
             response.raise_for_status()  # 检查响应状态
+            total_size = int(response.headers.get('content-length', 0))
 
-            # 初始化进度条
-            progress = 0
-            chunk_size = 1024  # 1KB
-
-            content = bytearray()
+            chunk_size = 1024 * 1024  # 1MB
 
             # 如果没有保存路径，则只下载到内存
-            if actual_save_path is None:
+            if pdf_path is None:
+                chunks = []
                 with tqdm(total=total_size, desc="Downloading PDF", unit='B', unit_scale=True) as pbar:
                     for chunk in response.iter_content(chunk_size=chunk_size):
                         if chunk:
-                            content.extend(chunk)
-                            progress += len(chunk)
+                            chunks.append(chunk)
                             pbar.update(len(chunk))
-            else:
-                # 同时下载到内存和保存到文件
-                self.pdf_path = pdf_path
+                self.clearPdf()
+                self.pdf = b''.join(chunks)
+                return self.pdf
+
+            # 直接流式写入文件（先写临时文件再原子替换，已映射旧文件的对象不受影响），随后内存映射
+            part_path = pdf_path + ".part"
+            try:
+                self._write_pdf_response(response, part_path, total_size)
+                os.replace(part_path, pdf_path)
+            except BaseException:
+                # 下载中断时删除不完整的临时文件
+                try:
+                    os.unlink(part_path)
+                except OSError:
+                    pass
+                raise
+            logger.info(f"PDF已保存到: {pdf_path}")
 
-                if pdf_path:
-                    with open(pdf_path, 'wb') as f, \
-                            tqdm(total=total_size, desc="Downloading PDF", unit='B', unit_scale=True) as pbar:
-                        for chunk in response.iter_content(chunk_size=chunk_size):
-                            if chunk:
-                                content.extend(chunk)
-                                f.write(chunk)
-                                progress += len(chunk)
-                                pbar.update(len(chunk))
+            return self._load_pdf_file(pdf_path)
 
-                    logger.info(f"PDF已保存到: {pdf_path}")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"PDF下载失败: {str(e)}")
+        except IOError as e:
+            raise Exception(f"PDF保存失败: {str(e)}")
 
-            self.pdf = bytes(content)
+    def _download_pdf_file(self, file_path: str):
+        """流式下载完整PDF到指定文件"""
+        response = get_http_session().get(self.pdf_link, stream=True, timeout=60)
+        response.raise_for_status()
+        self._write_pdf_response(response, file_path, int(response.headers.get('content-length', 0)))
 
-            return self.pdf
+    def _write_pdf_response(self, response: requests.Response, file_path: str, total_size: int):
+        """按1MB分块把下载响应写入文件"""
+        with open(file_path, 'wb') as f, \
+                tqdm(total=total_size, desc="Downloading PDF", unit='B', unit_scale=True) as pbar:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                if chunk:
+                    f.write(chunk)
+                    pbar.update(len(chunk))
 
-        except requests.exceptions.RequestException as e:
+    def _pdf_version(self) -> Optional[str]:
+        """从PDF链接中解析版本号（如 "v2"），链接不带版本时返回None"""
+        match = re.search(r'/(?:abs|pdf)/.+?(v\d+)(?:\.pdf)?$', self.pdf_link or '')
+        return match.group(1) if match else None
+
+    async def downloadPdfAsync(self, save_path: Optional[str] = None, use_standard_path: bool = False, check_existing: bool = False):
+        """
+        downloadPdf 的异步版本，使用共享连接池流式下载，参数与返回值相同
+        """
+        if not self.pdf_link:
+            raise ValueError("PDF链接不能为空")
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.downloadPdf, save_path, use_standard_path, check_existing)
+
+        pdf_path = self._resolve_pdf_path(save_path, use_standard_path)
+        if check_existing and pdf_path and os.path.exists(pdf_path):
+            existing_pdf = self._load_existing_pdf(pdf_path)
+            if existing_pdf is not None:
+                return existing_pdf
+
+        client = get_async_arxiv_client()
+
+        # 有ArXiv ID时经由共享PDF存储：异步下载到存储的临时文件，登记和链接在线程中完成
+        if self.arxiv_id and PDF_STORE_ENABLED:
+            try:
+                pdf_store = get_pdf_store()
+                store_path = await pdf_store.fetch_async(
+                    self.arxiv_id, self._pdf_version(),
+                    lambda temp_path: client.download(self.pdf_link, temp_path)
+                )
+                if pdf_path is None:
+                    return self._load_pdf_file(store_path)
+                await asyncio.to_thread(pdf_store.link_to, store_path, pdf_path)
+                logger.info(f"PDF已保存到: {pdf_path}")
+                return self._load_pdf_file(pdf_path)
+            except httpx.HTTPError as e:
+                raise Exception(f"PDF下载失败: {str(e)}")
+            except IOError as e:
+                raise Exception(f"PDF保存失败: {str(e)}")
+
+        try:
+            content = await client.download(self.pdf_link, pdf_path)
+        except httpx.HTTPError as e:
             raise Exception(f"PDF下载失败: {str(e)}")
         except IOError as e:
             raise Exception(f"PDF保存失败: {str(e)}")
 
+        if pdf_path:
+            logger.info(f"PDF已保存到: {pdf_path}")
+            return self._load_pdf_file(pdf_path)
+        self.clearPdf()
+        self.pdf = content
+        return self.pdf
+
+    def fetchPartialText(self, char_budget: int = 10000, max_pages: int = 25,
+                         initial_bytes: int = PARTIAL_FETCH_INITIAL_BYTES,
+                         max_fraction: float = PARTIAL_FETCH_MAX_FRACTION) -> tuple[Optional[str], dict]:
+        """
+        部分下载PDF并提取前若干页文本，用于相关性筛选，不保留PDF内容
+        
+        通过HTTP Range请求下载文件头部和尾部，按原始偏移放入与文件等长的缓冲区，
+        PyMuPDF借助尾部的交叉引用表即可解析头部中的页面。提取的文本达到字符预算即停止，
+        否则逐步扩大头部范围。完整PDF推迟到深度分析阶段再下载。
+        
+        Args:
+            char_budget: 需要的字符数（通常为 ocr_char_limit_for_analysis）
+            max_pages: 最多提取的页数
+            initial_bytes: 首次下载的头部字节数
+            max_fraction: 已下载字节占比上限，超过仍不满足预算时放弃
+            
+        Returns:
+            tuple: (文本, 状态信息字典)
+                - 文本达到预算（或已提取完所有页面）时返回文本，否则返回None，由调用方完整下载后再提取
+                - 状态信息包含 'fetched_bytes' 和 'total_bytes'
+        """
+        status_info = {
+            'total_pages': 0,
+            'processed_pages': 0,
+            'is_oversized': False,
+            'char_count': 0,
+            'method': 'partial_fetch',
+            'fetched_bytes': 0,
+            'total_bytes': 0
+        }
+        if not self.pdf_link:
+            status_info['error'] = "PDF链接不能为空"
+            return None, status_info
+        
+        try:
+            head, total_bytes = self._fetch_pdf_range(0, initial_bytes - 1)
+            if total_bytes is None:
+                status_info['error'] = "服务器不支持Range请求"
+                logger.info(f"服务器不支持Range请求，跳过部分下载: {self.pdf_link}")
+                return None, status_info
+            
+            # 稀疏缓冲区：未下载的区间保持为0，已下载部分位于原始偏移处
+            buffer = bytearray(total_bytes)
+            buffer[:len(head)] = head
+            head_end = len(head)
+            fetched_bytes = len(head)
+            tail_start = max(head_end, total_bytes - PARTIAL_FETCH_TAIL_BYTES)
+            # 头部最多扩展到该偏移（不超过尾部起点）
+            head_limit = min(tail_start, max(head_end, int(total_bytes * max_fraction)))
+            if tail_start < total_bytes:
+                tail, _ = self._fetch_pdf_range(tail_start, total_bytes - 1)
+                buffer[tail_start:tail_start + len(tail)] = tail
+                fetched_bytes += len(tail)
+            
+            while True:
+                page_texts, total_pages, complete = self._extract_partial_pages(buffer, char_budget, max_pages)
+                chars = sum(len(text) for _, text in page_texts)
+                status_info.update({
+                    'total_pages': total_pages,
+                    'processed_pages': len(page_texts),
+                    'is_oversized': total_pages > max_pages,
+                    'char_count': chars,
+                    'fetched_bytes': fetched_bytes,
+                    'total_bytes': total_bytes
+                })
+                if chars >= char_budget or complete:
+                    break
+                if head_end >= head_limit:
+                    logger.info(f"部分下载 {fetched_bytes}/{total_bytes} 字节仅提取到 {chars} 字符，改为完整下载")
+                    return None, status_info
+                
+                # 头部范围翻倍，直到达到上限
+                next_end = min(head_limit, head_end * 2)
+                chunk, _ = self._fetch_pdf_range(head_end, next_end - 1)
+                buffer[head_end:head_end + len(chunk)] = chunk
+                head_end += len(chunk)
+                fetched_bytes += len(chunk)
+                
+        except Exception as e:
+            status_info['error'] = str(e)
+            logger.warning(f"部分下载失败: {e}")
+            return None, status_info
+        
+        if not page_texts:
+            return None, status_info
+        
+        self.ocr_result = "\n\n".join(f"=== 第{page_num + 1}页 ===\n{text}" for page_num, text in page_texts)
+        logger.info(f"部分下载完成，下载 {fetched_bytes}/{total_bytes} 字节，"
+                    f"提取前 {len(page_texts)}/{total_pages} 页文本 {status_info['char_count']} 个字符")
+        return self.ocr_result, status_info
+    
+    def _fetch_pdf_range(self, start: int, end: int) -> tuple[bytes, Optional[int]]:
+        """
+        下载PDF的 [start, end] 字节区间
+        
+        Returns:
+            tuple: (内容, 文件总字节数)，服务器忽略Range返回完整文件时总字节数为None
+        """
+        response = get_http_session().get(
+            self.pdf_link, headers={'Range': f'bytes={start}-{end}'}, stream=True, timeout=60
+        )
+        try:
+            response.raise_for_status()
+            match = _CONTENT_RANGE_RE.match(response.headers.get('Content-Range', ''))
+            if response.status_code != 206 or not match:
+                return b'', None
+            return response.content, int(match.group(3))
+        finally:
+            response.close()
+    
+    def _extract_partial_pages(self, pdf_bytes: bytearray, char_budget: int, max_pages: int) -> tuple[list[tuple[int, str]], int, bool]:
+        """
+        从部分下载的PDF中按顺序提取文本层合格的页面，直到达到字符预算
+        
+        直接在下载缓冲区上解析，不复制；文档在返回前关闭，调用方之后可继续写入缓冲区
+        
+        Returns:
+            tuple: ([(页码, 文本), ...], 总页数, 是否已提取完所有需要的页面)
+        """
+        page_texts = []
+        chars = 0
+        # 未下载区间的对象必然解析失败，不输出MuPDF错误信息
+        display_errors = fitz.TOOLS.mupdf_display_errors()
+        fitz.TOOLS.mupdf_display_errors(False)
+        try:
+            with fitz.open(stream=pdf_bytes, filetype='pdf') as pdf_document:
+                total_pages = len(pdf_document)
+                pages_to_process = min(max_pages, total_pages)
+                for page_num in range(pages_to_process):
+                    try:
+                        text = _extract_pymupdf_page_text(pdf_document[page_num])
+                    except Exception:
+                        text = ""
+                    # 页面内容尚未下载时文本为空或乱码，只保留前面连续的合格页面
+                    if not _is_text_layer_usable(text):
+                        return page_texts, total_pages, False
+                    page_texts.append((page_num, text))
+                    chars += len(text)
+                    if chars >= char_budget:
+                        break
+        finally:
+            fitz.TOOLS.mupdf_display_errors(display_errors)
+        return page_texts, total_pages, len(page_texts) == pages_to_process
+    
     def clearPdf(self):
         """
         清空PDF内容, 释放内存
         """
+        if isinstance(self.pdf, memoryview):
+            self.pdf.release()
         self.pdf = None
+        if self._pdf_mmap is not None:
+            try:
+                self._pdf_mmap.close()
+            except BufferError:
+                # 仍有外部引用时交由垃圾回收释放
+                pass
+            self._pdf_mmap = None
     
-    def performOCR(self, max_pages: int = 25, use_paddleocr: bool = False, use_remote_ocr: bool = False, auto_save: bool = False, save_path: Optional[str] = None) -> tuple[Optional[str], dict]:
+    def performOCR(self, max_pages: int = 25, use_paddleocr: bool = False, use_remote_ocr: bool = False, auto_save: bool = False, save_path: Optional[str] = None, pymupdf_workers: Optional[int] = None, use_hybrid: bool = False) -> tuple[Optional[str], dict]:
         """
         对PDF进行OCR文字识别，支持本地PyMuPDF/PaddleOCR或远程PaddleOCR服务
         
@@ -580,6 +1017,10 @@ class ArxivData:
             use_remote_ocr: 是否使用远程PaddleOCR服务，默认False
             auto_save: 是否自动保存OCR结果到标准目录（当save_path为None时生效）
             save_path: 指定OCR结果保存目录（优先级高于auto_save）
+            pymupdf_workers: PyMuPDF文本提取的工作进程数，默认读取环境变量PYMUPDF_OCR_WORKERS（默认1，不启用多进程）
+            use_hybrid: 是否使用混合提取，文本层合格的页面直接使用PyMuPDF文本，
+                        只对扫描页或乱码页执行结构化OCR（远程或本地PaddleOCR）。
+                        结果不含图片，需要图表的深度分析应使用完整结构化OCR
             
         Returns:
             tuple: (OCR识别结果文本, 状态信息字典)
@@ -589,7 +1030,7 @@ class ArxivData:
                     - 'processed_pages': 实际处理页数
                     - 'is_oversized': 是否超过页数限制（可能是毕业论文等长文档）
                     - 'char_count': 实际提取的字符数
-                    - 'method': 使用的OCR方法 ('pymupdf', 'paddleocr', 或 'remote_paddleocr')
+                    - 'method': 使用的OCR方法 ('pymupdf', 'paddleocr', 'remote_paddleocr' 或 'hybrid')
                     - 'saved_files': 保存的文件路径列表（当启用保存时）
             
         Raises:
@@ -613,8 +1054,14 @@ class ArxivData:
             except ValueError as e:
                 logger.warning(f"无法使用标准保存路径: {e}")
         
-        # 选择OCR方法：远程PaddleOCR > 本地PaddleOCR > 本地PyMuPDF
-        if use_remote_ocr:
+        # 选择OCR方法：混合提取 > 远程PaddleOCR > 本地PaddleOCR > 本地PyMuPDF
+        if use_hybrid:
+            ocr_result, status_info = self._performOCR_hybrid(max_pages, use_remote_ocr, workers=pymupdf_workers,
+                                                             output_path=ocr_save_path)
+            # 混合提取结果按文本保存，不生成 _paddleocr.md，深度分析时仍会执行完整结构化OCR
+            if ocr_save_path and ocr_result and status_info.get('method') == 'hybrid':
+                status_info['saved_files'] = self._save_pymupdf_result(ocr_result, ocr_save_path)
+        elif use_remote_ocr:
             # 使用远程PaddleOCR服务
             ocr_result, status_info = self._performOCR_remote(max_pages, ocr_save_path)
         elif use_paddleocr:
@@ -623,7 +1070,7 @@ class ArxivData:
         else:
             # 使用本地PyMuPDF（默认）
             try:
-                ocr_result, status_info = self._performOCR_pymupdf(max_pages)
+                ocr_result, status_info = self._performOCR_pymupdf(max_pages, workers=pymupdf_workers)
                 # 如果需要保存PyMuPDF结果
                 if ocr_save_path and ocr_result:
                     saved_files = self._save_pymupdf_result(ocr_result, ocr_save_path)
@@ -669,102 +1116,238 @@ class ArxivData:
         
         return saved_files
     
-    def _performOCR_pymupdf(self, max_pages: int = 25) -> tuple[Optional[str], dict]:
+    def _performOCR_pymupdf(self, max_pages: int = 25, workers: Optional[int] = None) -> tuple[Optional[str], dict]:
         """
         使用PyMuPDF进行快速文本提取（默认方法）
+        
+        Args:
+            max_pages: 最大处理页数
+            workers: 工作进程数，大于1且页数较多时按页段分配给多个进程并行提取，
+                     默认读取环境变量PYMUPDF_OCR_WORKERS（默认1）
         """
-        import tempfile
+        if workers is None:
+            workers = int(os.getenv('PYMUPDF_OCR_WORKERS', '1'))
         
         logger.info(f"开始使用PyMuPDF进行文本提取，最大处理{max_pages}页")
         
         try:
-            # 创建临时目录
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # 保存PDF到临时文件
-                tmp_pdf_path = os.path.join(temp_dir, 'input.pdf')
-                with open(tmp_pdf_path, 'wb') as f:
-                    f.write(self.pdf)
-                
-                # 打开PDF文档
-                pdf_document = fitz.open(tmp_pdf_path)
-                total_pages = len(pdf_document)
-                
-                logger.info(f"PDF总页数: {total_pages}")
+            # 打开PDF文档（按路径或内存stream，不写临时文件）
+            pdf_document = self._open_pdf_document()
+            total_pages = len(pdf_document)
+            
+            logger.info(f"PDF总页数: {total_pages}")
+            
+            # 检查是否为超长文档
+            is_oversized = total_pages > max_pages
+            if is_oversized:
+                logger.warning(f"文档页数({total_pages})超过限制({max_pages})，将只处理前{max_pages}页")
+            
+            # 决定处理的页数
+            pages_to_process = min(max_pages, total_pages)
+            
+            # 提取文本（按页码顺序）
+            page_texts = self._extract_pymupdf_pages(pdf_document, pages_to_process, workers)
+            
+            all_content = []
+            total_chars = 0
+            for page_num, clean_text in page_texts:
+                if clean_text:
+                    all_content.append(f"=== 第{page_num + 1}页 ===\n{clean_text}")
+                    total_chars += len(clean_text)
+            
+            # 构建状态信息
+            status_info = {
+                'total_pages': total_pages,
+                'processed_pages': pages_to_process,
+                'is_oversized': is_oversized,
+                'char_count': total_chars,
+                'method': 'pymupdf'
+            }
+            
+            if all_content:
+                self.ocr_result = "\n\n".join(all_content)
                 
-                # 检查是否为超长文档
-                is_oversized = total_pages > max_pages
+                status_msg = f"PyMuPDF文本提取完成，处理了 {pages_to_process}/{total_pages} 页，提取文本 {total_chars} 个字符"
                 if is_oversized:
-                    logger.warning(f"文档页数({total_pages})超过限制({max_pages})，将只处理前{max_pages}页")
-                
-                # 决定处理的页数
-                pages_to_process = min(max_pages, total_pages)
-                
-                # 提取文本
-                all_content = []
-                total_chars = 0
-                
-                for page_num in range(pages_to_process):
-                    try:
-                        page = pdf_document[page_num]
-                        # 兼容不同版本的PyMuPDF
-                        if hasattr(page, 'get_text'):
-                            text = page.get_text()
-                        elif hasattr(page, 'getText'):
-                            text = page.getText()
-                        else:
-                            text = ""
-                        
-                        if text.strip():
-                            # 清理文本
-                            clean_text = text.strip()
-                            clean_text = re.sub(r'\n\s*\n', '\n\n', clean_text)  # 规范化空行
-                            clean_text = re.sub(r'[ \t]+', ' ', clean_text)  # 合并多余空格
-                            
-                            if clean_text:
-                                all_content.append(f"=== 第{page_num + 1}页 ===\n{clean_text}")
-                                total_chars += len(clean_text)
-                                
-                    except Exception as e:
-                        logger.warning(f"处理第{page_num + 1}页失败: {e}")
-                        continue
-                
-                pdf_document.close()
+                    status_msg += f" (文档超长，可能是毕业论文或书籍)"
                 
-                # 构建状态信息
-                status_info = {
-                    'total_pages': total_pages,
-                    'processed_pages': pages_to_process,
-                    'is_oversized': is_oversized,
-                    'char_count': total_chars,
-                    'method': 'pymupdf'
-                }
+                logger.info(status_msg)
+                return self.ocr_result, status_info
+            else:
+                logger.warning("PyMuPDF未提取到任何文本")
+                self.ocr_result = ""
+                return self.ocr_result, status_info
                 
-                if all_content:
-                    self.ocr_result = "\n\n".join(all_content)
-                    
-                    status_msg = f"PyMuPDF文本提取完成，处理了 {pages_to_process}/{total_pages} 页，提取文本 {total_chars} 个字符"
-                    if is_oversized:
-                        status_msg += f" (文档超长，可能是毕业论文或书籍)"
-                    
-                    logger.info(status_msg)
-                    return self.ocr_result, status_info
-                else:
-                    logger.warning("PyMuPDF未提取到任何文本")
-                    self.ocr_result = ""
-                    return self.ocr_result, status_info
-                    
         except Exception as e:
             error_msg = f"PyMuPDF处理失败: {str(e)}"
             logger.error(error_msg)
             raise Exception(error_msg)
     
-    def _performOCR_remote(self, max_pages: int = 25, output_path: Optional[str] = None) -> tuple[Optional[str], dict]:
+    def _extract_pymupdf_pages(self, pdf_document, pages_to_process: int, workers: int) -> list[tuple[int, str]]:
+        """
+        按页提取文本层，页数较多且 workers 大于1时使用多进程，完成后关闭文档
+        
+        Returns:
+            list: 按页码排序的 [(页码, 文本), ...]，提取失败的页面不包含在内
+        """
+        page_texts = None
+        if workers > 1 and pages_to_process >= PYMUPDF_PARALLEL_MIN_PAGES:
+            pdf_document.close()
+            page_texts = self._extract_pymupdf_pages_parallel(pages_to_process, workers)
+        
+        if page_texts is None:
+            if pdf_document.is_closed:
+                pdf_document = self._open_pdf_document()
+            page_texts = []
+            for page_num in range(pages_to_process):
+                try:
+                    page_texts.append((page_num, _extract_pymupdf_page_text(pdf_document[page_num])))
+                except Exception as e:
+                    logger.warning(f"处理第{page_num + 1}页失败: {e}")
+                    continue
+        
+        if not pdf_document.is_closed:
+            pdf_document.close()
+        return page_texts
+    
+    def _extract_pymupdf_pages_parallel(self, pages_to_process: int, workers: int) -> Optional[list[tuple[int, str]]]:
+        """
+        多进程按页段提取文本，每个工作进程独立打开文档
+        
+        Returns:
+            list: 按页码排序的 [(页码, 文本), ...]，进程池不可用时返回None（由调用方回退到串行）
+        """
+        # 页段数为工作进程数的2倍，减少页面复杂度不均导致的等待
+        page_ranges = _split_page_ranges(pages_to_process, workers * 2)
+        logger.info(f"使用 {workers} 个进程并行提取 {pages_to_process} 页文本（{len(page_ranges)} 个页段）")
+        
+        temp_dir = None
+        try:
+            # 工作进程按路径打开文档，仅在内存中的PDF先写入一次临时文件
+            if self._pdf_mmap is not None and self.pdf_path and os.path.exists(self.pdf_path):
+                pdf_source = self.pdf_path
+            else:
+                temp_dir = tempfile.TemporaryDirectory()
+                pdf_source = os.path.join(temp_dir.name, 'input.pdf')
+                with open(pdf_source, 'wb') as f:
+                    f.write(self.pdf)
+            
+            pool = _get_pymupdf_pool(workers)
+            futures = [pool.submit(_extract_pymupdf_page_range, pdf_source, start, end)
+                       for start, end in page_ranges]
+            
+            page_texts = []
+            for future in futures:
+                page_texts.extend(future.result())
+            return page_texts
+            
+        except Exception as e:
+            logger.warning(f"多进程文本提取失败，回退到串行提取: {e}")
+            return None
+        finally:
+            if temp_dir is not None:
+                temp_dir.cleanup()
+    
+    def _performOCR_hybrid(self, max_pages: int = 25, use_remote_ocr: bool = False,
+                           workers: Optional[int] = None, output_path: Optional[str] = None) -> tuple[Optional[str], dict]:
+        """
+        混合提取：逐页检测文本层质量，合格页面直接使用PyMuPDF文本，
+        扫描页或乱码页按连续页段交给结构化OCR，识别失败时保留文本层
+        
+        Args:
+            max_pages: 最大处理页数
+            use_remote_ocr: 不合格页面是否使用远程PaddleOCR服务，否则使用本地PaddleOCR
+            workers: PyMuPDF文本提取的工作进程数
+            output_path: 改用完整结构化OCR时的结果保存目录
+            
+        Returns:
+            tuple: (文本, 状态信息字典)，状态信息额外包含 'text_layer_pages' 和 'ocr_pages'（从1开始的页码）
+        """
+        if workers is None:
+            workers = int(os.getenv('PYMUPDF_OCR_WORKERS', '1'))
+        
+        start_time = time.time()
+        try:
+            pdf_document = self._open_pdf_document()
+            total_pages = len(pdf_document)
+            pages_to_process = min(max_pages, total_pages)
+            page_texts = dict(self._extract_pymupdf_pages(pdf_document, pages_to_process, workers))
+        except Exception as e:
+            logger.warning(f"文本层检测失败: {e}，改用完整结构化OCR")
+            return self._performOCR_structured(max_pages, use_remote_ocr, output_path)
+        
+        bad_pages = [page_num for page_num in range(pages_to_process)
+                     if not _is_text_layer_usable(page_texts.get(page_num, ""))]
+        
+        # 大部分页面没有可用文本层（扫描版论文），逐段识别不如整篇识别
+        if pages_to_process and len(bad_pages) / pages_to_process > HYBRID_FULL_OCR_RATIO:
+            logger.info(f"{len(bad_pages)}/{pages_to_process} 页没有可用文本层，改用完整结构化OCR")
+            return self._performOCR_structured(max_pages, use_remote_ocr, output_path)
+        
+        # 按页段执行结构化OCR，结果以页段首页为键
+        ocr_sections = {}
+        ocr_pages = []
+        for first_page, last_page in _group_page_runs(bad_pages):
+            try:
+                run_result, _ = self._performOCR_structured(
+                    max_pages, use_remote_ocr, start_page=first_page + 1, end_page=last_page + 1
+                )
+            except Exception as e:
+                logger.warning(f"第{first_page + 1}-{last_page + 1}页结构化OCR失败: {e}，保留文本层")
+                run_result = None
+            if run_result:
+                ocr_sections[first_page] = (last_page, run_result.strip())
+                ocr_pages.extend(range(first_page + 1, last_page + 2))
+        
+        # 按页码顺序拼接，OCR页段替换对应页面的文本层
+        all_content = []
+        total_chars = 0
+        page_num = 0
+        while page_num < pages_to_process:
+            if page_num in ocr_sections:
+                last_page, section_text = ocr_sections[page_num]
+                header = f"=== 第{page_num + 1}页 ===" if last_page == page_num else f"=== 第{page_num + 1}-{last_page + 1}页 ==="
+                all_content.append(f"{header}\n{section_text}")
+                total_chars += len(section_text)
+                page_num = last_page + 1
+                continue
+            clean_text = page_texts.get(page_num, "")
+            if clean_text:
+                all_content.append(f"=== 第{page_num + 1}页 ===\n{clean_text}")
+                total_chars += len(clean_text)
+            page_num += 1
+        
+        self.ocr_result = "\n\n".join(all_content)
+        status_info = {
+            'total_pages': total_pages,
+            'processed_pages': pages_to_process,
+            'is_oversized': total_pages > max_pages,
+            'char_count': total_chars,
+            'method': 'hybrid',
+            'text_layer_pages': pages_to_process - len(ocr_pages),
+            'ocr_pages': ocr_pages
+        }
+        logger.info(f"混合提取完成，文本层 {status_info['text_layer_pages']} 页，结构化OCR {len(ocr_pages)} 页，"
+                    f"提取文本 {total_chars} 个字符，耗时 {time.time() - start_time:.2f} 秒")
+        return self.ocr_result, status_info
+    
+    def _performOCR_structured(self, max_pages: int = 25, use_remote_ocr: bool = False, output_path: Optional[str] = None,
+                               start_page: int = 1, end_page: Optional[int] = None) -> tuple[Optional[str], dict]:
+        """使用远程或本地PaddleOCR执行结构化识别，可只识别指定页段"""
+        if use_remote_ocr:
+            return self._performOCR_remote(max_pages, output_path, start_page=start_page, end_page=end_page)
+        return self._performOCR_paddleocr(max_pages, output_path, start_page=start_page, end_page=end_page)
+    
+    def _performOCR_remote(self, max_pages: int = 25, output_path: Optional[str] = None,
+                           start_page: int = 1, end_page: Optional[int] = None) -> tuple[Optional[str], dict]:
         """
         使用远程PaddleOCR服务进行结构化文档解析
         
         Args:
             max_pages: 最大处理页数，默认25页
             output_path: 输出目录路径，用于保存结果
+            start_page: 起始页（从1开始，包含），用于分段处理大文档
+            end_page: 结束页（包含），默认为 start_page + max_pages - 1
             
         Returns:
             tuple: (Markdown文本, 状态信息字典)
@@ -797,78 +1380,42 @@ class ArxivData:
             files = {'file': ('paper.pdf', self.pdf, 'application/pdf')}
             data = {
                 'max_pages': max_pages,
+                'start_page': start_page,
                 'arxiv_id': self.arxiv_id or 'unknown'
             }
+            if end_page is not None:
+                data['end_page'] = end_page
             
-            # 准备请求头
-            headers = {}
+            # 准备请求头（优先接收tar流式结果，旧版服务返回JSON）
+            headers = {'Accept': REMOTE_OCR_TAR_MIMETYPE + ', application/json;q=0.5'}
             if api_key:
                 headers['X-API-Key'] = api_key
             
-            # 发送请求到远程服务（支持重试机制）
-            import time
+            base_url = remote_endpoint.rstrip('/')
             
-            max_retries = 3
-            base_retry_delay = 10  # 基础延迟10秒
-            response = None
+            # 提交OCR任务，服务端立即返回job_id；连接中断后只需重新查询，不会重新识别
+            response = self._remote_ocr_request(
+                'post', f"{base_url}/api/ocr/jobs",
+                files=files, data=data, headers=headers, timeout=remote_timeout
+            )
             
-            for attempt in range(max_retries):
-                try:
-                    logger.info(f"发送请求到远程OCR服务: {remote_endpoint} (尝试 {attempt + 1}/{max_retries})")
-                    response = requests.post(
-                        f"{remote_endpoint.rstrip('/')}/api/ocr/process",
-                        files=files,
-                        data=data,
-                        headers=headers,
-                        timeout=remote_timeout
-                    )
-                    
-                    # 如果请求成功，跳出重试循环
-                    if response.status_code == 200:
-                        break
-                    else:
-                        logger.warning(f"远程OCR服务返回状态码: {response.status_code}")
-                        if attempt < max_retries - 1:
-                            # 指数退避：10秒、20秒、40秒
-                            retry_delay = base_retry_delay * (2 ** attempt)
-                            logger.info(f"等待{retry_delay}秒后重试...")
-                            time.sleep(retry_delay)
-                            # 重新准备files（因为文件流可能已被消耗）
-                            files = {'file': ('paper.pdf', self.pdf, 'application/pdf')}
-                            
-                except requests.exceptions.ConnectionError as e:
-                    error_type = "连接被拒绝" if "Connection refused" in str(e) else "连接中断"
-                    
-                    if attempt < max_retries - 1:
-                        # 不是最后一次，等待后继续
-                        retry_delay = base_retry_delay * (2 ** attempt)
-                        logger.warning(f"{error_type}，{retry_delay}秒后重试... (尝试 {attempt + 1}/{max_retries})")
-                        time.sleep(retry_delay)
-                        # 重新准备files（因为文件流可能已被消耗）
-                        files = {'file': ('paper.pdf', self.pdf, 'application/pdf')}
-                    else:
-                        # 是最后一次了，记录详细错误后抛出
-                        logger.error(f"{error_type}，已尝试{max_retries}次，放弃: {str(e)}")
-                        raise
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        # 不是最后一次，等待后继续
-                        retry_delay = base_retry_delay * (2 ** attempt)
-                        logger.warning(f"请求异常，{retry_delay}秒后重试... (尝试 {attempt + 1}/{max_retries}): {str(e)}")
-                        time.sleep(retry_delay)
-                        # 重新准备files（因为文件流可能已被消耗）
-                        files = {'file': ('paper.pdf', self.pdf, 'application/pdf')}
-                    else:
-                        # 是最后一次了，记录详细错误后抛出
-                        logger.error(f"请求异常，已尝试{max_retries}次，放弃: {str(e)}")
-                        raise
-                        
-            # 如果没有response对象（不应该发生，但防御性编程）
-            if response is None:
-                raise Exception("无法获取远程OCR服务响应")
+            if response.status_code == 404:
+                # 旧版服务没有任务接口，回退到同步接口
+                logger.info("远程OCR服务不支持任务接口，使用同步接口")
+                response = self._remote_ocr_request(
+                    'post', f"{base_url}/api/ocr/process",
+                    files=files, data=data, headers=headers, timeout=remote_timeout, stream=True
+                )
+            elif response.status_code == 202:
+                job_id = response.json()['job_id']
+                logger.info(f"远程OCR任务已提交: {job_id}")
+                response = self._wait_remote_ocr_job(base_url, job_id, headers, remote_timeout)
             
             if response.status_code == 200:
-                result = response.json()
+                if response.headers.get('Content-Type', '').startswith(REMOTE_OCR_TAR_MIMETYPE):
+                    result = self._read_remote_ocr_tar(response, output_path)
+                else:
+                    result = response.json()
                 
                 if result.get('success', False):
                     ocr_result = result.get('ocr_result')
@@ -892,6 +1439,9 @@ class ArxivData:
                             # 保存图片（如果远程服务返回了图片）
                             local_saved_files = [str(result_file)]
                             images_data = result.get('images', {})
+                            # tar流中的图片已在读取时直接写入imgs目录
+                            local_saved_files.extend(result.get('saved_images', []))
+                            images_count = len(images_data) + len(result.get('saved_images', []))
                             
                             if images_data:
                                 # 创建imgs目录
@@ -914,9 +1464,9 @@ class ArxivData:
                             
                             # 更新保存文件列表和图片数量
                             status_info['saved_files'] = local_saved_files
-                            status_info['images_count'] = len(images_data)
+                            status_info['images_count'] = images_count
                             
-                            logger.info(f"远程OCR结果已保存到本地: {result_file} (包含 {len(images_data)} 张图片)")
+                            logger.info(f"远程OCR结果已保存到本地: {result_file} (包含 {images_count} 张图片)")
                             
                         except Exception as e:
                             logger.warning(f"保存远程OCR结果到本地失败: {str(e)}")
@@ -989,13 +1539,130 @@ class ArxivData:
                 'saved_files': []
             }
 
-    def _performOCR_paddleocr(self, max_pages: int = 25, output_path: Optional[str] = None) -> tuple[Optional[str], dict]:
+    def _remote_ocr_request(self, method: str, url: str, files: Optional[dict] = None,
+                            max_retries: int = 3, base_retry_delay: int = 10, **kwargs) -> requests.Response:
+        """
+        发送远程OCR请求，连接错误和5xx响应按指数退避重试（10秒、20秒、40秒）
+        
+        Returns:
+            最后一次响应（4xx直接返回，由调用方处理）
+        """
+        response = None
+        for attempt in range(max_retries):
+            try:
+                logger.info(f"请求远程OCR服务: {url} (尝试 {attempt + 1}/{max_retries})")
+                # 每次重新准备files（文件流可能已被消耗）
+                request_files = dict(files) if files else None
+                response = getattr(requests, method)(url, files=request_files, **kwargs)
+                if response.status_code < 500:
+                    return response
+                logger.warning(f"远程OCR服务返回状态码: {response.status_code}")
+            except requests.exceptions.ConnectionError as e:
+                error_type = "连接被拒绝" if "Connection refused" in str(e) else "连接中断"
+                if attempt == max_retries - 1:
+                    logger.error(f"{error_type}，已尝试{max_retries}次，放弃: {str(e)}")
+                    raise
+                logger.warning(f"{error_type} (尝试 {attempt + 1}/{max_retries})")
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    logger.error(f"请求异常，已尝试{max_retries}次，放弃: {str(e)}")
+                    raise
+                logger.warning(f"请求异常 (尝试 {attempt + 1}/{max_retries}): {str(e)}")
+            
+            if attempt < max_retries - 1:
+                retry_delay = base_retry_delay * (2 ** attempt)
+                logger.info(f"等待{retry_delay}秒后重试...")
+                time.sleep(retry_delay)
+        
+        # 如果没有response对象（不应该发生，但防御性编程）
+        if response is None:
+            raise Exception("无法获取远程OCR服务响应")
+        return response
+    
+    def _read_remote_ocr_tar(self, response: requests.Response, output_path: Optional[str] = None) -> dict:
+        """
+        逐个读取远程OCR返回的tar流，不在内存中保存完整响应
+        
+        Args:
+            response: stream=True 的结果响应，首个成员为result.json，随后为imgs/下的图片
+            output_path: 输出目录，图片直接写入其中的imgs目录；为None时跳过图片
+            
+        Returns:
+            dict: result.json内容，另含saved_images（已保存的图片路径列表）
+        """
+        result = {}
+        saved_images = []
+        imgs_dir = Path(output_path) / "imgs" if output_path else None
+        
+        response.raw.decode_content = True
+        with tarfile.open(fileobj=response.raw, mode='r|') as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                if member.name == 'result.json':
+                    result = json.loads(tar.extractfile(member).read().decode('utf-8'))
+                elif member.name.startswith('imgs/') and imgs_dir is not None:
+                    # 只取文件名，防止路径穿越
+                    img_path = imgs_dir / os.path.basename(member.name)
+                    imgs_dir.mkdir(parents=True, exist_ok=True)
+                    with open(img_path, 'wb') as f:
+                        shutil.copyfileobj(tar.extractfile(member), f)
+                    saved_images.append(str(img_path))
+        
+        if saved_images:
+            logger.info(f"远程OCR以流式方式保存了 {len(saved_images)} 张图片到 {imgs_dir}")
+        result['saved_images'] = saved_images
+        return result
+    
+    def _wait_remote_ocr_job(self, base_url: str, job_id: str, headers: dict, timeout: int) -> requests.Response:
+        """
+        长轮询远程OCR任务直到完成，然后获取结果
+        
+        Args:
+            base_url: 远程服务地址
+            job_id: 任务ID
+            headers: 请求头（API Key）
+            timeout: 等待任务完成的总时长（秒）
+            
+        Returns:
+            结果接口的响应（与同步接口格式相同）
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise requests.exceptions.Timeout(f"远程OCR任务 {job_id} 未在{timeout}秒内完成")
+            
+            wait = int(min(30, max(1, remaining)))
+            response = self._remote_ocr_request(
+                'get', f"{base_url}/api/ocr/jobs/{job_id}",
+                params={'wait': wait}, headers=headers, timeout=wait + 30
+            )
+            if response.status_code != 200:
+                raise Exception(f"查询远程OCR任务失败: HTTP {response.status_code}")
+            
+            job = response.json()
+            if job['status'] == 'failed':
+                raise Exception(f"远程OCR任务失败: {job.get('error')}")
+            if job['status'] == 'completed':
+                return self._remote_ocr_request(
+                    'get', f"{base_url}/api/ocr/jobs/{job_id}/result",
+                    headers=headers, timeout=timeout, stream=True
+                )
+            
+            if 'queue_position' in job:
+                logger.info(f"远程OCR任务排队中，前面还有 {job['queue_position']} 个任务")
+    
+    def _performOCR_paddleocr(self, max_pages: int = 25, output_path: Optional[str] = None,
+                              start_page: int = 1, end_page: Optional[int] = None) -> tuple[Optional[str], dict]:
         """
         使用PaddleOCR 3.0 PPStructureV3进行结构化文档解析
         
         Args:
             max_pages: 最大处理页数，默认25页
             output_path: 输出目录路径，默认为临时目录
+            start_page: 起始页（从1开始，包含），大于1或指定end_page时只识别该页段
+            end_page: 结束页（包含），默认为 start_page + max_pages - 1
             
         Returns:
             tuple: (Markdown文本, 状态信息字典)
@@ -1008,13 +1675,16 @@ class ArxivData:
         try:
             # 创建临时目录
             with tempfile.TemporaryDirectory() as temp_dir:
-                # 保存PDF到临时文件
-                tmp_pdf_path = os.path.join(temp_dir, 'input.pdf')
-                with open(tmp_pdf_path, 'wb') as f:
-                    f.write(self.pdf)
+                # PDF已映射到文件时直接使用原文件，否则写入临时文件
+                if self._pdf_mmap is not None and self.pdf_path and os.path.exists(self.pdf_path):
+                    input_pdf_path = self.pdf_path
+                else:
+                    input_pdf_path = os.path.join(temp_dir, 'input.pdf')
+                    with open(input_pdf_path, 'wb') as f:
+                        f.write(self.pdf)
                 
                 # 使用PyMuPDF检查总页数
-                pdf_document = fitz.open(tmp_pdf_path)
+                pdf_document = fitz.open(input_pdf_path)
                 total_pages = len(pdf_document)
                 pdf_document.close()
                 
@@ -1028,23 +1698,25 @@ class ArxivData:
                 # 决定处理的页数
                 pages_to_process = min(max_pages, total_pages)
                 
+                # 指定页段时切出子PDF，只识别这些页面
+                if start_page > 1 or end_page is not None:
+                    first_page = max(1, start_page)
+                    last_page = min(total_pages, end_page or total_pages, first_page + max_pages - 1)
+                    if first_page > last_page:
+                        raise ValueError(f"页段 {start_page}-{end_page} 超出文档范围（共{total_pages}页）")
+                    range_pdf_path = os.path.join(temp_dir, 'range.pdf')
+                    with fitz.open(input_pdf_path) as source_document, fitz.open() as range_document:
+                        range_document.insert_pdf(source_document, from_page=first_page - 1, to_page=last_page - 1)
+                        range_document.save(range_pdf_path)
+                    input_pdf_path = range_pdf_path
+                    pages_to_process = last_page - first_page + 1
+                    logger.info(f"只识别第 {first_page}-{last_page} 页")
+                
                 # 检查OCR功能是否可用
                 if not OCR_AVAILABLE:
                     logger.error("OCR功能不可用，缺少必要的依赖包")
                     raise Exception("OCR功能不可用，请安装 paddleocr 和相关依赖")
                 
-                # 初始化PaddleOCR PPStructureV3
-                try:
-                    pipeline = PPStructureV3()
-                    logger.info("PaddleOCR PPStructureV3初始化成功")
-                except Exception as e:
-                    logger.error(f"PaddleOCR初始化失败: {e}")
-                    raise Exception(f"PaddleOCR初始化失败: {e}")
-                
-                # 执行结构化识别
-                logger.info("开始执行结构化文档识别...")
-                output = pipeline.predict(input=tmp_pdf_path)
-                
                 # 设置输出目录
                 if output_path is None:
                     output_md_dir = os.path.join(temp_dir, 'output')
@@ -1054,22 +1726,41 @@ class ArxivData:
                 output_md_dir = Path(output_md_dir)
                 output_md_dir.mkdir(parents=True, exist_ok=True)
                 
-                # 处理结果并提取markdown和图片
-                markdown_list = []
-                markdown_images = []
+                # 从进程内共享的引擎池借出已加载的PPStructureV3
+                ocr_engine_pool = get_ocr_engine_pool()
+                try:
+                    pipeline = ocr_engine_pool.checkout()
+                except Exception as e:
+                    logger.error(f"PaddleOCR初始化失败: {e}")
+                    raise Exception(f"PaddleOCR初始化失败: {e}")
+                
+                try:
+                    # 执行结构化识别
+                    logger.info("开始执行结构化文档识别...")
+                    output = pipeline.predict(input=input_pdf_path)
+                
+                    # 处理结果并提取markdown和图片
+                    markdown_list = []
+                    markdown_images = []
                 
-                for res in output:
-                    if hasattr(res, 'markdown'):
-                        md_info = res.markdown
-                        markdown_list.append(md_info)
-                        markdown_images.append(md_info.get("markdown_images", {}))
+                    for res in output:
+                        if hasattr(res, 'markdown'):
+                            md_info = res.markdown
+                            markdown_list.append(md_info)
+                            markdown_images.append(md_info.get("markdown_images", {}))
                 
-                # 合并markdown页面
-                if hasattr(pipeline, 'concatenate_markdown_pages'):
-                    markdown_texts = pipeline.concatenate_markdown_pages(markdown_list)
+                    # 合并markdown页面
+                    if hasattr(pipeline, 'concatenate_markdown_pages'):
+                        markdown_texts = pipeline.concatenate_markdown_pages(markdown_list)
+                    else:
+                        # 备用方法：手动合并
+                        markdown_texts = "\n\n".join([str(md) for md in markdown_list if md])
+                except Exception:
+                    # 出错的实例（如显存不足、Paddle内部错误）可能处于异常状态，丢弃而不放回池中复用
+                    ocr_engine_pool.discard(pipeline)
+                    raise
                 else:
-                    # 备用方法：手动合并
-                    markdown_texts = "\n\n".join([str(md) for md in markdown_list if md])
+                    ocr_engine_pool.checkin(pipeline)
                 
                 # 保存markdown文件
                 if output_path is None:
@@ -1084,7 +1775,7 @@ class ArxivData:
                     saved_files = []
                     
                     # 使用 arxiv_id 作为文件名（如果可用）
-                    base_filename = self.arxiv_id if (self.arxiv_id and self.arxiv_id != "") else Path(tmp_pdf_path).stem
+                    base_filename = self.arxiv_id if (self.arxiv_id and self.arxiv_id != "") else Path(input_pdf_path).stem
                     mkd_file_path = output_md_dir / f"{base_filename}_paddleocr.md"
                     
                     with open(mkd_file_path, "w", encoding="utf-8") as f:
@@ -1358,7 +2049,7 @@ class ArxivData:
         包括PDF数据、OCR结果、结构化分析字段等所有大内存占用的属性
         """
         # 清理PDF相关数据
-        self.pdf = None
+        self.clearPdf()
         self.pdf_path = None
         
         # 清理OCR结果
@@ -1601,16 +2292,29 @@ class ArxivResult:
 
 
 class ArxivTool:
-    def __init__(self, search_host: str = None):
+    def __init__(self, search_host: str = None, enable_search_cache: bool = False,
+                 search_cache_path: str = None):
         """
         直接使用 ArXiv API 进行搜索，不再依赖 SearxNG。
 
         :param search_host: 保留参数以兼容现有代码，但不再使用
         :type search_host: str
+        :param enable_search_cache: 是否为异步搜索启用本地结果缓存（条件请求）
+        :type enable_search_cache: bool
+        :param search_cache_path: 缓存文件路径，默认为 data/arxiv_cache/search_cache.sqlite3
+        :type search_cache_path: str
         """
         # 保留参数但不再使用，避免破坏现有调用代码
         self.search_host = search_host
         
+        # 本地搜索结果缓存
+        self.search_cache = None
+        if enable_search_cache:
+            try:
+                self.search_cache = ArxivSearchCache(db_path=search_cache_path)
+            except Exception as e:
+                logger.warning(f"ArXiv搜索缓存初始化失败，将不使用缓存: {e}")
+        
         # 大规模搜索的默认配置
         self.default_chunk_size = 2000  # 每批次大小
         self.default_delay_seconds = 1.0  # 请求间延时（秒）
@@ -1689,7 +2393,8 @@ class ArxivTool:
                         logger.debug(f"请求批次: start={total_fetched}, max_results={current_chunk}")
                         
                         # 发起请求
-                        response = requests.get(base_url, params=params, timeout=30)
+                        arxiv_api_rate_limiter.acquire_sync()
+                        response = get_http_session().get(base_url, params=params, timeout=30)
                         response.raise_for_status()
                         
                         # 解析响应
@@ -1960,7 +2665,8 @@ class ArxivTool:
         
         try:
             logger.info(f"直接调用ArXiv API搜索: {query} (单次请求，{num_results}篇)")
-            response = requests.get(base_url, params=params, timeout=30)
+            arxiv_api_rate_limiter.acquire_sync()
+            response = get_http_session().get(base_url, params=params, timeout=30)
             response.raise_for_status()
             
             # 解析RSS/Atom格式响应
@@ -2108,6 +2814,114 @@ class ArxivTool:
         else:
             raise ValueError(f"不支持的搜索模式: {mode}")
 
+    @staticmethod
+    def get_mode_timestamp_field(mode: ArxivSearchMode) -> Optional[str]:
+        """
+        获取搜索模式排序所依据的时间字段（published / updated），按相关性排序时返回None
+        """
+        if mode == ArxivSearchMode.MOST_RELEVANT:
+            return None
+        if mode == ArxivSearchMode.RECENTLY_UPDATED:
+            return "updated"
+        return "published"
+
+    def _build_mode_search(self, query: str, mode: ArxivSearchMode,
+                           start_year: int = None, end_year: int = None,
+                           after_year: int = None) -> tuple[str, str]:
+        """
+        将搜索模式转换为 (查询语句, 排序方式)，与 searchPapersByMode 的各分支一致
+        """
+        if mode == ArxivSearchMode.LATEST:
+            return query, "submittedDate"
+        elif mode == ArxivSearchMode.MOST_RELEVANT:
+            return query, "relevance"
+        elif mode == ArxivSearchMode.RECENTLY_UPDATED:
+            return query, "lastUpdatedDate"
+        elif mode == ArxivSearchMode.DATE_RANGE:
+            if start_year is None or end_year is None:
+                raise ValueError("DATE_RANGE模式需要提供start_year和end_year参数")
+            return f"{query} AND submittedDate:[{start_year}0101* TO {end_year}1231*]", "submittedDate"
+        elif mode == ArxivSearchMode.AFTER_YEAR:
+            if after_year is None:
+                raise ValueError("AFTER_YEAR模式需要提供after_year参数")
+            current_year = datetime.now().year
+            return f"{query} AND submittedDate:[{after_year}0101* TO {current_year}1231*]", "submittedDate"
+        else:
+            raise ValueError(f"不支持的搜索模式: {mode}")
+
+    async def arxivSearchAsync(self, query: str,
+                               num_results: int = 20,
+                               sort_by: str = "relevance",
+                               order: str = "desc",
+                               max_results: int = None,
+                               kwargs: dict = None,
+                               use_direct_api: bool = True,
+                               chunk_size: int = None,
+                               delay_seconds: float = None,
+                               max_retries: int = None,
+                               show_progress: bool = False,
+                               since_last_run: bool = False,
+                               newer_than: str = None
+                               ) -> ArxivResult:
+        """
+        arxivSearch 的异步版本，参数与返回值相同
+
+        使用共享连接池和进程级限流，分页时解析当前页的同时请求下一页。
+        启用搜索缓存时使用条件请求，未变化的页直接使用本地缓存结果。
+        delay_seconds 和 show_progress 仅为兼容保留，请求间隔由限流器控制。
+
+        :param since_last_run: 仅返回该查询上次运行之后提交的论文，遇到已看到的论文即停止翻页
+                               （需要启用搜索缓存，且按提交日期降序排序）
+        :param newer_than: 时间水位，只返回 提交/更新 时间晚于该值的论文，越过水位即停止翻页
+                           （按提交日期或更新日期降序排序时有效）
+        """
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(
+                self.arxivSearch, query, num_results, sort_by, order, max_results, kwargs,
+                use_direct_api, chunk_size, delay_seconds, max_retries, show_progress
+            )
+
+        logger.info(f"使用异步ArXiv API搜索: {query} ({num_results}篇)")
+        try:
+            results = await get_async_arxiv_client().search(
+                query=query,
+                total_results=num_results,
+                sort_by=sort_by,
+                order="descending" if order == "desc" else "ascending",
+                chunk_size=chunk_size or ARXIV_MAX_RESULTS_PER_REQUEST,
+                max_retries=self.default_max_retries if max_retries is None else max_retries,
+                cache=self.search_cache,
+                since_last_run=since_last_run,
+                newer_than=newer_than
+            )
+        except Exception as e:
+            logger.error(f"ArXiv API异步搜索失败: {str(e)}")
+            return ArxivResult([])
+
+        if not results:
+            logger.warning("ArXiv API未返回结果")
+        logger.info(f"ArXiv API返回 {len(results)} 个结果")
+        return ArxivResult(results)
+
+    async def searchPapersByModeAsync(self, query: str, mode: ArxivSearchMode, num_results: int = 20,
+                                      start_year: int = None, end_year: int = None,
+                                      after_year: int = None,
+                                      since_last_run: bool = False,
+                                      newer_than: str = None,
+                                      chunk_size: int = None) -> ArxivResult:
+        """
+        searchPapersByMode 的异步版本，参数与返回值相同
+
+        :param since_last_run: 见 arxivSearchAsync，仅对按提交日期排序的模式有效
+        :param newer_than: 见 arxivSearchAsync，对除 MOST_RELEVANT 以外的模式有效
+        :param chunk_size: 分页大小，默认使用 ArXiv 单次请求上限
+        """
+        mode_query, sort_by = self._build_mode_search(query, mode, start_year, end_year, after_year)
+        logger.info(f"按搜索模式 {mode.value} 搜索论文: {query}")
+        return await self.arxivSearchAsync(mode_query, num_results=num_results, sort_by=sort_by,
+                                           order="desc", chunk_size=chunk_size,
+                                           since_last_run=since_last_run, newer_than=newer_than)
+
     # 移除SearxNG相关方法，现在完全使用直接API
 
 
@@ -0,0 +1,384 @@
+"""
+ArXiv 异步 HTTP 客户端
+
+基于 httpx.AsyncClient 的连接池客户端，供 ArxivTool / ArxivData 的异步接口使用：
+- 保持长连接，多次请求复用同一连接
+- 进程级令牌桶限流，遵守 ArXiv API 每3秒1次请求的要求
+- 分页搜索时，当前页的 Atom 解析与下一页的请求并行进行
+"""
+import asyncio
+import contextlib
+import os
+import re
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+import feedparser
+from loguru import logger
+
+from .search_cache import ArxivSearchCache
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+ARXIV_MAX_RESULTS_PER_REQUEST = 2000
+
+
+class TokenBucket:
+    """
+    令牌桶限流器
+
+    令牌数在锁内计算，等待在锁外进行，因此可以在多个线程和事件循环之间共享。
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 桶容量（允许的突发请求数）
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """预定一个令牌，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self):
+        """异步获取一个令牌"""
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+    def acquire_sync(self):
+        """同步获取一个令牌"""
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+# 排序方式对应的时间字段，用于按时间水位截断结果
+SORT_TIMESTAMP_FIELDS = {
+    "submittedDate": "published",
+    "lastUpdatedDate": "updated"
+}
+
+# ArXiv API 要求每3秒不超过1次请求，全进程共享
+arxiv_api_rate_limiter = TokenBucket(rate=1 / 3, capacity=1)
+
+
+def feed_entry_to_result(entry) -> Dict[str, Any]:
+    """将 feedparser 条目转换为 ArxivData 使用的结果字典"""
+    # 提取分类
+    categories = []
+    if hasattr(entry, 'tags'):
+        categories = [tag.term for tag in entry.tags]
+    elif hasattr(entry, 'arxiv_primary_category'):
+        categories = [entry.arxiv_primary_category['term']]
+
+    # 提取作者信息
+    authors = []
+    if hasattr(entry, 'authors'):
+        authors = [author.name for author in entry.authors]
+    elif hasattr(entry, 'author'):
+        authors = [entry.author]
+
+    return {
+        'title': entry.title,
+        'link': entry.link,
+        'snippet': entry.summary,
+        'categories': ', '.join(categories) if categories else 'Unknown',
+        'authors': ', '.join(authors) if authors else 'Unknown',
+        'published': entry.get('published'),
+        'updated': entry.get('updated')
+    }
+
+
+def entry_arxiv_id(result: Dict[str, Any]) -> str:
+    """从结果字典的链接中提取不带版本号的 ArXiv ID"""
+    link = (result.get('link') or '').rstrip('/')
+    return re.sub(r'v\d+$', '', link.rsplit('/', 1)[-1])
+
+
+def parse_feed(content: bytes) -> List[Dict[str, Any]]:
+    """解析 ArXiv Atom 响应为结果字典列表"""
+    feed = feedparser.parse(content)
+    return [feed_entry_to_result(entry) for entry in feed.entries]
+
+
+class AsyncArxivClient:
+    """ArXiv 异步客户端（连接池 + 限流）"""
+
+    def __init__(self, timeout: float = 30.0, max_connections: int = 8,
+                 rate_limiter: Optional[TokenBucket] = None):
+        """
+        Args:
+            timeout: 单次请求超时（秒）
+            max_connections: 连接池最大连接数
+            rate_limiter: API 请求限流器，默认使用进程级共享限流器
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx 未安装，无法使用 ArXiv 异步客户端")
+        self.rate_limiter = rate_limiter or arxiv_api_rate_limiter
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections)
+        )
+
+    async def aclose(self):
+        """关闭连接池"""
+        await self._client.aclose()
+
+    async def _request_feed(self, params: Dict[str, Any], max_retries: int = 3,
+                            retry_delay: float = 3.0,
+                            headers: Optional[Dict[str, str]] = None) -> "httpx.Response":
+        """发送一次 ArXiv API 请求（含限流和重试），304 响应直接返回"""
+        retry_count = 0
+        while True:
+            await self.rate_limiter.acquire()
+            try:
+                response = await self._client.get(ARXIV_API_URL, params=params, headers=headers)
+                if response.status_code == 304:
+                    return response
+                response.raise_for_status()
+                return response
+            except httpx.HTTPError as e:
+                retry_count += 1
+                if retry_count > max_retries:
+                    logger.error(f"ArXiv API请求失败，已达最大重试次数: {e}")
+                    raise
+                logger.warning(f"ArXiv API请求失败，重试 {retry_count}/{max_retries}: {e}")
+                await asyncio.sleep(retry_delay * retry_count)
+
+    async def fetch_feed(self, params: Dict[str, Any], max_retries: int = 3,
+                         retry_delay: float = 3.0) -> bytes:
+        """
+        请求一页 ArXiv API 结果（原始 Atom 内容）
+
+        Args:
+            params: API 查询参数
+            max_retries: 最大重试次数
+            retry_delay: 重试基础延时（秒），按重试次数递增
+
+        Returns:
+            bytes: 响应内容
+        """
+        response = await self._request_feed(params, max_retries, retry_delay)
+        return response.content
+
+    async def _fetch_page(self, params: Dict[str, Any], max_retries: int,
+                          cache: Optional[ArxivSearchCache]) -> Dict[str, Any]:
+        """
+        获取一页结果，有缓存时发送条件请求
+
+        Returns:
+            Dict: 命中缓存时包含 'entries'，否则包含待解析的 'content' 及响应验证头
+        """
+        cache_key = cache.page_key(params) if cache else None
+        cached = await asyncio.to_thread(cache.get_page, cache_key) if cache else None
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = await self._request_feed(params, max_retries, headers=headers or None)
+        if response.status_code == 304 and cached:
+            logger.debug(f"ArXiv搜索缓存命中(304): start={params.get('start')}")
+            await asyncio.to_thread(cache.touch_page, cache_key)
+            return {'entries': cached['entries']}
+        return {
+            'cache_key': cache_key,
+            'content': response.content,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified')
+        }
+
+    async def search(self, query: str, total_results: int,
+                     sort_by: str = "relevance", order: str = "descending",
+                     chunk_size: int = ARXIV_MAX_RESULTS_PER_REQUEST,
+                     max_retries: int = 3,
+                     cache: Optional[ArxivSearchCache] = None,
+                     since_last_run: bool = False,
+                     newer_than: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        分页搜索，解析当前页的同时预取下一页
+
+        Args:
+            query: 搜索查询
+            total_results: 目标结果数量
+            sort_by: 排序方式 ("relevance", "lastUpdatedDate", "submittedDate")
+            order: 排序顺序 ("ascending", "descending")
+            chunk_size: 每页大小，不超过 ArXiv 单次限制
+            max_retries: 每页最大重试次数
+            cache: 搜索结果缓存，提供时使用条件请求
+            since_last_run: 仅返回上次运行之后的新论文，遇到已看到的论文即停止翻页
+                            （需要提供cache，且按提交日期降序排序）
+            newer_than: 时间水位（Atom 时间字符串），只返回 提交/更新 时间晚于该值的论文，
+                        越过水位即停止翻页（需要按提交日期或更新日期降序排序）
+
+        Returns:
+            List[Dict]: 结果字典列表
+        """
+        chunk_size = max(1, min(chunk_size, ARXIV_MAX_RESULTS_PER_REQUEST))
+        sort_by = sort_by if sort_by in ("relevance", "lastUpdatedDate", "submittedDate") else "relevance"
+
+        def page_params(start: int) -> Dict[str, Any]:
+            return {
+                "search_query": query,
+                "start": start,
+                "max_results": min(chunk_size, total_results - start),
+                "sortBy": sort_by,
+                "sortOrder": order
+            }
+
+        seen_ids: set = set()
+        query_key = None
+        if since_last_run:
+            if cache is None or sort_by != "submittedDate" or order != "descending":
+                logger.warning("增量搜索需要搜索缓存且按提交日期降序排序，已按普通搜索处理")
+                since_last_run = False
+            else:
+                query_key = cache.query_key(page_params(0))
+                seen_ids = set(await asyncio.to_thread(cache.get_seen_ids, query_key))
+
+        timestamp_field = None
+        if newer_than:
+            timestamp_field = SORT_TIMESTAMP_FIELDS.get(sort_by)
+            if timestamp_field is None or order != "descending":
+                logger.warning("时间水位搜索需要按提交日期或更新日期降序排序，已按普通搜索处理")
+                timestamp_field = None
+
+        results: List[Dict[str, Any]] = []
+        start = 0
+        pending = asyncio.create_task(self._fetch_page(page_params(start), max_retries, cache))
+        try:
+            while pending is not None:
+                page = await pending
+                requested = page_params(start)["max_results"]
+                next_start = start + requested
+
+                # 先发起下一页请求，再解析当前页
+                pending = None
+                if next_start < total_results:
+                    pending = asyncio.create_task(self._fetch_page(page_params(next_start), max_retries, cache))
+
+                if 'entries' in page:
+                    batch_results = page['entries']
+                else:
+                    batch_results = await asyncio.to_thread(parse_feed, page['content'])
+                    if cache is not None:
+                        await asyncio.to_thread(cache.put_page, page['cache_key'], batch_results,
+                                                page['etag'], page['last_modified'])
+                page_size = len(batch_results)
+
+                # 增量模式：截断到第一篇已看到的论文
+                reached_seen = False
+                if seen_ids:
+                    for index, result in enumerate(batch_results):
+                        if entry_arxiv_id(result) in seen_ids:
+                            batch_results = batch_results[:index]
+                            reached_seen = True
+                            break
+
+                # 时间水位模式：截断到第一篇不晚于水位的论文
+                if timestamp_field:
+                    for index, result in enumerate(batch_results):
+                        timestamp = result.get(timestamp_field)
+                        if timestamp and timestamp <= newer_than:
+                            batch_results = batch_results[:index]
+                            reached_seen = True
+                            break
+
+                results.extend(batch_results)
+                logger.debug(f"已获取 {len(results)}/{total_results} 篇文章")
+
+                # 结果不足一页说明已到达结果集末尾，丢弃预取的下一页
+                if reached_seen or page_size < requested:
+                    if reached_seen:
+                        logger.info(f"增量搜索到达上次运行位置，新论文 {len(results)} 篇")
+                    if pending is not None:
+                        pending.cancel()
+                        pending = None
+                    break
+                start = next_start
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        results = results[:total_results]
+        if timestamp_field and len(results) >= total_results:
+            logger.warning(f"时间水位搜索达到结果上限 {total_results} 篇仍未越过水位，更早的新论文将被跳过")
+        if since_last_run and results:
+            await asyncio.to_thread(cache.update_seen_ids, query_key,
+                                    [entry_arxiv_id(result) for result in results])
+        return results
+
+    async def download(self, url: str, file_path: Optional[str] = None,
+                       chunk_size: int = 1024 * 1024) -> Optional[bytes]:
+        """
+        流式下载文件
+
+        Args:
+            url: 下载地址
+            file_path: 保存路径，提供时直接流式写入文件（先写临时文件再原子替换），不在内存中保留内容
+            chunk_size: 读取块大小
+
+        Returns:
+            Optional[bytes]: 未提供保存路径时返回文件内容，否则返回None
+        """
+        async with self._client.stream("GET", url) as response:
+            response.raise_for_status()
+            if file_path:
+                part_path = f"{file_path}.part"
+                try:
+                    with open(part_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            f.write(chunk)
+                    os.replace(part_path, file_path)
+                except BaseException:
+                    # 下载中断（含任务取消）时删除不完整的临时文件
+                    with contextlib.suppress(OSError):
+                        os.unlink(part_path)
+                    raise
+                return None
+
+            chunks = []
+            async for chunk in response.aiter_bytes(chunk_size):
+                chunks.append(chunk)
+            return b''.join(chunks)
+
+
+# httpx.AsyncClient 与事件循环绑定，每个事件循环使用各自的客户端
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncArxivClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_arxiv_client() -> AsyncArxivClient:
+    """获取当前事件循环共享的 ArXiv 异步客户端"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncArxivClient()
+        _clients[loop] = client
+    return client
@@ -61,11 +61,16 @@ class ArxivDatabaseManager:
             return 0
         
         try:
+            # 一次查询过滤已存在的论文
+            existing_ids = self.db_ops.existing_ids(
+                ArxivPaperModel, 'arxiv_id',
+                [arxiv_data.arxiv_id for arxiv_data in arxiv_results.results]
+            )
+            
             # 转换为数据库模型
             paper_models = []
             for arxiv_data in arxiv_results.results:
-                # 检查是否已存在
-                if not self.is_paper_exists(arxiv_data.arxiv_id):
+                if arxiv_data.arxiv_id not in existing_ids:
                     paper_model = self._arxiv_data_to_model(arxiv_data)
                     paper_models.append(paper_model)
             
@@ -0,0 +1,236 @@
+"""
+OCR 引擎池
+
+PPStructureV3 每次创建都要重新加载检测、版面和识别模型，耗时往往超过识别一篇短论文。
+这里在进程内维护若干个已加载的引擎实例，通过 checkout / checkin 借出和归还（线程安全），
+空闲超过指定时间的实例会被回收以释放内存。
+
+使用示例:
+    from HomeSystem.utility.arxiv.ocr_engine_pool import get_ocr_engine_pool
+
+    with get_ocr_engine_pool().engine() as pipeline:
+        output = pipeline.predict(input=pdf_path)
+
+环境变量:
+    PADDLEOCR_POOL_SIZE: 最多同时存在的引擎实例数（默认1）
+    PADDLEOCR_POOL_IDLE_TIMEOUT: 空闲实例回收时间，秒（默认1800，0表示不回收）
+    PADDLEOCR_POOL_PREWARM: 服务启动时预热的实例数（默认0）
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+class OCREnginePool:
+    """线程安全的 OCR 引擎实例池"""
+
+    def __init__(self, factory: Callable[[], Any], size: int = 1, idle_timeout: float = 1800):
+        """
+        Args:
+            factory: 创建引擎实例的函数
+            size: 最多同时存在的实例数
+            idle_timeout: 空闲实例回收时间（秒），0表示不回收
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self._condition = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []  # (实例, 归还时间)
+        self._created = 0  # 已创建（含正在创建）的实例数
+        self._reaper: Optional[threading.Thread] = None
+        self._stats = {'created': 0, 'evicted': 0, 'checkouts': 0, 'waits': 0}
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """
+        借出一个引擎实例，没有空闲实例且已达上限时等待
+
+        Args:
+            timeout: 最长等待时间（秒），None表示一直等待
+
+        Returns:
+            引擎实例
+
+        Raises:
+            TimeoutError: 等待超时
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._idle and self._created >= self.size:
+                self._stats['waits'] += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("等待OCR引擎超时")
+                self._condition.wait(remaining)
+
+            self._stats['checkouts'] += 1
+            if self._idle:
+                # 后进先出，最近使用的实例更可能仍在缓存中
+                engine, _ = self._idle.pop()
+                return engine
+            self._created += 1
+
+        # 在锁外创建实例，避免阻塞其他线程归还
+        try:
+            engine = self._create_engine()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        return engine
+
+    def checkin(self, engine: Any):
+        """归还引擎实例"""
+        with self._condition:
+            self._idle.append((engine, time.monotonic()))
+            self._condition.notify()
+
+    def discard(self, engine: Any):
+        """丢弃一个出错的实例，释放其名额"""
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def engine(self, timeout: Optional[float] = None):
+        """借出引擎实例的上下文管理器，正常退出时归还，出错时丢弃（出错的实例可能处于异常状态）"""
+        engine = self.checkout(timeout)
+        try:
+            yield engine
+        except BaseException:
+            self.discard(engine)
+            raise
+        self.checkin(engine)
+
+    def prewarm(self, count: Optional[int] = None) -> int:
+        """
+        预先创建实例放入池中
+
+        Args:
+            count: 预热数量，默认填满整个池
+
+        Returns:
+            int: 预热后可用的空闲实例数
+        """
+        count = self.size if count is None else min(count, self.size)
+        engines = []
+        try:
+            # 借出再归还，已有空闲实例时不会重复创建
+            for _ in range(count):
+                engines.append(self.checkout(timeout=0))
+        except TimeoutError:
+            pass
+        except Exception as e:
+            logger.error(f"OCR引擎预热失败: {e}")
+        for engine in engines:
+            self.checkin(engine)
+        logger.info(f"OCR引擎池预热完成，空闲实例: {len(engines)}/{self.size}")
+        return len(engines)
+
+    def evict_idle(self) -> int:
+        """回收空闲超时的实例，返回回收数量"""
+        if not self.idle_timeout:
+            return 0
+        now = time.monotonic()
+        with self._condition:
+            expired = [item for item in self._idle if now - item[1] >= self.idle_timeout]
+            if not expired:
+                return 0
+            self._idle = [item for item in self._idle if now - item[1] < self.idle_timeout]
+            self._created -= len(expired)
+            self._stats['evicted'] += len(expired)
+            self._condition.notify_all()
+        evicted = len(expired)
+        expired.clear()  # 释放引用，模型内存随实例回收
+        logger.info(f"回收了 {evicted} 个空闲OCR引擎实例")
+        return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取池状态"""
+        with self._condition:
+            return {
+                'size': self.size,
+                'alive': self._created,
+                'idle': len(self._idle),
+                'idle_timeout': self.idle_timeout,
+                **self._stats
+            }
+
+    def _create_engine(self) -> Any:
+        start = time.perf_counter()
+        engine = self.factory()
+        with self._condition:
+            self._stats['created'] += 1
+        logger.info(f"OCR引擎实例创建完成，耗时 {time.perf_counter() - start:.1f} 秒")
+        self._start_reaper()
+        return engine
+
+    def _start_reaper(self):
+        """启动后台回收线程（只启动一次）"""
+        if not self.idle_timeout:
+            return
+        with self._condition:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name="ocr-engine-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        interval = max(1.0, self.idle_timeout / 2)
+        while True:
+            time.sleep(interval)
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.warning(f"回收OCR引擎实例失败: {e}")
+
+
+_default_pool: Optional[OCREnginePool] = None
+_default_pool_lock = threading.Lock()
+
+
+def _create_ppstructure():
+    from paddleocr import PPStructureV3
+    return PPStructureV3()
+
+
+def get_ocr_engine_pool() -> OCREnginePool:
+    """获取进程内共享的 PPStructureV3 引擎池（首次调用时创建，不加载模型）"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = OCREnginePool(
+                factory=_create_ppstructure,
+                size=int(os.getenv('PADDLEOCR_POOL_SIZE', '1')),
+                idle_timeout=float(os.getenv('PADDLEOCR_POOL_IDLE_TIMEOUT', '1800'))
+            )
+        return _default_pool
+
+
+def prewarm_ocr_engine_pool(count: Optional[int] = None, background: bool = True) -> Optional[threading.Thread]:
+    """
+    预热共享引擎池
+
+    Args:
+        count: 预热数量，默认读取 PADDLEOCR_POOL_PREWARM（默认0，不预热）
+        background: 是否在后台线程中预热，避免阻塞服务启动
+
+    Returns:
+        后台预热线程（background=True且需要预热时），否则为None
+    """
+    if count is None:
+        count = int(os.getenv('PADDLEOCR_POOL_PREWARM', '0'))
+    if count <= 0:
+        return None
+
+    pool = get_ocr_engine_pool()
+    if not background:
+        pool.prewarm(count)
+        return None
+    thread = threading.Thread(target=pool.prewarm, args=(count,), name="ocr-engine-prewarm", daemon=True)
+    thread.start()
+    return thread
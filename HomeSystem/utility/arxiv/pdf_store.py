@@ -0,0 +1,333 @@
+"""
+共享PDF存储
+
+Web、论文收集任务和深度分析服务以前各自下载同一篇论文的PDF并写到不同路径。
+这里把PDF统一保存在 data/pdf_store 下：文件按内容的SHA-256存放（内容相同只保存一份），
+SQLite索引按 arxiv_id + 版本号 映射到文件；论文目录 data/paper_analyze/<id> 中的PDF通过硬链接指向存储文件。
+同一篇论文同时只有一个下载在进行（进程内线程锁 + 跨进程文件锁；异步下载只在入库时持锁），写入先落临时文件再原子替换，
+总大小超过上限时按最近访问时间淘汰。
+
+使用示例:
+    from HomeSystem.utility.arxiv.pdf_store import get_pdf_store
+
+    store = get_pdf_store()
+    store_path = store.fetch("2401.00001", "v1", download_func)
+    store_path = await store.fetch_async("2401.00001", "v1", async_download_func)
+    store.link_to(store_path, "data/paper_analyze/2401.00001/2401.00001.pdf")
+
+环境变量:
+    PDF_STORE_DIR: 存储目录（默认 data/pdf_store）
+    PDF_STORE_MAX_MB: 存储总大小上限，MB（默认10240）
+"""
+import asyncio
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+class PDFStore:
+    """按 arxiv_id + 版本号 索引、按内容去重的PDF存储"""
+
+    def __init__(self, store_dir: str, max_size_mb: int = 10240):
+        """
+        Args:
+            store_dir: 存储目录，包含 objects/、locks/ 和索引数据库
+            max_size_mb: 存储总大小上限（MB）
+        """
+        self.store_dir = Path(store_dir)
+        self.objects_dir = self.store_dir / "objects"
+        self.locks_dir = self.store_dir / "locks"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.locks_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.db_path = self.store_dir / "index.sqlite3"
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._stats = {'hits': 0, 'downloads': 0, 'evicted': 0}
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=30)
+
+    def _init_db(self):
+        with self._lock, self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pdf_store (
+                    store_key TEXT PRIMARY KEY,
+                    arxiv_id TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pdf_store_sha256 ON pdf_store(sha256)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pdf_store_arxiv_id ON pdf_store(arxiv_id, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pdf_store_last_access ON pdf_store(last_access)")
+
+    @staticmethod
+    def make_key(arxiv_id: str, version: Optional[str] = None) -> str:
+        """存储键，旧式ID中的斜杠替换为下划线"""
+        return f"{arxiv_id.replace('/', '_')}@{version or 'latest'}"
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}.pdf"
+
+    def get(self, arxiv_id: str, version: Optional[str] = None) -> Optional[str]:
+        """
+        查找已存储的PDF，未指定版本时返回该论文最近存入的任意版本
+
+        Returns:
+            Optional[str]: 存储文件路径，不存在时返回None
+        """
+        if version:
+            query, params = "SELECT store_key, sha256 FROM pdf_store WHERE store_key = ?", (self.make_key(arxiv_id, version),)
+        else:
+            query, params = "SELECT store_key, sha256 FROM pdf_store WHERE arxiv_id = ? ORDER BY created_at DESC LIMIT 1", (arxiv_id,)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            store_key = row[0]
+            object_path = self._object_path(row[1])
+            if not object_path.exists():
+                # 文件被外部删除，索引同步清理
+                conn.execute("DELETE FROM pdf_store WHERE store_key = ?", (store_key,))
+                return None
+            conn.execute("UPDATE pdf_store SET last_access = ? WHERE store_key = ?", (time.time(), store_key))
+            self._stats['hits'] += 1
+        return str(object_path)
+
+    def fetch(self, arxiv_id: str, version: Optional[str], download_func: Callable[[str], None]) -> str:
+        """
+        获取PDF，不存在时下载。同一篇论文同时只有一个下载在进行，其余调用方等待后直接使用结果
+
+        Args:
+            arxiv_id: ArXiv论文ID
+            version: 版本号（如 "v2"），未知时为None
+            download_func: 下载函数，参数为临时文件路径，需要把完整PDF写入该路径
+
+        Returns:
+            str: 存储文件路径
+
+        Raises:
+            Exception: 下载失败时抛出download_func的异常
+        """
+        store_path = self.get(arxiv_id, version)
+        if store_path:
+            return store_path
+
+        with self._key_lock(arxiv_id):
+            # 等待锁期间其他下载者可能已经完成
+            store_path = self.get(arxiv_id, version)
+            if store_path:
+                return store_path
+
+            temp_path = self.objects_dir / f".download-{os.getpid()}-{threading.get_ident()}.pdf"
+            try:
+                download_func(str(temp_path))
+                with self._lock:
+                    self._stats['downloads'] += 1
+                return self._add_file(arxiv_id, version, temp_path, move=True)
+            finally:
+                if temp_path.exists():
+                    temp_path.unlink()
+
+    async def fetch_async(self, arxiv_id: str, version: Optional[str],
+                          download_func: Callable[[str], Awaitable[None]]) -> str:
+        """
+        fetch 的异步版本：在事件循环中下载到临时文件，再在线程中持有键锁登记入库
+
+        下载期间不持有键锁（键锁会阻塞事件循环），同一篇论文的并发下载可能各自进行，
+        先完成者入库，后完成者直接使用已入库的文件
+
+        Args:
+            download_func: 异步下载函数，参数为临时文件路径，需要把完整PDF写入该路径
+
+        Returns:
+            str: 存储文件路径
+        """
+        store_path = await asyncio.to_thread(self.get, arxiv_id, version)
+        if store_path:
+            return store_path
+
+        temp_path = self.objects_dir / f".download-{os.getpid()}-{uuid.uuid4().hex}.pdf"
+        try:
+            await download_func(str(temp_path))
+            return await asyncio.to_thread(self._register_download, arxiv_id, version, temp_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _register_download(self, arxiv_id: str, version: Optional[str], temp_path: Path) -> str:
+        """持有键锁把下载完成的临时文件登记入库，其他下载者已先入库时直接返回已有文件"""
+        with self._key_lock(arxiv_id):
+            store_path = self.get(arxiv_id, version)
+            if store_path:
+                return store_path
+            with self._lock:
+                self._stats['downloads'] += 1
+            return self._add_file(arxiv_id, version, temp_path, move=True)
+
+    def put_file(self, arxiv_id: str, version: Optional[str], src_path: str) -> str:
+        """
+        把已有的PDF文件（如用户上传）加入存储，源文件保持不变
+
+        Returns:
+            str: 存储文件路径
+        """
+        with self._key_lock(arxiv_id):
+            return self._add_file(arxiv_id, version, Path(src_path), move=False)
+
+    def _add_file(self, arxiv_id: str, version: Optional[str], src_path: Path, move: bool) -> str:
+        """按内容哈希写入存储并登记索引（调用方持有键锁）"""
+        sha256 = self._hash_file(src_path)
+        object_path = self._object_path(sha256)
+        size_bytes = src_path.stat().st_size
+
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            if move:
+                os.replace(src_path, object_path)
+            else:
+                staging_path = object_path.with_name(f".{sha256}.{os.getpid()}-{threading.get_ident()}.tmp")
+                shutil.copyfile(src_path, staging_path)
+                os.replace(staging_path, object_path)
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pdf_store (store_key, arxiv_id, version, sha256, size_bytes, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.make_key(arxiv_id, version), arxiv_id, version or 'latest', sha256, size_bytes, now, now)
+            )
+        logger.info(f"PDF已加入共享存储: {arxiv_id} {version or 'latest'} ({size_bytes / 1024 / 1024:.1f} MB)")
+        self.evict()
+        return str(object_path)
+
+    @staticmethod
+    def link_to(store_path: str, dest_path: str) -> str:
+        """
+        把存储文件链接到目标路径（优先硬链接，跨文件系统时复制），先写临时路径再原子替换
+
+        硬链接不受存储淘汰影响，不使用会在淘汰后失效的符号链接
+
+        Returns:
+            str: 目标路径
+        """
+        dest = Path(dest_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists() and os.path.samefile(store_path, dest):
+            return str(dest)
+
+        staging_path = dest.with_name(f".{dest.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            try:
+                os.link(store_path, staging_path)
+            except OSError:
+                shutil.copyfile(store_path, staging_path)
+            os.replace(staging_path, dest)
+        finally:
+            if staging_path.exists():
+                staging_path.unlink()
+        return str(dest)
+
+    def evict(self) -> int:
+        """按最近访问时间淘汰文件，直到总大小不超过上限，返回淘汰的文件数"""
+        evicted = []
+        with self._lock, self._connect() as conn:
+            # 多个键可能指向同一文件，按文件统计大小和最近访问时间
+            rows = conn.execute(
+                "SELECT sha256, MAX(size_bytes), MAX(last_access) AS accessed FROM pdf_store "
+                "GROUP BY sha256 ORDER BY accessed"
+            ).fetchall()
+            total = sum(size_bytes for _, size_bytes, _ in rows)
+            for sha256, size_bytes, _ in rows:
+                if total <= self.max_size_bytes:
+                    break
+                evicted.append(sha256)
+                total -= size_bytes
+            conn.executemany("DELETE FROM pdf_store WHERE sha256 = ?", [(sha256,) for sha256 in evicted])
+            self._stats['evicted'] += len(evicted)
+
+        for sha256 in evicted:
+            # 论文目录中的硬链接仍然有效，只删除存储中的这一份
+            try:
+                self._object_path(sha256).unlink()
+            except FileNotFoundError:
+                pass
+        if evicted:
+            logger.info(f"共享PDF存储淘汰了 {len(evicted)} 个文件")
+        return len(evicted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取存储状态"""
+        with self._lock, self._connect() as conn:
+            keys, files, total = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT sha256), "
+                "COALESCE((SELECT SUM(size_bytes) FROM (SELECT MAX(size_bytes) AS size_bytes FROM pdf_store GROUP BY sha256)), 0) "
+                "FROM pdf_store"
+            ).fetchone()
+            return {
+                'keys': keys,
+                'files': files,
+                'size_mb': round(total / 1024 / 1024, 1),
+                'max_size_mb': round(self.max_size_bytes / 1024 / 1024, 1),
+                **self._stats
+            }
+
+    @contextmanager
+    def _key_lock(self, arxiv_id: str):
+        """同一篇论文（不区分版本）的互斥锁：进程内线程锁 + 跨进程文件锁（不支持fcntl的平台只有线程锁）"""
+        lock_name = arxiv_id.replace('/', '_')
+        with self._lock:
+            thread_lock = self._key_locks.setdefault(lock_name, threading.Lock())
+        with thread_lock:
+            if not FCNTL_AVAILABLE:
+                yield
+                return
+            with open(self.locks_dir / f"{lock_name}.lock", 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+
+_default_store: Optional[PDFStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_pdf_store() -> PDFStore:
+    """获取进程内共享的PDF存储（首次调用时创建）"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            project_root = Path(__file__).parent.parent.parent.parent  # 回到项目根目录
+            store_dir = os.getenv('PDF_STORE_DIR') or str(project_root / "data" / "pdf_store")
+            _default_store = PDFStore(store_dir, max_size_mb=int(os.getenv('PDF_STORE_MAX_MB', '10240')))
+        return _default_store
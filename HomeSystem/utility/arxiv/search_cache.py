@@ -0,0 +1,178 @@
+"""
+ArXiv 搜索结果本地缓存
+
+按规范化后的查询参数缓存每一页已解析的结果，并保存响应的 ETag / Last-Modified，
+再次请求时发送条件请求，服务端返回 304 时直接使用缓存结果，无需重新下载和解析。
+同时记录每个查询最近一次看到的论文ID，用于“自上次运行以来”的增量搜索。
+
+数据存储在 SQLite 中（data/arxiv_cache/search_cache.sqlite3），结果以压缩 JSON 保存。
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+
+
+# 分页相关参数不参与查询标识，同一查询的不同页共享“已看到的论文”记录
+_PAGE_PARAMS = ("start", "max_results")
+
+
+def normalize_params(params: Dict[str, Any], include_page: bool = True) -> str:
+    """规范化查询参数（合并空白、按键排序），返回稳定的字符串表示"""
+    normalized = {}
+    for key, value in params.items():
+        if not include_page and key in _PAGE_PARAMS:
+            continue
+        if isinstance(value, str):
+            value = re.sub(r"\s+", " ", value).strip()
+        normalized[key] = value
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+
+
+def _hash_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ArxivSearchCache:
+    """ArXiv 搜索结果缓存（SQLite）"""
+
+    def __init__(self, db_path: Optional[str] = None, max_pages: int = 500,
+                 max_seen_ids: int = 200):
+        """
+        Args:
+            db_path: SQLite 文件路径，默认为项目根目录下的 data/arxiv_cache/search_cache.sqlite3
+            max_pages: 最多缓存的页数，超出时淘汰最久未更新的页
+            max_seen_ids: 每个查询保留的最近论文ID数量
+        """
+        if db_path is None:
+            project_root = Path(__file__).parent.parent.parent.parent  # 回到项目根目录
+            db_path = project_root / "data" / "arxiv_cache" / "search_cache.sqlite3"
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_pages = max_pages
+        self.max_seen_ids = max_seen_ids
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=30)
+
+    def _init_db(self):
+        with self._lock, self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_pages (
+                    cache_key TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    entries BLOB NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_pages_fetched_at ON search_pages(fetched_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_heads (
+                    query_key TEXT PRIMARY KEY,
+                    arxiv_ids TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    @staticmethod
+    def page_key(params: Dict[str, Any]) -> str:
+        """单页缓存键（包含分页参数）"""
+        return _hash_key(normalize_params(params, include_page=True))
+
+    @staticmethod
+    def query_key(params: Dict[str, Any]) -> str:
+        """查询标识（不含分页参数）"""
+        return _hash_key(normalize_params(params, include_page=False))
+
+    def get_page(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        获取缓存的页
+
+        Returns:
+            Optional[Dict]: {'etag', 'last_modified', 'entries'}，未命中时返回None
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT etag, last_modified, entries FROM search_pages WHERE cache_key = ?",
+                    (cache_key,)
+                ).fetchone()
+            if row is None:
+                return None
+            return {
+                'etag': row[0],
+                'last_modified': row[1],
+                'entries': json.loads(zlib.decompress(row[2]))
+            }
+        except Exception as e:
+            logger.warning(f"读取ArXiv搜索缓存失败: {e}")
+            return None
+
+    def put_page(self, cache_key: str, entries: List[Dict[str, Any]],
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """保存一页结果，并淘汰超出容量的旧页"""
+        try:
+            payload = zlib.compress(json.dumps(entries, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_pages (cache_key, etag, last_modified, entries, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cache_key, etag, last_modified, payload, time.time())
+                )
+                conn.execute(
+                    "DELETE FROM search_pages WHERE cache_key IN ("
+                    "SELECT cache_key FROM search_pages ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_pages,)
+                )
+        except Exception as e:
+            logger.warning(f"写入ArXiv搜索缓存失败: {e}")
+
+    def touch_page(self, cache_key: str):
+        """重新验证成功（304）时刷新页的更新时间"""
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute("UPDATE search_pages SET fetched_at = ? WHERE cache_key = ?",
+                             (time.time(), cache_key))
+        except Exception as e:
+            logger.warning(f"更新ArXiv搜索缓存失败: {e}")
+
+    def get_seen_ids(self, query_key: str) -> List[str]:
+        """获取某个查询最近一次看到的论文ID（按新到旧）"""
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute("SELECT arxiv_ids FROM seen_heads WHERE query_key = ?",
+                                   (query_key,)).fetchone()
+            return json.loads(row[0]) if row else []
+        except Exception as e:
+            logger.warning(f"读取已看到的论文记录失败: {e}")
+            return []
+
+    def update_seen_ids(self, query_key: str, new_ids: Iterable[str]):
+        """将本次新看到的论文ID合并到记录前部"""
+        new_ids = [arxiv_id for arxiv_id in new_ids if arxiv_id]
+        if not new_ids:
+            return
+        merged: List[str] = []
+        seen: Set[str] = set()
+        for arxiv_id in new_ids + self.get_seen_ids(query_key):
+            if arxiv_id not in seen:
+                seen.add(arxiv_id)
+                merged.append(arxiv_id)
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO seen_heads (query_key, arxiv_ids, updated_at) VALUES (?, ?, ?)",
+                    (query_key, json.dumps(merged[:self.max_seen_ids]), time.time())
+                )
+        except Exception as e:
+            logger.warning(f"保存已看到的论文记录失败: {e}")
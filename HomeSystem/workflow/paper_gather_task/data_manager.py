@@ -1003,4 +1003,80 @@ class PaperGatherDataManager:
             
         except Exception as e:
             logger.error(f"清理过期定时任务失败: {e}")
-            return 0
\ No newline at end of file
+            return 0
+    
+    # === 搜索时间水位管理功能 ===
+    
+    def get_search_watermark(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        获取任务的搜索时间水位
+        
+        Args:
+            task_id: 任务ID
+            
+        Returns:
+            水位字典（search_query, search_mode, field, timestamp, updated_at），不存在时返回None
+        """
+        try:
+            watermark_file = self.data_dir / "search_watermarks" / f"{task_id}.json"
+            if not watermark_file.exists():
+                return None
+            
+            with open(watermark_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+            
+        except Exception as e:
+            logger.error(f"获取任务 {task_id} 的搜索水位失败: {e}")
+            return None
+    
+    def save_search_watermark(self, task_id: str, watermark: Dict[str, Any]) -> bool:
+        """
+        保存任务的搜索时间水位
+        
+        Args:
+            task_id: 任务ID
+            watermark: 水位字典
+            
+        Returns:
+            保存是否成功
+        """
+        try:
+            watermarks_dir = self.data_dir / "search_watermarks"
+            watermarks_dir.mkdir(exist_ok=True)
+            
+            watermark_data = dict(watermark)
+            watermark_data["updated_at"] = datetime.now().isoformat()
+            
+            # 先写临时文件再替换，避免中断时留下损坏的水位
+            watermark_file = watermarks_dir / f"{task_id}.json"
+            temp_file = watermark_file.with_suffix(".json.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(watermark_data, f, ensure_ascii=False, indent=2, cls=CustomJSONEncoder)
+            os.replace(temp_file, watermark_file)
+            
+            logger.info(f"任务 {task_id} 搜索水位已更新: {watermark_data.get('timestamp')}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"保存任务 {task_id} 的搜索水位失败: {e}")
+            return False
+    
+    def delete_search_watermark(self, task_id: str) -> bool:
+        """
+        删除任务的搜索时间水位（下次运行将重新进行完整搜索）
+        
+        Args:
+            task_id: 任务ID
+            
+        Returns:
+            删除是否成功
+        """
+        try:
+            watermark_file = self.data_dir / "search_watermarks" / f"{task_id}.json"
+            if watermark_file.exists():
+                watermark_file.unlink()
+            return True
+            
+        except Exception as e:
+            logger.error(f"删除任务 {task_id} 的搜索水位失败: {e}")
+            return False
@@ -1,5 +1,7 @@
 import sys
 import os
+import time
+import asyncio
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
 from HomeSystem.graph.llm_factory import llm_factory
 from pydantic import BaseModel, Field
@@ -78,30 +80,90 @@ Focus on core requirement fulfillment as the primary criterion."""
         
         logger.info(f"Initialized abstract analysis LLM: {self.model_name}")
     
-    def analyze_abstract(self, abstract: str, user_requirements: str) -> AbstractAnalysisResult:
-        """Analyze a single paper abstract"""
+    def _build_messages(self, abstract: str, user_requirements: str) -> List[dict]:
+        """Build chat messages for a single abstract"""
         prompt = f"""User Requirements: {user_requirements}
 
 Paper Abstract: {abstract}
 
 Please analyze this abstract against the user requirements and provide your assessment."""
         
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _error_result(self, error: Exception) -> AbstractAnalysisResult:
+        """Conservative result used when analysis fails"""
+        return AbstractAnalysisResult(
+            is_relevant=False,
+            relevance_score=0.0,
+            justification=f"Analysis error: {str(error)}"
+        )
+    
+    def analyze_abstract(self, abstract: str, user_requirements: str) -> AbstractAnalysisResult:
+        """Analyze a single paper abstract"""
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-            
+            messages = self._build_messages(abstract, user_requirements)
             result = self.structured_llm.invoke(messages)
             return cast(AbstractAnalysisResult, result)
             
         except Exception as e:
             logger.error(f"Abstract analysis failed: {e}")
-            return AbstractAnalysisResult(
-                is_relevant=False,
-                relevance_score=0.0,
-                justification=f"Analysis error: {str(e)}"
+            return self._error_result(e)
+    
+    async def analyze_abstracts_batch(self, abstracts: List[str], user_requirements: str,
+                                      max_concurrency: int = 4) -> List[AbstractAnalysisResult]:
+        """
+        Analyze multiple abstracts concurrently
+        
+        Args:
+            abstracts: List of paper abstracts
+            user_requirements: User requirements description
+            max_concurrency: Maximum number of concurrent LLM calls
+            
+        Returns:
+            List[AbstractAnalysisResult]: Results in the same order as the input.
+            A failed item gets an error result without affecting the others.
+        """
+        if not abstracts:
+            return []
+        
+        max_concurrency = max(1, int(max_concurrency))
+        messages_list = [self._build_messages(abstract, user_requirements) for abstract in abstracts]
+        
+        try:
+            logger.info(f"Batch abstract analysis: {len(abstracts)} abstracts "
+                       f"(model: {self.model_name}, max concurrency: {max_concurrency})")
+            batch_start_time = time.time()
+            results = await self.structured_llm.abatch(
+                messages_list,
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
             )
+            logger.info(f"Batch abstract analysis finished in {time.time() - batch_start_time:.2f}s")
+            
+        except Exception as batch_error:
+            logger.warning(f"abatch failed, falling back to asyncio.gather: {batch_error}")
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def analyze_with_semaphore(messages):
+                async with semaphore:
+                    return await self.structured_llm.ainvoke(messages)
+            
+            results = await asyncio.gather(
+                *[analyze_with_semaphore(messages) for messages in messages_list],
+                return_exceptions=True
+            )
+        
+        final_results = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Abstract analysis failed: {result}")
+                final_results.append(self._error_result(result))
+            else:
+                final_results.append(cast(AbstractAnalysisResult, result))
+        return final_results
 
 
 class FullPaperAnalysisLLM:
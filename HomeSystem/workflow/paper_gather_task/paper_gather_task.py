@@ -1,10 +1,15 @@
 
 import asyncio
+import json
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from HomeSystem.workflow.task import Task
 from HomeSystem.utility.arxiv.arxiv import ArxivTool, ArxivResult, ArxivData, ArxivSearchMode
 from HomeSystem.workflow.paper_gather_task.llm_config import AbstractAnalysisLLM, AbstractAnalysisResult, FullPaperAnalysisLLM, FullAnalysisResult
+from HomeSystem.workflow.paper_gather_task.pipeline import PaperPipeline, PipelineStage
+from HomeSystem.workflow.paper_gather_task.screening_ledger import ScreeningLedger
+from HomeSystem.workflow.paper_gather_task.data_manager import PaperGatherDataManager
 from HomeSystem.integrations.database import DatabaseOperations, ArxivPaperModel
 from loguru import logger
 
@@ -41,9 +46,27 @@ class PaperGatherTaskConfig:
                  enable_remote_ocr: bool = False,
                  remote_ocr_endpoint: str = 'http://localhost:5001',
                  remote_ocr_timeout: int = 300,
+                 # 混合提取参数（相关性分析只对扫描页/乱码页执行结构化OCR）
+                 enable_hybrid_ocr: bool = True,
+                 # 部分下载参数（相关性分析只通过Range请求下载前若干页）
+                 enable_partial_pdf_fetch: bool = True,
                  # 视频分析相关参数
                  enable_video_analysis: bool = False,
                  video_analysis_model: Optional[str] = None,
+                 # 流水线并发相关参数
+                 pipeline_abstract_workers: int = 4,
+                 pipeline_download_workers: int = 3,
+                 pipeline_ocr_workers: int = 1,
+                 pipeline_analysis_workers: int = 1,
+                 pipeline_queue_size: int = 8,
+                 # 搜索结果缓存相关参数
+                 enable_search_cache: bool = True,
+                 # 时间水位增量搜索相关参数
+                 enable_watermark_search: bool = False,
+                 watermark_max_results: int = 500,
+                 # 摘要筛选记录相关参数
+                 enable_screening_ledger: bool = True,
+                 screening_ledger_ttl_days: int = 30,
                  # 任务追踪相关参数
                  task_name: Optional[str] = None,
                  task_id: Optional[str] = None,
@@ -79,11 +102,29 @@ class PaperGatherTaskConfig:
         self.enable_remote_ocr = enable_remote_ocr
         self.remote_ocr_endpoint = remote_ocr_endpoint
         self.remote_ocr_timeout = remote_ocr_timeout
+        # 混合提取配置（文本层合格的页面直接使用PyMuPDF文本，深度分析仍执行完整结构化OCR）
+        self.enable_hybrid_ocr = enable_hybrid_ocr
+        # 部分下载配置（文本达到 ocr_char_limit_for_analysis 即停止，完整PDF由深度分析阶段下载）
+        self.enable_partial_pdf_fetch = enable_partial_pdf_fetch
         # 视频分析配置
         self.enable_video_analysis = enable_video_analysis
         if not video_analysis_model:
             video_analysis_model = llm_model_name  # 默认使用主LLM模型
         self.video_analysis_model = video_analysis_model
+        # 流水线并发配置（每个阶段独立的工作者数量，摘要筛选为批量分析的最大并发数）
+        self.pipeline_abstract_workers = pipeline_abstract_workers
+        self.pipeline_download_workers = pipeline_download_workers
+        self.pipeline_ocr_workers = pipeline_ocr_workers
+        self.pipeline_analysis_workers = pipeline_analysis_workers
+        self.pipeline_queue_size = pipeline_queue_size
+        # 搜索结果缓存配置（条件请求，未变化的结果页不再重新下载解析）
+        self.enable_search_cache = enable_search_cache
+        # 时间水位增量搜索配置（按task_id记录已见过的最新论文时间，只请求更新的论文）
+        self.enable_watermark_search = enable_watermark_search
+        self.watermark_max_results = watermark_max_results
+        # 摘要筛选记录配置（未通过筛选的论文在有效期内不再重复调用LLM）
+        self.enable_screening_ledger = enable_screening_ledger
+        self.screening_ledger_ttl_days = screening_ledger_ttl_days
         # 新增搜索模式相关属性
         self.search_mode = search_mode
         self.start_year = start_year
@@ -150,11 +191,27 @@ class PaperGatherTaskConfig:
             'deep_analysis_model': self.deep_analysis_model,
             'vision_model': self.vision_model,
             'ocr_char_limit_for_analysis': self.ocr_char_limit_for_analysis,
+            'enable_hybrid_ocr': self.enable_hybrid_ocr,
+            'enable_partial_pdf_fetch': self.enable_partial_pdf_fetch,
             # 搜索模式相关配置
             'search_mode': self.search_mode.value,
             'start_year': self.start_year,
             'end_year': self.end_year,
             'after_year': self.after_year,
+            # 流水线并发相关配置
+            'pipeline_abstract_workers': self.pipeline_abstract_workers,
+            'pipeline_download_workers': self.pipeline_download_workers,
+            'pipeline_ocr_workers': self.pipeline_ocr_workers,
+            'pipeline_analysis_workers': self.pipeline_analysis_workers,
+            'pipeline_queue_size': self.pipeline_queue_size,
+            # 搜索结果缓存相关配置
+            'enable_search_cache': self.enable_search_cache,
+            # 时间水位增量搜索相关配置
+            'enable_watermark_search': self.enable_watermark_search,
+            'watermark_max_results': self.watermark_max_results,
+            # 摘要筛选记录相关配置
+            'enable_screening_ledger': self.enable_screening_ledger,
+            'screening_ledger_ttl_days': self.screening_ledger_ttl_days,
             # 任务追踪相关配置
             'task_name': self.task_name,
             'task_id': self.task_id,
@@ -179,7 +236,7 @@ class PaperGatherTask(Task):
         super().__init__("paper_gather", self.config.interval_seconds, delay_first_run=delay_first_run)
         
         # 初始化工具
-        self.arxiv_tool = ArxivTool()
+        self.arxiv_tool = ArxivTool(enable_search_cache=self.config.enable_search_cache)
         self.llm_analyzer = AbstractAnalysisLLM(
             model_name=self.config.abstract_analysis_model 
         )
@@ -189,6 +246,17 @@ class PaperGatherTask(Task):
         
         # 初始化数据库操作
         self.db_ops = DatabaseOperations()
+        self._db_write_lock = asyncio.Lock()
+        
+        # 最近一次流水线执行的各阶段统计
+        self.pipeline_stats: Dict[str, Any] = {}
+        
+        # 当前运行使用的摘要筛选记录（每次处理时按当前模型和需求创建）
+        self.screening_ledger: Optional[ScreeningLedger] = None
+        
+        # 时间水位：本次搜索得到的新水位，论文处理完成后才写入
+        self.data_manager: Optional[PaperGatherDataManager] = None
+        self._pending_watermark: Optional[Dict[str, Any]] = None
         
         logger.info(f"初始化论文收集任务，配置: {self.config.get_config_dict()}")
         
@@ -196,6 +264,9 @@ class PaperGatherTask(Task):
         """更新任务配置"""
         self.config.update_config(**kwargs)
         
+        if 'enable_search_cache' in kwargs:
+            self.arxiv_tool = ArxivTool(enable_search_cache=self.config.enable_search_cache)
+        
         # 如果更新了任何模型配置，需要重新初始化相应的LLM分析器
         model_related_keys = [
             'llm_model_name', 'abstract_analysis_model', 
@@ -233,7 +304,9 @@ class PaperGatherTask(Task):
             ArxivPaperModel: 如果存在返回论文模型，否则返回None
         """
         try:
-            existing_paper = self.db_ops.get_by_field(ArxivPaperModel, 'arxiv_id', arxiv_id)
+            existing_paper = await asyncio.to_thread(
+                self.db_ops.get_by_field, ArxivPaperModel, 'arxiv_id', arxiv_id
+            )
             if existing_paper:
                 logger.debug(f"论文已存在于数据库中: {arxiv_id}")
                 return existing_paper
@@ -244,6 +317,27 @@ class PaperGatherTask(Task):
             logger.error(f"检查论文数据库状态失败: {arxiv_id}, 错误: {e}")
             return None
     
+    async def check_papers_in_database(self, arxiv_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        批量检查论文是否已在数据库中（单次查询，仅读取判断所需的列）
+        
+        Args:
+            arxiv_ids: ArXiv论文ID列表
+            
+        Returns:
+            Dict: 已存在论文的 arxiv_id -> {processing_status, metadata}
+        """
+        try:
+            existing_papers = await asyncio.to_thread(
+                self.db_ops.get_by_field_values, ArxivPaperModel, 'arxiv_id', arxiv_ids,
+                ['processing_status', 'metadata']
+            )
+            logger.debug(f"批量查重: {len(arxiv_ids)} 篇中有 {len(existing_papers)} 篇已存在于数据库中")
+            return existing_papers
+        except Exception as e:
+            logger.error(f"批量检查论文数据库状态失败: {e}")
+            return {}
+    
     def _get_required_field(self, paper: ArxivData, source_field: str, target_field: str):
         """
         获取必需字段，如果不存在或为空则抛出异常
@@ -326,8 +420,9 @@ class PaperGatherTask(Task):
                 deep_analysis_updated_at=datetime.now() if deep_analysis_status else None
             )
             
-            # 保存到数据库
-            success = self.db_ops.create(paper_model)
+            # 保存到数据库（共享连接，写入串行化）
+            async with self._db_write_lock:
+                success = await asyncio.to_thread(self.db_ops.create, paper_model)
             if success:
                 logger.info(f"论文成功保存到数据库: {paper.arxiv_id} - {paper.title[:50]}...")
                 return True
@@ -352,22 +447,81 @@ class PaperGatherTask(Task):
         try:
             logger.info(f"使用搜索模式 {self.config.search_mode.value} 搜索论文: {query}")
             
+            # 时间水位：已有水位时只请求更新的论文，逐页获取直到越过水位
+            self._pending_watermark = None
+            timestamp_field = self._get_watermark_field()
+            newer_than = None
+            chunk_size = None
+            if timestamp_field:
+                newer_than = await asyncio.to_thread(self._load_search_watermark, query, timestamp_field)
+                if newer_than:
+                    logger.info(f"时间水位搜索: 只获取 {timestamp_field} 晚于 {newer_than} 的论文")
+                    chunk_size = num_results
+                    num_results = max(num_results, self.config.watermark_max_results)
+            
             # 根据配置的搜索模式选择搜索方法
-            results = self.arxiv_tool.searchPapersByMode(
+            results = await self.arxiv_tool.searchPapersByModeAsync(
                 query=query,
                 mode=self.config.search_mode,
                 num_results=num_results,
                 start_year=self.config.start_year,
                 end_year=self.config.end_year,
-                after_year=self.config.after_year
+                after_year=self.config.after_year,
+                newer_than=newer_than,
+                chunk_size=chunk_size
             )
             
+            if timestamp_field:
+                timestamps = [getattr(paper, timestamp_field, None) for paper in results]
+                timestamps = [timestamp for timestamp in timestamps if timestamp]
+                if timestamps:
+                    self._pending_watermark = {
+                        'search_query': query,
+                        'search_mode': self.config.search_mode.value,
+                        'field': timestamp_field,
+                        'timestamp': max(timestamps + ([newer_than] if newer_than else []))
+                    }
+            
             logger.info(f"找到 {results.num_results} 篇论文")
             return results
         except Exception as e:
             logger.error(f"搜索论文失败: {e}")
             return ArxivResult([])
     
+    def _get_watermark_field(self) -> Optional[str]:
+        """水位搜索使用的时间字段，未启用、缺少task_id或按相关性排序时返回None"""
+        if not self.config.enable_watermark_search:
+            return None
+        if not self.config.task_id:
+            logger.warning("时间水位搜索需要task_id，本次按普通搜索处理")
+            return None
+        return ArxivTool.get_mode_timestamp_field(self.config.search_mode)
+    
+    def _get_data_manager(self) -> PaperGatherDataManager:
+        if self.data_manager is None:
+            self.data_manager = PaperGatherDataManager()
+        return self.data_manager
+    
+    def _load_search_watermark(self, query: str, timestamp_field: str) -> Optional[str]:
+        """读取当前任务的水位，查询或搜索模式变化后旧水位不再适用"""
+        watermark = self._get_data_manager().get_search_watermark(self.config.task_id)
+        if not watermark:
+            return None
+        if (watermark.get('search_query') != query
+                or watermark.get('search_mode') != self.config.search_mode.value
+                or watermark.get('field') != timestamp_field):
+            logger.info("搜索条件已变化，忽略原有时间水位")
+            return None
+        return watermark.get('timestamp')
+    
+    async def _commit_search_watermark(self):
+        """论文处理完成后写入本次搜索的新水位"""
+        if not self._pending_watermark:
+            return
+        watermark = self._pending_watermark
+        self._pending_watermark = None
+        await asyncio.to_thread(self._get_data_manager().save_search_watermark, self.config.task_id, watermark)
+    
     async def analyze_paper_relevance(self, paper: ArxivData) -> AbstractAnalysisResult:
         """
         分析论文相关性
@@ -380,7 +534,8 @@ class PaperGatherTask(Task):
         """
         try:
             logger.debug(f"分析论文相关性: {paper.title[:50]}...")
-            result = self.llm_analyzer.analyze_abstract(
+            result = await asyncio.to_thread(
+                self.llm_analyzer.analyze_abstract,
                 abstract=paper.snippet,
                 user_requirements=self.config.user_requirements
             )
@@ -395,9 +550,142 @@ class PaperGatherTask(Task):
                 justification=f"分析错误: {str(e)}"
             )
     
+    def _has_usable_ocr(self, paper: ArxivData) -> bool:
+        """检查论文对象上是否已有可用的OCR结果"""
+        ocr_result = getattr(paper, 'ocr_result', None)
+        return bool(ocr_result and len(ocr_result.strip()) >= 500)
+    
+    async def _download_paper_pdf(self, paper: ArxivData):
+        """
+        下载论文PDF（已有可用OCR结果或部分下载已满足相关性分析时跳过）
+        
+        Args:
+            paper: 论文数据
+        """
+        if self._has_usable_ocr(paper):
+            return
+        
+        # 设置远程OCR环境变量（在PDF下载之前，确保元数据提取也使用正确的OCR）
+        if self.config.enable_remote_ocr:
+            import os
+            os.environ['REMOTE_OCR_ENDPOINT'] = self.config.remote_ocr_endpoint
+            os.environ['REMOTE_OCR_TIMEOUT'] = str(self.config.remote_ocr_timeout)
+            logger.info(f"🌐 使用远程OCR服务: {self.config.remote_ocr_endpoint} (超时: {self.config.remote_ocr_timeout}秒)")
+        else:
+            logger.debug("🔍 使用本地PaddleOCR处理")
+        
+        # 相关性分析只需要前 ocr_char_limit_for_analysis 个字符，先尝试只下载前若干页
+        if await self._fetch_partial_text(paper):
+            return
+        
+        # 下载PDF（这可能会触发元数据提取）
+        logger.debug("下载PDF中...")
+        await paper.downloadPdfAsync()
+    
+    async def _fetch_partial_text(self, paper: ArxivData) -> bool:
+        """
+        通过Range请求部分下载论文并提取文本，结果写入 paper.ocr_result
+        
+        Returns:
+            bool: 是否得到了足够用于相关性分析的文本
+        """
+        # 部分下载只能得到文本层，需要与混合提取一起启用
+        if not (getattr(self.config, 'enable_partial_pdf_fetch', True) and getattr(self.config, 'enable_hybrid_ocr', True)):
+            return False
+        
+        char_budget = getattr(self.config, 'ocr_char_limit_for_analysis', 10000)
+        ocr_result, status_info = await asyncio.to_thread(paper.fetchPartialText, char_budget=char_budget, max_pages=25)
+        if not ocr_result or len(ocr_result.strip()) < 500:
+            return False
+        
+        paper.ocr_status_info = status_info
+        logger.info(f"部分下载 {status_info['fetched_bytes'] / 1024 / 1024:.1f}/"
+                    f"{status_info['total_bytes'] / 1024 / 1024:.1f} MB 即满足相关性分析: {paper.arxiv_id}")
+        return True
+    
+    async def _ocr_paper(self, paper: ArxivData) -> Optional[str]:
+        """
+        对已下载的论文执行OCR并保存到标准路径
+        
+        Args:
+            paper: 论文数据（需已下载PDF）
+            
+        Returns:
+            str: OCR结果，如果结果过短或为空返回None
+        """
+        if self._has_usable_ocr(paper):
+            logger.debug(f"使用现有OCR结果进行完整论文分析: {len(paper.ocr_result)} 字符")
+            return paper.ocr_result
+        
+        # 准备统一的论文文件夹路径（使用相对路径）
+        from pathlib import Path
+        project_root = Path(__file__).parent.parent.parent.parent  # 回到项目根目录
+        paper_folder = project_root / "data" / "paper_analyze" / paper.arxiv_id
+        paper_folder.mkdir(parents=True, exist_ok=True)
+        paper_folder_str = str(paper_folder)
+        
+        # 执行OCR并保存到标准路径
+        # 混合提取时文本层合格的页面不经过结构化OCR，图表由深度分析阶段的完整OCR提取
+        logger.debug("执行OCR识别...")
+        ocr_result, status_info = await asyncio.to_thread(
+            paper.performOCR,
+            use_paddleocr=True,
+            use_remote_ocr=self.config.enable_remote_ocr,
+            auto_save=True,
+            save_path=paper_folder_str,
+            max_pages=25,
+            use_hybrid=getattr(self.config, 'enable_hybrid_ocr', True)
+        )
+        
+        # 确保OCR结果保存到paper对象
+        paper.ocr_result = ocr_result
+        paper.ocr_status_info = status_info
+        
+        if not ocr_result or len(ocr_result.strip()) < 500:
+            logger.warning(f"OCR结果过短或为空，跳过完整分析: {len(ocr_result) if ocr_result else 0} 字符")
+            return None
+        
+        logger.info(f"OCR成功 ({status_info['method']})，提取了 {status_info['char_count']} 字符，处理了 {status_info['processed_pages']}/{status_info['total_pages']} 页")
+        if status_info.get('saved_files'):
+            logger.info(f"OCR结果已保存到: {status_info['saved_files'][0]}")
+        if status_info['is_oversized']:
+            logger.info("检测到超长文档，可能是毕业论文或书籍")
+        return ocr_result
+    
+    async def _analyze_paper_content(self, paper: ArxivData, ocr_result: str) -> FullAnalysisResult:
+        """
+        使用LLM对OCR结果进行完整论文相关性分析
+        
+        Args:
+            paper: 论文数据
+            ocr_result: 论文OCR文本
+            
+        Returns:
+            FullAnalysisResult: 完整论文分析结果
+        """
+        # 限制用于LLM分析的字符数（默认10000字符）
+        analysis_char_limit = getattr(self.config, 'ocr_char_limit_for_analysis', 10000)
+        limited_ocr_result = ocr_result[:analysis_char_limit] if len(ocr_result) > analysis_char_limit else ocr_result
+        
+        if len(ocr_result) > analysis_char_limit:
+            logger.info(f"OCR结果过长({len(ocr_result)}字符)，限制为{analysis_char_limit}字符用于相关性分析")
+        
+        # 使用FullPaperAnalysisLLM进行分析
+        logger.debug("开始LLM分析完整论文...")
+        full_analysis = await asyncio.to_thread(
+            self.full_paper_analyzer.analyze_full_paper,
+            paper_content=limited_ocr_result,
+            user_requirements=self.config.user_requirements
+        )
+
+        logger.debug(f"完整论文分析，justification: {full_analysis.justification}")
+        
+        logger.info(f"完整论文分析完成 (评分: {full_analysis.relevance_score:.2f}): {paper.title[:50]}...")
+        return full_analysis
+    
     async def analyze_full_paper(self, paper: ArxivData) -> Optional[FullAnalysisResult]:
         """
-        分析完整论文的相关性
+        分析完整论文的相关性（下载PDF、OCR、LLM分析）
         
         Args:
             paper: 论文数据
@@ -408,74 +696,12 @@ class PaperGatherTask(Task):
         try:
             logger.info(f"开始完整论文分析: {paper.title[:50]}...")
             
-            # 准备统一的论文文件夹路径（使用相对路径）
-            import os
-            from pathlib import Path
-            project_root = Path(__file__).parent.parent.parent.parent  # 回到项目根目录
-            paper_folder = project_root / "data" / "paper_analyze" / paper.arxiv_id
-            paper_folder.mkdir(parents=True, exist_ok=True)
-            paper_folder_str = str(paper_folder)
-            
-            # 检查是否已有OCR结果
-            ocr_result = getattr(paper, 'ocr_result', None)
-            
-            if not ocr_result or len(ocr_result.strip()) < 500:
-                # 设置远程OCR环境变量（在PDF下载之前，确保元数据提取也使用正确的OCR）
-                if self.config.enable_remote_ocr:
-                    import os
-                    os.environ['REMOTE_OCR_ENDPOINT'] = self.config.remote_ocr_endpoint
-                    os.environ['REMOTE_OCR_TIMEOUT'] = str(self.config.remote_ocr_timeout)
-                    logger.info(f"🌐 使用远程OCR服务: {self.config.remote_ocr_endpoint} (超时: {self.config.remote_ocr_timeout}秒)")
-                else:
-                    logger.debug("🔍 使用本地PaddleOCR处理")
-                
-                # 下载PDF（这可能会触发元数据提取）
-                logger.debug("下载PDF中...")
-                paper.downloadPdf()
-                
-                # 执行OCR并保存到标准路径
-                logger.debug("执行OCR识别...")
-                ocr_result, status_info = paper.performOCR(
-                    use_paddleocr=True,
-                    use_remote_ocr=self.config.enable_remote_ocr,
-                    auto_save=True,
-                    save_path=paper_folder_str,
-                    max_pages=25
-                )
-                
-                # 确保OCR结果保存到paper对象
-                paper.ocr_result = ocr_result
-                paper.ocr_status_info = status_info
-                
-                if not ocr_result or len(ocr_result.strip()) < 500:
-                    logger.warning(f"OCR结果过短或为空，跳过完整分析: {len(ocr_result) if ocr_result else 0} 字符")
-                    return None
-                
-                logger.info(f"PaddleOCR成功，提取了 {status_info['char_count']} 字符，处理了 {status_info['processed_pages']}/{status_info['total_pages']} 页")
-                logger.info(f"OCR结果已保存到: {paper_folder_str}/{paper.arxiv_id}_paddleocr.md")
-                if status_info['is_oversized']:
-                    logger.info("检测到超长文档，可能是毕业论文或书籍")
-            else:
-                logger.debug(f"使用现有OCR结果进行完整论文分析: {len(ocr_result)} 字符")
-            
-            # 限制用于LLM分析的字符数（默认10000字符）
-            analysis_char_limit = getattr(self.config, 'ocr_char_limit_for_analysis', 10000)
-            limited_ocr_result = ocr_result[:analysis_char_limit] if len(ocr_result) > analysis_char_limit else ocr_result
-            
-            if len(ocr_result) > analysis_char_limit:
-                logger.info(f"OCR结果过长({len(ocr_result)}字符)，限制为{analysis_char_limit}字符用于相关性分析")
-            
-            # 使用FullPaperAnalysisLLM进行分析
-            logger.debug("开始LLM分析完整论文...")
-            full_analysis = self.full_paper_analyzer.analyze_full_paper(
-                paper_content=limited_ocr_result,
-                user_requirements=self.config.user_requirements
-            )
-
-            logger.debug(f"完整论文分析，justification: {full_analysis.justification}")
+            await self._download_paper_pdf(paper)
+            ocr_result = await self._ocr_paper(paper)
+            if not ocr_result:
+                return None
             
-            logger.info(f"完整论文分析完成 (评分: {full_analysis.relevance_score:.2f}): {paper.title[:50]}...")
-            return full_analysis
+            return await self._analyze_paper_content(paper, ocr_result)
             
         except Exception as e:
             logger.error(f"完整论文分析失败: {e}")
@@ -524,7 +750,8 @@ class PaperGatherTask(Task):
             }
             
             # 执行深度分析
-            result = analysis_service.perform_deep_analysis(
+            result = await asyncio.to_thread(
+                analysis_service.perform_deep_analysis,
                 arxiv_id=paper.arxiv_id,
                 paper_folder_path=paper_folder_str,
                 config=analysis_config,
@@ -561,116 +788,205 @@ class PaperGatherTask(Task):
             return False
     
     
-    async def process_papers(self, papers: ArxivResult) -> List[ArxivData]:
+    def _init_paper_flags(self, paper: ArxivData):
+        """初始化论文处理标记"""
+        setattr(paper, 'saved_to_database', False)
+        setattr(paper, 'full_paper_analyzed', False)
+        setattr(paper, 'deep_analysis_completed', False)  # 深度分析是否完成
+        setattr(paper, 'deep_analysis_success', True)  # 默认深度分析成功（如果不执行深度分析）
+    
+    def _mark_full_analysis_failed(self, paper: ArxivData):
+        """完整论文分析失败时，采用保守策略：标记为不相关，避免错误保存"""
+        logger.warning(f"完整论文分析失败，由于OCR不可用，标记为不相关: {paper.title[:50]}...")
+        paper.final_is_relevant = False
+        paper.final_relevance_score = 0.0
+        paper.full_paper_analysis_justification = f"Full paper analysis failed due to OCR service unavailability (abstract score was {paper.abstract_relevance_score:.2f})"
+        logger.info(f"OCR失败保护：论文 {paper.arxiv_id} 被标记为不相关，将不会保存到数据库")
+    
+    def _apply_existing_record(self, paper: ArxivData, record: Dict[str, Any]):
+        """用数据库中已有的记录标记论文，保持与数据库一致"""
+        metadata = record.get('metadata') or {}
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                metadata = {}
+        paper.final_is_relevant = record.get('processing_status') == 'completed'
+        paper.final_relevance_score = metadata.get('final_relevance_score', 0.0)
+        setattr(paper, 'saved_to_database', True)  # 已在数据库中的论文标记为已保存
+    
+    def _create_screening_ledger(self) -> Optional[ScreeningLedger]:
+        """按当前摘要分析模型和用户需求创建筛选记录，未启用时返回None"""
+        if not self.config.enable_screening_ledger:
+            return None
+        return ScreeningLedger(
+            model_name=self.llm_analyzer.model_name,
+            user_requirements=self.config.user_requirements,
+            ttl_seconds=int(self.config.screening_ledger_ttl_days * 24 * 3600)
+        )
+    
+    def _passes_abstract_screening(self, abstract_analysis: AbstractAnalysisResult) -> bool:
+        """摘要分析结果是否达到进入完整论文分析的要求"""
+        return abstract_analysis.is_relevant and abstract_analysis.relevance_score >= self.config.relevance_threshold
+    
+    def _record_screening_rejections(self, rejected: List[tuple]):
+        """记录未通过摘要筛选的论文，分析出错的结果不记录，下次运行会重新分析"""
+        if self.screening_ledger is None:
+            return
+        for paper, abstract_analysis in rejected:
+            if abstract_analysis.justification.startswith(("Analysis error:", "分析错误:")):
+                continue
+            self.screening_ledger.record(paper.arxiv_id, abstract_analysis)
+    
+    async def screen_papers(self, papers: List[ArxivData]) -> List[ArxivData]:
         """
-        处理论文数据，包括摘要相关性分析和完整论文分析
+        批量摘要相关性筛选
+        
+        所有摘要通过 analyze_abstracts_batch 并发分析，单篇失败不影响其他论文。
         
         Args:
-            papers: 搜索到的论文结果
+            papers: 待筛选的论文列表
             
         Returns:
-            List[ArxivData]: 处理后的论文对象列表
+            List[ArxivData]: 通过筛选、需要进行完整论文分析的论文（保持输入顺序）
         """
-        processed_papers = []
+        if not papers:
+            return []
         
         for paper in papers:
             logger.info(f"开始处理论文: {paper.arxiv_id} - {paper.title[:50]}...")
+        
+        try:
+            results = await self.llm_analyzer.analyze_abstracts_batch(
+                [paper.snippet for paper in papers],
+                user_requirements=self.config.user_requirements,
+                max_concurrency=self.config.pipeline_abstract_workers
+            )
+        except Exception as e:
+            logger.error(f"批量摘要分析失败: {e}")
+            results = [AbstractAnalysisResult(
+                is_relevant=False,
+                relevance_score=0.0,
+                justification=f"分析错误: {str(e)}"
+            ) for _ in papers]
+        
+        passed_papers = []
+        rejected = []
+        for paper, abstract_analysis in zip(papers, results):
+            logger.debug(f"abstract justification: {abstract_analysis.justification}")
+            if self._apply_abstract_analysis(paper, abstract_analysis):
+                passed_papers.append(paper)
+            else:
+                rejected.append((paper, abstract_analysis))
+        
+        if rejected:
+            await asyncio.to_thread(self._record_screening_rejections, rejected)
+        return passed_papers
+    
+    def _apply_abstract_analysis(self, paper: ArxivData, abstract_analysis: AbstractAnalysisResult) -> bool:
+        """将摘要分析结果写入论文对象，返回是否进入完整论文分析"""
+        # 将分析结果直接赋值给ArxivData对象
+        paper.abstract_is_relevant = abstract_analysis.is_relevant
+        paper.abstract_relevance_score = abstract_analysis.relevance_score
+        paper.abstract_analysis_justification = abstract_analysis.justification
+        paper.final_is_relevant = abstract_analysis.is_relevant
+        paper.final_relevance_score = abstract_analysis.relevance_score
+        
+        # 如果摘要相关性足够高，进入完整论文分析
+        if self._passes_abstract_screening(abstract_analysis):
+            logger.info(f"摘要相关性高 ({abstract_analysis.relevance_score:.2f})，开始完整论文分析: {paper.title[:50]}...")
+            return True
+        
+        logger.debug(f"摘要相关性低 ({abstract_analysis.relevance_score:.2f})，跳过完整分析: {paper.title[:50]}...")
+        # 当跳过完整分析时，也设置默认的justification字段
+        paper.full_paper_analysis_justification = getattr(paper, 'abstract_analysis_justification', 
+                                                         f"Full paper analysis skipped due to low abstract relevance score ({abstract_analysis.relevance_score:.2f})")
+        return False
+    
+    async def _stage_download(self, paper: ArxivData) -> bool:
+        """流水线阶段：下载PDF"""
+        try:
+            logger.info(f"开始完整论文分析: {paper.title[:50]}...")
+            await self._download_paper_pdf(paper)
+            return True
+        except Exception as e:
+            logger.error(f"完整论文分析失败: {e}")
+            self._mark_full_analysis_failed(paper)
+            return False
+    
+    async def _stage_ocr(self, paper: ArxivData) -> bool:
+        """流水线阶段：OCR识别"""
+        try:
+            ocr_result = await self._ocr_paper(paper)
+        except Exception as e:
+            logger.error(f"完整论文分析失败: {e}")
+            ocr_result = None
+        
+        if not ocr_result:
+            self._mark_full_analysis_failed(paper)
+            return False
+        return True
+    
+    async def _stage_analysis(self, paper: ArxivData) -> bool:
+        """流水线阶段：完整论文分析与深度分析"""
+        try:
+            full_analysis = await self._analyze_paper_content(paper, paper.ocr_result)
+        except Exception as e:
+            logger.error(f"完整论文分析失败: {e}")
+            full_analysis = None
+        
+        if not full_analysis:
+            self._mark_full_analysis_failed(paper)
+            return False
+        
+        paper.full_paper_analyzed = True
+        paper.full_paper_is_relevant = full_analysis.is_relevant
+        paper.full_paper_relevance_score = full_analysis.relevance_score
+        paper.full_paper_analysis_justification = full_analysis.justification
+        paper.final_is_relevant = full_analysis.is_relevant
+        paper.final_relevance_score = full_analysis.relevance_score
+        
+        if not full_analysis.is_relevant:
+            logger.info(f"完整论文分析判定不相关 (评分: {full_analysis.relevance_score:.2f}): {paper.title}")
+            return True
+        
+        logger.info(f"完整论文分析确认相关 (评分: {full_analysis.relevance_score:.2f}): {paper.title}")
+        
+        # 如果启用了深度分析且相关性评分足够高，则进行深度分析
+        # 此时OCR结果已经在OCR阶段准备好，不会重复执行
+        deep_analysis_enabled = getattr(self.config, 'enable_deep_analysis', True)
+        deep_analysis_threshold = getattr(self.config, 'deep_analysis_threshold', 0.8)
+        
+        if deep_analysis_enabled and full_analysis.relevance_score >= deep_analysis_threshold:
+            logger.info(f"相关性评分足够高 ({full_analysis.relevance_score:.2f})，开始深度分析: {paper.title[:50]}...")
             
-            # 初始化论文处理标记
-            setattr(paper, 'saved_to_database', False)
-            setattr(paper, 'full_paper_analyzed', False)
-            setattr(paper, 'deep_analysis_completed', False)  # 深度分析是否完成
-            setattr(paper, 'deep_analysis_success', True)  # 默认深度分析成功（如果不执行深度分析）
-            
-            # 第一步：检查论文是否已在数据库中
-            existing_paper = await self.check_paper_in_database(paper.arxiv_id)
-            
-            if existing_paper:
-                logger.info(f"论文已在数据库中，跳过处理: {paper.arxiv_id}")
-                # 从数据库中的数据创建ArxivData对象，保持一致性
-                paper.final_is_relevant = existing_paper.processing_status == 'completed'
-                paper.final_relevance_score = existing_paper.metadata.get('final_relevance_score', 0.0) if existing_paper.metadata else 0.0
-                setattr(paper, 'saved_to_database', True)  # 已在数据库中的论文标记为已保存
-                processed_papers.append(paper)
-                continue
-            
-            # 第二步：如果论文不在数据库中，进行摘要相关性分析
-            logger.debug(f"论文不在数据库中，开始分析: {paper.arxiv_id}")
-            abstract_analysis = await self.analyze_paper_relevance(paper)
+            # 重新计算论文文件夹路径（保持一致性）
+            from pathlib import Path
+            # For Docker: /app/HomeSystem/workflow/paper_gather_task/paper_gather_task.py -> /app (4 parents) -> /app/data
+            # For local: workflow/paper_gather_task/paper_gather_task.py -> project root (5 parents) -> project_root/data
+            project_root = Path(__file__).parent.parent.parent.parent
+            if not (project_root / "data").exists():
+                project_root = Path(__file__).parent.parent.parent.parent.parent
+            paper_folder = project_root / "data" / "paper_analyze" / paper.arxiv_id
+            paper_folder_str = str(paper_folder)
             
-            # 将分析结果直接赋值给ArxivData对象
-            paper.abstract_is_relevant = abstract_analysis.is_relevant
-            paper.abstract_relevance_score = abstract_analysis.relevance_score
-            paper.abstract_analysis_justification = abstract_analysis.justification
-            paper.final_is_relevant = abstract_analysis.is_relevant
-            paper.final_relevance_score = abstract_analysis.relevance_score
+            deep_analysis_success = await self.perform_deep_analysis(paper, paper_folder_str)
+            setattr(paper, 'deep_analysis_success', deep_analysis_success)
             
-            # 第三步：如果摘要相关性足够高，进行完整论文分析
-            if abstract_analysis.is_relevant and abstract_analysis.relevance_score >= self.config.relevance_threshold:
-                logger.info(f"摘要相关性高 ({abstract_analysis.relevance_score:.2f})，开始完整论文分析: {paper.title[:50]}...")
-                
-                # 执行完整论文分析（包含PDF下载和OCR）
-                full_analysis = await self.analyze_full_paper(paper)
-                
-                if full_analysis:
-                    paper.full_paper_analyzed = True
-                    paper.full_paper_is_relevant = full_analysis.is_relevant
-                    paper.full_paper_relevance_score = full_analysis.relevance_score
-                    paper.full_paper_analysis_justification = full_analysis.justification
-                    paper.final_is_relevant = full_analysis.is_relevant
-                    paper.final_relevance_score = full_analysis.relevance_score
-                    
-                    if full_analysis.is_relevant:
-                        logger.info(f"完整论文分析确认相关 (评分: {full_analysis.relevance_score:.2f}): {paper.title}")
-                        
-                        # 第四步：如果启用了深度分析且相关性评分足够高，则进行深度分析
-                        # 此时OCR结果已经在analyze_full_paper中准备好，不会重复执行
-                        deep_analysis_enabled = getattr(self.config, 'enable_deep_analysis', True)
-                        deep_analysis_threshold = getattr(self.config, 'deep_analysis_threshold', 0.8)
-                        
-                        if (deep_analysis_enabled and 
-                            full_analysis.relevance_score >= deep_analysis_threshold):
-                            
-                            logger.info(f"相关性评分足够高 ({full_analysis.relevance_score:.2f})，开始深度分析: {paper.title[:50]}...")
-                            
-                            # 重新计算论文文件夹路径（保持一致性）
-                            from pathlib import Path
-                            # For Docker: /app/HomeSystem/workflow/paper_gather_task/paper_gather_task.py -> /app (4 parents) -> /app/data
-                            # For local: workflow/paper_gather_task/paper_gather_task.py -> project root (5 parents) -> project_root/data
-                            project_root = Path(__file__).parent.parent.parent.parent
-                            if not (project_root / "data").exists():
-                                project_root = Path(__file__).parent.parent.parent.parent.parent
-                            paper_folder = project_root / "data" / "paper_analyze" / paper.arxiv_id
-                            paper_folder_str = str(paper_folder)
-                            
-                            deep_analysis_success = await self.perform_deep_analysis(paper, paper_folder_str)
-                            setattr(paper, 'deep_analysis_success', deep_analysis_success)
-                            
-                            if deep_analysis_success:
-                                logger.info(f"深度分析完成: {paper.title[:50]}...")
-                            else:
-                                logger.warning(f"深度分析失败: {paper.title[:50]}...")
-                        else:
-                            if not deep_analysis_enabled:
-                                logger.debug(f"深度分析功能已禁用，跳过深度分析: {paper.title[:50]}...")
-                            elif full_analysis.relevance_score < deep_analysis_threshold:
-                                logger.debug(f"相关性评分不足深度分析阈值 ({full_analysis.relevance_score:.2f} < {deep_analysis_threshold})，跳过深度分析: {paper.title[:50]}...")
-                    else:
-                        logger.info(f"完整论文分析判定不相关 (评分: {full_analysis.relevance_score:.2f}): {paper.title}")
-                else:
-                    logger.warning(f"完整论文分析失败，由于OCR不可用，标记为不相关: {paper.title[:50]}...")
-                    # OCR失败时，采用保守策略：标记为不相关，避免错误保存
-                    paper.final_is_relevant = False
-                    paper.final_relevance_score = 0.0
-                    paper.full_paper_analysis_justification = f"Full paper analysis failed due to OCR service unavailability (abstract score was {abstract_analysis.relevance_score:.2f})"
-                    logger.info(f"OCR失败保护：论文 {paper.arxiv_id} 被标记为不相关，将不会保存到数据库")
+            if deep_analysis_success:
+                logger.info(f"深度分析完成: {paper.title[:50]}...")
             else:
-                logger.debug(f"摘要相关性低 ({abstract_analysis.relevance_score:.2f})，跳过完整分析: {paper.title[:50]}...")
-                # 当跳过完整分析时，也设置默认的justification字段
-                paper.full_paper_analysis_justification = getattr(paper, 'abstract_analysis_justification', 
-                                                                 f"Full paper analysis skipped due to low abstract relevance score ({abstract_analysis.relevance_score:.2f})")
-            
-            # 第六步：如果论文符合要求（相关性达标），保存到数据库
+                logger.warning(f"深度分析失败: {paper.title[:50]}...")
+        elif not deep_analysis_enabled:
+            logger.debug(f"深度分析功能已禁用，跳过深度分析: {paper.title[:50]}...")
+        else:
+            logger.debug(f"相关性评分不足深度分析阈值 ({full_analysis.relevance_score:.2f} < {deep_analysis_threshold})，跳过深度分析: {paper.title[:50]}...")
+        return True
+    
+    async def _finalize_paper(self, paper: ArxivData):
+        """流水线收尾：保存符合要求的论文并释放内存"""
+        # 已在数据库中的论文无需重复保存
+        if not getattr(paper, 'saved_to_database', False):
             if paper.final_is_relevant and paper.final_relevance_score >= self.config.relevance_threshold:
                 logger.info(f"论文符合要求，保存到数据库: {paper.arxiv_id} (评分: {paper.final_relevance_score:.2f})")
                 save_success = await self.save_paper_to_database(paper)
@@ -679,21 +995,98 @@ class PaperGatherTask(Task):
                     setattr(paper, 'saved_to_database', True)
                 else:
                     logger.warning(f"论文保存到数据库失败，但继续处理: {paper.arxiv_id}")
-                    setattr(paper, 'saved_to_database', False)
             else:
                 logger.debug(f"论文不符合要求，不保存到数据库: {paper.arxiv_id} (相关性: {paper.final_is_relevant}, 评分: {paper.final_relevance_score:.2f})")
-                setattr(paper, 'saved_to_database', False)
-            
-            # 第七步：处理完毕释放内存
-            # 清理PDF和OCR结果，释放内存
-            if hasattr(paper, 'clearPdf'):
-                paper.clearPdf()
-            if hasattr(paper, 'clearOcrResult'):
-                paper.clearOcrResult()
-                
-            processed_papers.append(paper)
         
-        return processed_papers
+        # 处理完毕，清理PDF和OCR结果，释放内存
+        if hasattr(paper, 'clearPdf'):
+            paper.clearPdf()
+        if hasattr(paper, 'clearOcrResult'):
+            paper.clearOcrResult()
+    
+    async def process_papers(self, papers: ArxivResult) -> List[ArxivData]:
+        """
+        处理论文数据，包括摘要相关性分析和完整论文分析
+        
+        先批量查重过滤已入库论文，新论文再依次经过 摘要筛选 → PDF下载 → OCR →
+        完整/深度分析 四个阶段。摘要筛选对全部新论文批量并发执行，通过筛选的论文进入
+        下载、OCR、分析流水线，每个阶段有独立的工作者池，阶段之间通过有界队列传递。
+        单篇论文的处理逻辑与逐篇串行处理一致，返回顺序与输入顺序一致。
+        
+        Args:
+            papers: 搜索到的论文结果
+            
+        Returns:
+            List[ArxivData]: 处理后的论文对象列表
+        """
+        paper_list = list(papers)
+        for paper in paper_list:
+            self._init_paper_flags(paper)
+        
+        # 批量查重：在任何LLM调用之前，一次查询过滤掉数据库中已有的论文
+        existing_papers = await self.check_papers_in_database([paper.arxiv_id for paper in paper_list])
+        new_papers = []
+        for paper in paper_list:
+            record = existing_papers.get(paper.arxiv_id)
+            if record is not None:
+                logger.info(f"论文已在数据库中，跳过处理: {paper.arxiv_id}")
+                self._apply_existing_record(paper, record)
+            else:
+                new_papers.append(paper)
+        logger.info(f"批量查重完成: 共 {len(paper_list)} 篇，新论文 {len(new_papers)} 篇")
+        
+        # 摘要筛选记录：此前已被当前模型按相同需求筛掉的论文直接复用结果，不再调用LLM
+        # 记录中保存的是评分，是否通过按当前阈值重新判断，阈值调低后原记录会重新进入分析
+        self.screening_ledger = self._create_screening_ledger()
+        if self.screening_ledger is not None and new_papers:
+            screened = await asyncio.to_thread(
+                self.screening_ledger.lookup, [paper.arxiv_id for paper in new_papers]
+            )
+            pending_papers = []
+            for paper in new_papers:
+                abstract_analysis = screened.get(paper.arxiv_id)
+                if abstract_analysis is not None and not self._passes_abstract_screening(abstract_analysis):
+                    logger.debug(f"论文此前已未通过摘要筛选，跳过LLM分析: {paper.arxiv_id} (评分: {abstract_analysis.relevance_score:.2f})")
+                    self._apply_abstract_analysis(paper, abstract_analysis)
+                else:
+                    pending_papers.append(paper)
+            logger.info(f"摘要筛选记录命中 {len(new_papers) - len(pending_papers)} 篇，待分析 {len(pending_papers)} 篇")
+            new_papers = pending_papers
+        
+        # 摘要筛选：批量并发调用LLM
+        screening_start = time.perf_counter()
+        screened_count = len(new_papers)
+        new_papers = await self.screen_papers(new_papers)
+        screening_seconds = time.perf_counter() - screening_start
+        logger.info(f"摘要筛选完成: 分析 {screened_count} 篇，通过 {len(new_papers)} 篇，耗时 {screening_seconds:.2f}秒")
+        
+        pipeline = PaperPipeline(
+            stages=[
+                PipelineStage('download', self._stage_download, self.config.pipeline_download_workers),
+                PipelineStage('ocr', self._stage_ocr, self.config.pipeline_ocr_workers),
+                PipelineStage('analysis', self._stage_analysis, self.config.pipeline_analysis_workers),
+            ],
+            finalize=self._finalize_paper,
+            queue_size=self.config.pipeline_queue_size
+        )
+        
+        await pipeline.run(new_papers)
+        
+        self.pipeline_stats = pipeline.get_stats()
+        self.pipeline_stats['screening'] = {
+            'max_concurrency': self.config.pipeline_abstract_workers,
+            'processed': screened_count,
+            'passed': len(new_papers),
+            'wall_seconds': round(screening_seconds, 3),
+            'papers_per_minute': round(screened_count / screening_seconds * 60, 2) if screening_seconds > 0 else 0.0
+        }
+        for stage_name, stage_stats in self.pipeline_stats['stages'].items():
+            logger.info(f"流水线阶段 {stage_name}: 处理 {stage_stats['processed']} 篇, "
+                       f"通过 {stage_stats['passed']} 篇, "
+                       f"吞吐 {stage_stats['papers_per_minute']} 篇/分钟 "
+                       f"(工作者: {stage_stats['workers']})")
+        
+        return paper_list
         
     async def run(self) -> Dict[str, Any]:
         """执行论文收集逻辑"""
@@ -728,6 +1121,9 @@ class PaperGatherTask(Task):
             # 处理和分析论文
             processed_papers = await self.process_papers(search_results)
             
+            # 论文处理完成后才推进水位，处理中断时下次运行会重新获取这些论文
+            await self._commit_search_watermark()
+            
             # 统计相关论文（根据配置的阈值过滤，使用最终判断结果）
             relevant_papers = [p for p in processed_papers 
                              if p.final_is_relevant and p.final_relevance_score >= self.config.relevance_threshold]
@@ -759,6 +1155,7 @@ class PaperGatherTask(Task):
                 "relevant_papers": total_relevant_papers,
                 "saved_papers": total_saved_papers,
                 "analyzed_papers": len([p for p in processed_papers if hasattr(p, 'full_paper_analyzed') and p.full_paper_analyzed]),
+                "pipeline_stats": self.pipeline_stats,
                 "search_query": self.config.search_query,
                 "user_requirements": self.config.user_requirements,
                 "config": self.config.get_config_dict(),
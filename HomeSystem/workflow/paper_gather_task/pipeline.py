@@ -0,0 +1,170 @@
+"""
+论文处理流水线
+
+将论文处理拆分为多个阶段，每个阶段拥有独立的并发工作者池，
+阶段之间通过有界队列连接，下游处理变慢时上游会被自动阻塞（背压）。
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from loguru import logger
+
+
+class StageStats:
+    """单个流水线阶段的吞吐统计"""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.processed = 0  # 进入该阶段并处理完成的论文数
+        self.passed = 0  # 处理后继续进入下一阶段的论文数
+        self.failed = 0  # 处理时抛出异常的论文数
+        self.busy_seconds = 0.0  # 所有工作者累计处理耗时
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def record(self, started_at: float, finished_at: float, passed: bool, failed: bool):
+        """记录一次处理"""
+        self.processed += 1
+        if passed:
+            self.passed += 1
+        if failed:
+            self.failed += 1
+        self.busy_seconds += finished_at - started_at
+        if self.started_at is None or started_at < self.started_at:
+            self.started_at = started_at
+        if self.finished_at is None or finished_at > self.finished_at:
+            self.finished_at = finished_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典，吞吐量以 篇/分钟 计"""
+        wall_seconds = 0.0
+        if self.started_at is not None and self.finished_at is not None:
+            wall_seconds = self.finished_at - self.started_at
+        throughput = self.processed / wall_seconds * 60 if wall_seconds > 0 else 0.0
+        return {
+            'workers': self.workers,
+            'processed': self.processed,
+            'passed': self.passed,
+            'failed': self.failed,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'wall_seconds': round(wall_seconds, 3),
+            'avg_seconds_per_paper': round(self.busy_seconds / self.processed, 3) if self.processed else 0.0,
+            'papers_per_minute': round(throughput, 2)
+        }
+
+
+class PipelineStage:
+    """
+    流水线阶段定义
+
+    handler 接收一篇论文，返回 True 表示继续进入下一阶段，
+    返回 False 表示该论文处理结束（直接进入收尾步骤）。
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Awaitable[bool]], workers: int = 1):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.stats = StageStats(name, self.workers)
+
+
+class PaperPipeline:
+    """分阶段、有界并发的论文处理流水线"""
+
+    def __init__(self, stages: List[PipelineStage],
+                 finalize: Callable[[Any], Awaitable[None]],
+                 queue_size: int = 8):
+        """
+        Args:
+            stages: 按顺序排列的处理阶段
+            finalize: 论文离开流水线时调用的收尾协程（保存、释放内存等）
+            queue_size: 阶段间队列容量，队列满时上游阶段阻塞
+        """
+        if not stages:
+            raise ValueError("流水线至少需要一个阶段")
+        self.stages = stages
+        self.finalize = finalize
+        self.queue_size = max(1, int(queue_size))
+        self.total_seconds = 0.0
+
+    async def run(self, items: Sequence[Any]) -> List[Any]:
+        """
+        执行流水线
+
+        Args:
+            items: 待处理的论文列表
+
+        Returns:
+            List: 与输入顺序一致的论文列表（均已完成收尾）
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        workers = []
+        for index, stage in enumerate(self.stages):
+            out_queue = queues[index + 1] if index + 1 < len(queues) else None
+            for worker_id in range(stage.workers):
+                workers.append(asyncio.create_task(
+                    self._worker(stage, queues[index], out_queue),
+                    name=f"paper_pipeline_{stage.name}_{worker_id}"
+                ))
+
+        start_time = time.perf_counter()
+        try:
+            for item in items:
+                await queues[0].put(item)
+            # 论文只会向后流动，按顺序等待每个队列清空即可保证全部完成
+            for queue in queues:
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.total_seconds = time.perf_counter() - start_time
+
+        return items
+
+    async def _worker(self, stage: PipelineStage, in_queue: asyncio.Queue,
+                      out_queue: Optional[asyncio.Queue]):
+        """阶段工作者：从输入队列取论文，处理后送往下一阶段或收尾"""
+        while True:
+            item = await in_queue.get()
+            try:
+                started_at = time.perf_counter()
+                failed = False
+                try:
+                    proceed = await stage.handler(item)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"流水线阶段 {stage.name} 处理失败: {e}")
+                    proceed = False
+                    failed = True
+                stage.stats.record(started_at, time.perf_counter(), bool(proceed), failed)
+
+                if proceed and out_queue is not None:
+                    await out_queue.put(item)
+                else:
+                    await self._finalize(item)
+            finally:
+                in_queue.task_done()
+
+    async def _finalize(self, item: Any):
+        """执行收尾，异常不影响其他论文"""
+        try:
+            await self.finalize(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"流水线收尾失败: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取各阶段吞吐统计"""
+        return {
+            'total_seconds': round(self.total_seconds, 3),
+            'queue_size': self.queue_size,
+            'stages': {stage.name: stage.stats.to_dict() for stage in self.stages}
+        }
@@ -0,0 +1,90 @@
+"""
+摘要筛选记录
+
+记录未通过摘要筛选的论文，避免定时任务每次运行都把同样的摘要重新发给LLM。
+记录存储在Redis中，键由 模型名 + 用户需求哈希 + arxiv_id 组成，到期自动失效。
+"""
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict, List, Optional
+from loguru import logger
+
+from HomeSystem.integrations.database import CacheOperations
+from HomeSystem.workflow.paper_gather_task.llm_config import AbstractAnalysisResult
+
+
+class ScreeningLedger:
+    """摘要筛选结果记录（Redis，带TTL）"""
+
+    KEY_PREFIX = "paper_screening"
+
+    def __init__(self, model_name: str, user_requirements: str,
+                 ttl_seconds: int = 30 * 24 * 3600,
+                 cache_ops: Optional[CacheOperations] = None):
+        """
+        Args:
+            model_name: 摘要分析模型名称
+            user_requirements: 用户需求描述，需求变化后旧记录自动失效
+            ttl_seconds: 记录有效期（秒）
+            cache_ops: Redis缓存操作实例，默认新建
+        """
+        self.model_name = model_name
+        self.requirements_hash = hashlib.sha256((user_requirements or '').encode('utf-8')).hexdigest()[:16]
+        self.ttl_seconds = ttl_seconds
+        self.cache_ops = cache_ops or CacheOperations()
+
+    def _key(self, arxiv_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{self.model_name}:{self.requirements_hash}:{arxiv_id}"
+
+    def lookup(self, arxiv_ids: List[str]) -> Dict[str, AbstractAnalysisResult]:
+        """
+        批量查询筛选记录
+
+        Args:
+            arxiv_ids: ArXiv论文ID列表
+
+        Returns:
+            Dict: arxiv_id -> 记录的摘要分析结果（仅包含命中的论文）
+        """
+        arxiv_ids = [arxiv_id for arxiv_id in arxiv_ids if arxiv_id]
+        if not arxiv_ids:
+            return {}
+
+        cached_values = self.cache_ops.mget([self._key(arxiv_id) for arxiv_id in arxiv_ids])
+        results = {}
+        for arxiv_id, cached_value in zip(arxiv_ids, cached_values):
+            if not cached_value:
+                continue
+            try:
+                data = json.loads(cached_value)
+                results[arxiv_id] = AbstractAnalysisResult(
+                    is_relevant=data['is_relevant'],
+                    relevance_score=data['relevance_score'],
+                    justification=data['justification']
+                )
+            except Exception as e:
+                logger.warning(f"筛选记录解析失败: {arxiv_id}, 错误: {e}")
+        return results
+
+    def record(self, arxiv_id: str, result: AbstractAnalysisResult) -> bool:
+        """
+        记录一篇论文的摘要筛选结果
+
+        Args:
+            arxiv_id: ArXiv论文ID
+            result: 摘要分析结果
+
+        Returns:
+            bool: 是否记录成功
+        """
+        if not arxiv_id:
+            return False
+        value = json.dumps({
+            'is_relevant': result.is_relevant,
+            'relevance_score': result.relevance_score,
+            'justification': result.justification,
+            'model_name': self.model_name,
+            'screened_at': datetime.now().isoformat()
+        }, ensure_ascii=False)
+        return self.cache_ops.set(self._key(arxiv_id), value, expire=self.ttl_seconds)
@@ -5,7 +5,7 @@
 from flask import Blueprint, request, jsonify, send_file
 from services.task_service import paper_gather_service
 from services.paper_gather_service import paper_data_service
-from services.paper_explore_service import PaperService
+from services.paper_explore_service import PaperService, get_pool_manager
 from services.dify_service import DifyService
 from HomeSystem.integrations.paper_analysis.analysis_service import PaperAnalysisService
 from HomeSystem.integrations.database import ArxivPaperModel
@@ -629,29 +629,49 @@ def stop_task(task_id):
 
 @api_bp.route('/explore/search')
 def api_search():
-    """搜索论文"""
+    """
+    搜索论文
+    
+    翻页时传入上一次响应中的 cursor（不透明游标）继续，page 仅用于首次跳页；
+    total 默认为缓存或估算值（total_is_estimate 标明），exact_count=true 时精确统计。
+    """
     try:
         query = request.args.get('q', '').strip()
         task_name = request.args.get('task_name', '').strip()
         task_id = request.args.get('task_id', '').strip()
+        category = request.args.get('category', '').strip()
+        keyword = request.args.get('keyword', '').strip()
         page = int(request.args.get('page', 1))
         per_page = min(int(request.args.get('per_page', 10)), 50)
+        cursor = request.args.get('cursor', '').strip() or None
+        exact_count = request.args.get('exact_count', 'false').lower() == 'true'
         
-        papers, total = paper_explore_service.search_papers(
-            query=query,
-            task_name=task_name,
-            task_id=task_id,
-            page=page, 
-            per_page=per_page
-        )
+        try:
+            result = paper_explore_service.search_papers_page(
+                query=query,
+                category=category,
+                task_name=task_name,
+                task_id=task_id,
+                page=page, 
+                per_page=per_page,
+                cursor=cursor,
+                exact_count=exact_count,
+                keyword=keyword
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
+        total = result['total']
         return jsonify({
             'success': True,
-            'data': papers,
+            'data': result['papers'],
             'total': total,
+            'total_is_estimate': result['total_is_estimate'],
             'page': page,
             'per_page': per_page,
-            'total_pages': (total + per_page - 1) // per_page
+            'total_pages': (total + per_page - 1) // per_page,
+            'next_cursor': result['next_cursor'],
+            'has_more': result['next_cursor'] is not None
         })
     
     except Exception as e:
@@ -1485,21 +1505,16 @@ def get_about_system_status():
             }
         }
         
-        # 检测数据库连接状态
+        # 检测数据库连接状态（通过共享连接池，不额外建立连接）
+        pool_manager = get_pool_manager()
         try:
-            import psycopg2
-            postgres_config = {
-                'host': os.getenv('DB_HOST', 'localhost'),
-                'port': int(os.getenv('DB_PORT', 5432)),
-                'database': os.getenv('DB_NAME', 'homesystem'),
-                'user': os.getenv('DB_USER', 'homesystem'),
-                'password': os.getenv('DB_PASSWORD', 'homesystem123'),
-            }
-            conn = psycopg2.connect(**postgres_config)
-            conn.close()
+            with pool_manager.get_postgres_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
             status_info['database']['postgresql'] = True
         except Exception as e:
             logger.debug(f"PostgreSQL连接检测失败: {e}")
+        status_info['database']['postgresql_pool'] = pool_manager.get_pool_stats()
         
         # 检测Redis连接状态
         try:
@@ -3289,11 +3304,13 @@ def api_create_paper_from_pdf():
             success = db_ops.create(paper_model)
             
             if success:
-                # 复制临时PDF到标准目录（PDF目录已在前面创建）
+                # 临时PDF加入共享存储，再链接到标准目录（PDF目录已在前面创建）
                 try:
                     pdf_file_path = pdf_dir / f"{generated_id}.pdf"
-                    import shutil
-                    shutil.copy2(temp_pdf_path, pdf_file_path)
+                    from HomeSystem.utility.arxiv.pdf_store import get_pdf_store
+                    pdf_store = get_pdf_store()
+                    store_path = pdf_store.put_file(generated_id, 'upload', temp_pdf_path)
+                    pdf_store.link_to(store_path, str(pdf_file_path))
                     logger.info(f"PDF已保存到标准目录: {pdf_file_path}")
                     
                 except Exception as e:
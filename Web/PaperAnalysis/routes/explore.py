@@ -102,6 +102,7 @@ def papers():
         # 获取查询参数
         query = request.args.get('q', '').strip()
         category = request.args.get('category', '').strip()
+        keyword = request.args.get('keyword', '').strip()
         status = request.args.get('status', '').strip()
         # 支持多个任务名称
         task_names = request.args.getlist('task_name')
@@ -125,7 +126,8 @@ def papers():
             task_name=task_names,
             task_id=task_id,
             page=page, 
-            per_page=per_page
+            per_page=per_page,
+            keyword=keyword
         )
         
         # 计算分页信息
@@ -160,6 +162,7 @@ def papers():
                              pagination=pagination,
                              query=query,
                              category=category,
+                             keyword=keyword,
                              status=status,
                              task_names=task_names,
                              all_task_names=all_task_names,
@@ -231,19 +234,26 @@ def tasks():
 
 @explore_bp.route('/unassigned')
 def unassigned_papers():
-    """无任务论文管理页面"""
+    """无任务论文管理页面（"下一页"使用游标分页，跳页仍按页码）"""
     try:
         page = request.args.get('page', 1, type=int)
+        cursor = request.args.get('cursor', '').strip() or None
         per_page = 20
         
-        papers, total = paper_service.get_papers_without_tasks(page=page, per_page=per_page)
+        try:
+            result = paper_service.get_papers_without_tasks_page(page=page, per_page=per_page, cursor=cursor)
+        except ValueError:
+            # 游标失效（如链接被改动）时退回按页码分页
+            result = paper_service.get_papers_without_tasks_page(page=page, per_page=per_page)
+        papers, total = result['papers'], result['total']
         stats = paper_service.get_unassigned_papers_stats()
         
         pagination = {
             'page': page,
             'per_page': per_page,
             'total': total,
-            'pages': (total + per_page - 1) // per_page
+            'pages': (total + per_page - 1) // per_page,
+            'next_cursor': result['next_cursor']
         }
         
         return render_template('explore/unassigned.html', 
@@ -8,6 +8,10 @@ import json
 import re
 import sys
 import os
+import threading
+import base64
+import hashlib
+import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 try:
@@ -23,9 +27,39 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 # 导入 Dify 和 ArXiv 模块
 from HomeSystem.integrations.dify.dify_knowledge import DifyKnowledgeBaseClient, DifyKnowledgeBaseConfig
 from HomeSystem.utility.arxiv.arxiv import ArxivData
+from HomeSystem.integrations.database.connection import (
+    DatabaseManager as PooledDatabaseManager,
+    get_database_manager
+)
+from HomeSystem.integrations.database.models import ArxivPaperModel
+from HomeSystem.integrations.database.paper_search import PaperSearch
+from HomeSystem.integrations.database.paper_terms import keyword_filter_sql, category_filter_sql
+from HomeSystem.integrations.database.paper_stats import (
+    paper_stats_ready, get_stat, list_stats, list_recent_days, list_recent_months
+)
 
 logger = logging.getLogger(__name__)
 
+_pool_manager: Optional[PooledDatabaseManager] = None
+_pool_manager_lock = threading.Lock()
+
+
+def get_pool_manager() -> PooledDatabaseManager:
+    """
+    获取Web服务共享的连接池管理器
+    
+    配置与 HomeSystem 全局数据库管理器一致时直接复用其连接池，否则按 DATABASE_CONFIG 单独建立一个
+    """
+    global _pool_manager
+    with _pool_manager_lock:
+        if _pool_manager is None:
+            shared_manager = get_database_manager()
+            if shared_manager._config['postgres'] == DATABASE_CONFIG:
+                _pool_manager = shared_manager
+            else:
+                _pool_manager = PooledDatabaseManager(postgres_config=DATABASE_CONFIG)
+        return _pool_manager
+
 
 def datetime_serializer(obj):
     """JSON序列化时处理datetime对象"""
@@ -46,6 +80,66 @@ def datetime_deserializer(dct):
     return dct
 
 
+# 估算行数超过该值时列表总数使用 EXPLAIN 估算值，否则执行精确 COUNT(*)
+EXACT_COUNT_THRESHOLD = 10000
+# 列表总数缓存时间（秒），数据变更时随统计缓存一起清除
+COUNT_CACHE_TIMEOUT = 300
+
+
+def filter_fingerprint(where_clause: str, params: List[Any]) -> str:
+    """筛选条件指纹，用于总数缓存键和校验分页游标"""
+    raw = json.dumps([where_clause, params], default=str, ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def encode_page_cursor(fingerprint: str, values: List[Any]) -> str:
+    """
+    生成不透明的分页游标
+    
+    Args:
+        fingerprint: 筛选条件指纹，游标只能用于同一组筛选条件
+        values: 当前页最后一行的排序键值，如 [created_at, id]
+    """
+    payload = {'f': fingerprint[:12], 'k': [v.isoformat() if isinstance(v, datetime) else v for v in values]}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+# 游标排序键的 SQL 类型及对应的校验/解析函数
+_CURSOR_KEY_PARSERS = {
+    'real': float,
+    'timestamp': datetime.fromisoformat,
+    'uuid': lambda value: str(uuid.UUID(value)),
+}
+
+
+def decode_page_cursor(page_cursor: str, fingerprint: str, key_types: List[str]) -> List[Any]:
+    """
+    解析分页游标
+    
+    Args:
+        key_types: 各排序键的 SQL 类型（real / timestamp / uuid），用于校验游标中的值；
+            以 ? 结尾（如 timestamp?）表示该键允许为空
+    
+    Raises:
+        ValueError: 游标格式错误、值类型不正确或与当前筛选条件不匹配
+    """
+    try:
+        padded = page_cursor + '=' * (-len(page_cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        values = payload['k']
+    except Exception:
+        raise ValueError("无效的分页游标")
+    if payload.get('f') != fingerprint[:12] or not isinstance(values, list) or len(values) != len(key_types):
+        raise ValueError("分页游标与当前筛选条件不匹配")
+    try:
+        return [
+            None if value is None and key_type.endswith('?') else _CURSOR_KEY_PARSERS[key_type.rstrip('?')](value)
+            for key_type, value in zip(key_types, values)
+        ]
+    except (TypeError, ValueError, AttributeError):
+        raise ValueError("无效的分页游标")
+
+
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
     """
     清理文件名，移除或替换不安全的字符
@@ -107,10 +201,13 @@ def parse_keywords_string(keywords_string: str) -> List[str]:
     """
     解析关键词字符串，提取个别关键词
     
+    数据库已有 keyword_list 列时由 SQL 函数 arxiv_parse_terms 解析，本函数仅在尚未执行
+    add_paper_term_lists.py 迁移时用于研究洞察的关键词频率
+    
     支持格式:
-    - JSON数组格式: {"keyword1","keyword2","keyword3"}
-    - 逗号分隔格式: keyword1, keyword2, keyword3
-    - 分号分隔格式: keyword1; keyword2; keyword3
+    - PostgreSQL数组格式: {"keyword1","keyword2","keyword3"}
+    - JSON数组格式: ["keyword1","keyword2","keyword3"]
+    - 逗号/分号/竖线分隔格式: keyword1, keyword2, keyword3
     
     Args:
         keywords_string: 关键词字符串
@@ -121,33 +218,25 @@ def parse_keywords_string(keywords_string: str) -> List[str]:
     if not keywords_string:
         return []
     
-    # 确保可以安全调用 strip()
     keywords_string = str(keywords_string).strip()
     if not keywords_string:
         return []
     
-    # 处理JSON数组格式: {"keyword1","keyword2","keyword3"}
+    # 处理PostgreSQL数组格式: {"keyword1","keyword2","keyword3"}
     if keywords_string.startswith('{') and keywords_string.endswith('}'):
-        try:
-            # 移除外层大括号
-            content = keywords_string[1:-1]
-            # 使用正则表达式提取所有引号内的内容
-            keywords = re.findall(r'"([^"]*)"', content)
-            return [kw.strip() for kw in keywords if kw.strip()]
-        except Exception as e:
-            logger.warning(f"解析JSON格式关键词失败: {e}, 原始字符串: {keywords_string}")
+        keywords = re.findall(r'"([^"]*)"', keywords_string[1:-1])
+        return [kw.strip() for kw in keywords if kw.strip()]
     
-    # 处理标准JSON数组格式: ["keyword1","keyword2","keyword3"]
+    # 处理JSON数组格式: ["keyword1","keyword2","keyword3"]
     if keywords_string.startswith('[') and keywords_string.endswith(']'):
         try:
             keywords_list = json.loads(keywords_string)
             return [str(kw).strip() for kw in keywords_list if str(kw).strip()]
         except Exception as e:
-            logger.warning(f"解析标准JSON数组格式关键词失败: {e}, 原始字符串: {keywords_string}")
+            logger.warning(f"解析JSON数组格式关键词失败: {e}, 原始字符串: {keywords_string}")
     
-    # 处理逗号或分号分隔的格式
-    separators = [',', ';', '|']
-    for sep in separators:
+    # 处理逗号、分号或竖线分隔的格式
+    for sep in [',', ';', '|']:
         if sep in keywords_string:
             keywords = [kw.strip().strip('"\'') for kw in keywords_string.split(sep)]
             return [kw for kw in keywords if kw]
@@ -165,13 +254,12 @@ class DatabaseManager:
         self._redis_client = None
     
     def get_db_connection(self):
-        """获取数据库连接"""
-        try:
-            conn = psycopg2.connect(**self.db_config)
-            return conn
-        except Exception as e:
-            logger.error(f"数据库连接失败: {e}")
-            raise
+        """从共享连接池借出数据库连接（上下文管理器），退出时提交（异常时回滚）并归还"""
+        return get_pool_manager().get_postgres_connection()
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """获取共享连接池使用情况"""
+        return get_pool_manager().get_pool_stats()
     
     def get_redis_client(self):
         """获取Redis客户端"""
@@ -222,80 +310,129 @@ class PaperService:
         self.db_manager = DatabaseManager()
     
     def get_overview_stats(self) -> Dict[str, Any]:
-        """获取概览统计信息"""
-        cache_key = "overview_stats"
-        cached_data = self.db_manager.get_cache(cache_key)
-        if cached_data:
-            return cached_data
-        
+        """获取概览统计信息（读取增量统计表，未迁移时直接聚合论文表）"""
         with self.db_manager.get_db_connection() as conn:
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            if not paper_stats_ready(cursor):
+                return self._get_overview_stats_from_papers(cursor)
             
             # 基础统计
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_papers,
-                    COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed,
-                    COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending,
-                    COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed,
-                    COUNT(CASE WHEN research_objectives IS NOT NULL THEN 1 END) as structured_count
-                FROM arxiv_papers
-            """)
-            basic_stats = dict(cursor.fetchone())
+            total = get_stat(cursor, 'total')
+            basic_stats = {
+                'total_papers': total['paper_count'],
+                'completed': total['completed_count'],
+                'pending': total['pending_count'],
+                'failed': total['failed_count'],
+                'structured_count': total['structured_count']
+            }
             
             # 最近7天统计
-            cursor.execute("""
-                SELECT created_at::date as date, COUNT(*) as count
-                FROM arxiv_papers 
-                WHERE created_at >= NOW() - INTERVAL '7 days'
-                GROUP BY created_at::date 
-                ORDER BY date ASC
-            """)
-            recent_stats = [dict(row) for row in cursor.fetchall()]
+            recent_stats = [
+                {'date': row['day'], 'count': row['paper_count']}
+                for row in list_recent_days(cursor, 'created_day', 7)
+            ]
             
             # 热门分类
-            cursor.execute("""
-                SELECT categories, COUNT(*) as count
-                FROM arxiv_papers 
-                WHERE categories IS NOT NULL AND categories != ''
-                GROUP BY categories 
-                ORDER BY count DESC 
-                LIMIT 10
-            """)
-            popular_categories = [dict(row) for row in cursor.fetchall()]
+            popular_categories = [
+                {'categories': row['bucket'], 'count': row['paper_count']}
+                for row in list_stats(cursor, 'category', limit=10)
+            ]
             
-            stats = {
+            return {
                 'basic': basic_stats,
                 'recent': recent_stats,
                 'categories': popular_categories
             }
-            
-            # 缓存结果
-            self.db_manager.set_cache(cache_key, stats, timeout=900)
-            return stats
+    
+    def _get_overview_stats_from_papers(self, cursor) -> Dict[str, Any]:
+        """概览统计的全表聚合版本（统计表不可用时使用）"""
+        cursor.execute("""
+            SELECT 
+                COUNT(*) as total_papers,
+                COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed,
+                COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending,
+                COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed,
+                COUNT(CASE WHEN research_objectives IS NOT NULL THEN 1 END) as structured_count
+            FROM arxiv_papers
+        """)
+        basic_stats = dict(cursor.fetchone())
+        
+        cursor.execute("""
+            SELECT created_at::date as date, COUNT(*) as count
+            FROM arxiv_papers 
+            WHERE created_at >= NOW() - INTERVAL '7 days'
+            GROUP BY created_at::date 
+            ORDER BY date ASC
+        """)
+        recent_stats = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT categories, COUNT(*) as count
+            FROM arxiv_papers 
+            WHERE categories IS NOT NULL AND categories != ''
+            GROUP BY categories 
+            ORDER BY count DESC 
+            LIMIT 10
+        """)
+        popular_categories = [dict(row) for row in cursor.fetchall()]
+        
+        return {
+            'basic': basic_stats,
+            'recent': recent_stats,
+            'categories': popular_categories
+        }
     
     def search_papers(self, query: str = "", category: str = "", status: str = "",
                      task_name = None, task_id: str = "", 
-                     page: int = 1, per_page: int = 20) -> Tuple[List[Dict], int]:
-        """搜索论文"""
+                     page: int = 1, per_page: int = 20, keyword: str = "") -> Tuple[List[Dict], int]:
+        """搜索论文（按页码分页）"""
+        result = self.search_papers_page(query=query, category=category, status=status,
+                                         task_name=task_name, task_id=task_id,
+                                         page=page, per_page=per_page, keyword=keyword)
+        return result['papers'], result['total']
+    
+    def search_papers_page(self, query: str = "", category: str = "", status: str = "",
+                           task_name = None, task_id: str = "", page: int = 1, per_page: int = 20,
+                           cursor: Optional[str] = None, exact_count: bool = False,
+                           keyword: str = "") -> Dict[str, Any]:
+        """
+        搜索论文，支持游标分页
+        
+        传入 cursor 时按排序键 (created_at, id)（有搜索词时为 (相关度, created_at, id)）从上一页末尾继续，
+        不再使用 OFFSET，深翻页和第一页一样快；未传入时按 page 分页。
+        
+        Args:
+            category: 分类，按 category_list 精确匹配（多个分类用逗号分隔时需全部包含）
+            keyword: 关键词，按 keyword_list 精确匹配
+            cursor: 上一次返回的 next_cursor
+            exact_count: 是否强制精确统计总数，默认使用缓存或 EXPLAIN 估算值
+            
+        Returns:
+            Dict: papers, total, total_is_estimate, next_cursor（没有更多结果时为None）
+            
+        Raises:
+            ValueError: 游标无效或与筛选条件不匹配
+        """
         with self.db_manager.get_db_connection() as conn:
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            db_cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             
             # 构建WHERE条件
             conditions = []
             params = []
             
-            if query:
-                conditions.append("""
-                    (title ILIKE %s OR abstract ILIKE %s OR authors ILIKE %s 
-                     OR research_objectives ILIKE %s OR keywords ILIKE %s)
-                """)
-                query_param = f"%{query}%"
-                params.extend([query_param] * 5)
+            # 全文检索（search_vector GIN索引 + pg_trgm子串兜底）
+            search = PaperSearch(query) if query and query.strip() else None
+            if search:
+                conditions.append(search.where_sql)
+                params.extend(search.where_params)
             
             if category:
-                conditions.append("categories ILIKE %s")
-                params.append(f"%{category}%")
+                conditions.append(category_filter_sql())
+                params.append(category)
+            
+            if keyword:
+                conditions.append(keyword_filter_sql())
+                params.append(keyword)
             
             if status:
                 conditions.append("processing_status = %s")
@@ -331,36 +468,168 @@ class PaperService:
                 params.append(task_id)
             
             where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+            fingerprint = filter_fingerprint(where_clause, params)
+            
+            # 获取总数（缓存或估算）
+            total, total_is_estimate = self._count_papers(db_cursor, where_clause, params, exact=exact_count)
+            
+            # 有搜索词时按相关度排序，相关度相同的按时间；id 保证排序键唯一
+            rank_params = search.rank_params if search else []
+            sort_exprs = ([search.rank_sql] if search else []) + ["created_at", "id"]
+            sort_casts = (["real"] if search else []) + ["timestamp", "uuid"]
+            rank_select = f", {search.rank_sql} AS search_rank" if search else ""
+            order_by = "search_rank DESC, created_at DESC, id DESC" if search else "created_at DESC, id DESC"
+            
+            page_conditions = list(conditions)
+            page_params = rank_params + params
+            offset = 0
+            if cursor:
+                key_values = decode_page_cursor(cursor, fingerprint, sort_casts)
+                placeholders = ", ".join(f"%s::{cast}" for cast in sort_casts)
+                page_conditions.append(f"({', '.join(sort_exprs)}) < ({placeholders})")
+                page_params = page_params + rank_params + key_values
+            else:
+                offset = (page - 1) * per_page
+            page_where = "WHERE " + " AND ".join(page_conditions) if page_conditions else ""
             
-            # 获取总数
-            count_query = f"""
-                SELECT COUNT(*) as total
-                FROM arxiv_papers 
-                {where_clause}
-            """
-            cursor.execute(count_query, params)
-            total = cursor.fetchone()['total']
-            
-            # 获取分页数据
-            offset = (page - 1) * per_page
+            # 多取一行判断是否还有下一页
             data_query = f"""
-                SELECT arxiv_id, title, authors, categories, processing_status, 
-                       created_at, published_date, research_objectives, keywords, task_name, task_id,
-                       full_paper_relevance_score, full_paper_relevance_justification,
-                       dify_document_id, deep_analysis_result, deep_analysis_status
+                SELECT {ArxivPaperModel.select_columns()}{rank_select}
                 FROM arxiv_papers 
-                {where_clause}
-                ORDER BY created_at DESC
+                {page_where}
+                ORDER BY {order_by}
                 LIMIT %s OFFSET %s
             """
-            cursor.execute(data_query, params + [per_page, offset])
-            papers = [dict(row) for row in cursor.fetchall()]
+            db_cursor.execute(data_query, page_params + [per_page + 1, offset])
+            papers = [dict(row) for row in db_cursor.fetchall()]
+            has_more = len(papers) > per_page
+            papers = papers[:per_page]
+            
+            next_cursor = None
+            if has_more and papers:
+                last = papers[-1]
+                key_values = ([last['search_rank']] if search else []) + [last['created_at'], str(last['id'])]
+                next_cursor = encode_page_cursor(fingerprint, key_values)
+            
+            snippets = search.fetch_snippets(db_cursor, [paper['arxiv_id'] for paper in papers]) if search else {}
+            
+            # 添加搜索片段
+            if search:
+                for paper in papers:
+                    paper['search_snippet'] = snippets.get(paper['arxiv_id'])
+            
+            return {
+                'papers': papers,
+                'total': total,
+                'total_is_estimate': total_is_estimate,
+                'next_cursor': next_cursor
+            }
+    
+    def _count_papers(self, cursor, where_clause: str, params: List[Any], exact: bool = False) -> Tuple[int, bool]:
+        """
+        统计符合条件的论文数量
+        
+        先查缓存；未命中时用 EXPLAIN 估算行数，估算值较小时再执行精确 COUNT(*)。
+        
+        Args:
+            cursor: RealDictCursor
+            where_clause: 包含 WHERE 关键字的条件子句，可以为空
+            params: 条件参数
+            exact: 是否跳过缓存和估算，执行精确统计
+            
+        Returns:
+            Tuple[int, bool]: (总数, 是否为估算值)
+        """
+        cache_key = f"paper_count_{filter_fingerprint(where_clause, params)}"
+        if not exact:
+            cached = self.db_manager.get_cache(cache_key)
+            if cached:
+                return cached['total'], cached['estimated']
+            
+            cursor.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM arxiv_papers {where_clause}", params)
+            plan = cursor.fetchone()['QUERY PLAN']
+            estimate = int(plan[0]['Plan']['Plan Rows'])
+            if estimate > EXACT_COUNT_THRESHOLD:
+                self.db_manager.set_cache(cache_key, {'total': estimate, 'estimated': True}, timeout=COUNT_CACHE_TIMEOUT)
+                return estimate, True
+        
+        cursor.execute(f"SELECT COUNT(*) AS total FROM arxiv_papers {where_clause}", params)
+        total = cursor.fetchone()['total']
+        self.db_manager.set_cache(cache_key, {'total': total, 'estimated': False}, timeout=COUNT_CACHE_TIMEOUT)
+        return total, False
+    
+    def _list_papers_page(self, columns: str, condition: str, sort_keys: List[Tuple[str, str]],
+                          page: int = 1, per_page: int = 20, cursor: Optional[str] = None,
+                          exact_count: bool = False) -> Dict[str, Any]:
+        """
+        按排序键降序分页读取论文列表，支持游标分页（未分配论文、深度分析列表共用）
+        
+        Args:
+            columns: SELECT 的列
+            condition: 固定筛选条件（不含 WHERE 关键字，无参数）
+            sort_keys: 降序排序键 [(列名, 游标类型)]，最后一个须唯一（id）；
+                只有第一个键的类型可以以 ? 结尾，表示该列可为空（降序时空值排在最前）
+            cursor: 上一次返回的 next_cursor，未传入时按 page 分页
+            exact_count: 是否强制精确统计总数
             
-            # 为每个论文添加深度分析标识
-            for paper in papers:
-                paper['has_deep_analysis'] = bool(paper.get('deep_analysis_result'))
+        Returns:
+            Dict: papers, total, total_is_estimate, next_cursor（没有更多结果时为None）
             
-            return papers, total
+        Raises:
+            ValueError: 游标无效或与筛选条件不匹配
+        """
+        where_clause = f"WHERE ({condition})"
+        fingerprint = filter_fingerprint(where_clause, [])
+        sort_names = [name for name, _ in sort_keys]
+        placeholders = [f"%s::{key_type.rstrip('?')}" for _, key_type in sort_keys]
+        
+        with self.db_manager.get_db_connection() as conn:
+            db_cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            
+            # 获取总数（缓存或估算）
+            total, total_is_estimate = self._count_papers(db_cursor, where_clause, [], exact=exact_count)
+            
+            page_where = where_clause
+            page_params = []
+            offset = 0
+            if cursor:
+                key_values = decode_page_cursor(cursor, fingerprint, [key_type for _, key_type in sort_keys])
+                if key_values[0] is None:
+                    # 上一页停在空值段内：先取剩余的空值行，再取全部非空行
+                    page_where += (f" AND (({sort_names[0]} IS NULL AND ({', '.join(sort_names[1:])}) < "
+                                   f"({', '.join(placeholders[1:])})) OR {sort_names[0]} IS NOT NULL)")
+                    page_params = key_values[1:]
+                else:
+                    page_where += f" AND ({', '.join(sort_names)}) < ({', '.join(placeholders)})"
+                    page_params = key_values
+            else:
+                offset = (page - 1) * per_page
+            
+            # 多取一行判断是否还有下一页
+            db_cursor.execute(f"""
+                SELECT {columns}
+                FROM arxiv_papers 
+                {page_where}
+                ORDER BY {', '.join(f'{name} DESC' for name in sort_names)}
+                LIMIT %s OFFSET %s
+            """, page_params + [per_page + 1, offset])
+            papers = [dict(row) for row in db_cursor.fetchall()]
+            has_more = len(papers) > per_page
+            papers = papers[:per_page]
+            
+            next_cursor = None
+            if has_more and papers:
+                last = papers[-1]
+                next_cursor = encode_page_cursor(
+                    fingerprint, [str(last[name]) if name == 'id' else last[name] for name in sort_names]
+                )
+            
+            return {
+                'papers': papers,
+                'total': total,
+                'total_is_estimate': total_is_estimate,
+                'next_cursor': next_cursor
+            }
     
     def get_paper_detail(self, arxiv_id: str) -> Optional[Dict]:
         """获取论文详细信息，优先显示深度分析内容"""
@@ -379,6 +648,8 @@ class PaperService:
             paper = cursor.fetchone()
             if paper:
                 paper_dict = dict(paper)
+                # 检索向量只用于搜索，不缓存也不返回
+                paper_dict.pop('search_vector', None)
                 # 处理JSON字段
                 if isinstance(paper_dict.get('tags'), str):
                     try:
@@ -436,74 +707,103 @@ class PaperService:
         return None
     
     def get_statistics(self) -> Dict[str, Any]:
-        """获取详细统计信息"""
-        cache_key = "detailed_statistics"
-        cached_data = self.db_manager.get_cache(cache_key)
-        if cached_data:
-            return cached_data
-        
+        """获取详细统计信息（读取增量统计表，未迁移时直接聚合论文表）"""
         with self.db_manager.get_db_connection() as conn:
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            if not paper_stats_ready(cursor):
+                return self._get_statistics_from_papers(cursor)
             
-            # 按状态统计
-            cursor.execute("""
-                SELECT processing_status, COUNT(*) as count
-                FROM arxiv_papers 
-                GROUP BY processing_status
-                ORDER BY count DESC
-            """)
-            status_stats = [dict(row) for row in cursor.fetchall()]
+            # 按状态统计（统计表中空状态记为空字符串）
+            status_stats = [
+                {'processing_status': row['bucket'] or None, 'count': row['paper_count']}
+                for row in list_stats(cursor, 'status')
+            ]
             
             # 月度趋势
-            cursor.execute("""
-                SELECT 
-                    DATE_TRUNC('month', created_at) as month,
-                    COUNT(*) as count
-                FROM arxiv_papers 
-                WHERE created_at >= NOW() - INTERVAL '12 months'
-                GROUP BY DATE_TRUNC('month', created_at)
-                ORDER BY month
-            """)
-            monthly_trend = [dict(row) for row in cursor.fetchall()]
+            monthly_trend = [
+                {'month': row['month'], 'count': row['paper_count']}
+                for row in list_recent_months(cursor, 'created_day', 12)
+            ]
             
             # 分类分布
-            cursor.execute("""
-                SELECT 
-                    categories,
-                    COUNT(*) as count,
-                    COUNT(CASE WHEN research_objectives IS NOT NULL THEN 1 END) as structured_count
-                FROM arxiv_papers 
-                WHERE categories IS NOT NULL AND categories != ''
-                GROUP BY categories
-                ORDER BY count DESC
-                LIMIT 20
-            """)
-            category_distribution = [dict(row) for row in cursor.fetchall()]
+            category_distribution = [
+                {'categories': row['bucket'], 'count': row['paper_count'],
+                 'structured_count': row['structured_count']}
+                for row in list_stats(cursor, 'category', limit=20)
+            ]
             
             # 结构化字段完整性
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total,
-                    COUNT(research_background) as has_background,
-                    COUNT(research_objectives) as has_objectives,
-                    COUNT(methods) as has_methods,
-                    COUNT(key_findings) as has_findings,
-                    COUNT(conclusions) as has_conclusions,
-                    COUNT(keywords) as has_keywords
-                FROM arxiv_papers
-            """)
-            structured_completeness = dict(cursor.fetchone())
+            fields = {row['bucket']: row['paper_count'] for row in list_stats(cursor, 'field')}
+            structured_completeness = {
+                'total': get_stat(cursor, 'total')['paper_count'],
+                'has_background': fields.get('research_background', 0),
+                'has_objectives': fields.get('research_objectives', 0),
+                'has_methods': fields.get('methods', 0),
+                'has_findings': fields.get('key_findings', 0),
+                'has_conclusions': fields.get('conclusions', 0),
+                'has_keywords': fields.get('keywords', 0)
+            }
             
-            stats = {
+            return {
                 'status': status_stats,
                 'monthly': monthly_trend,
                 'categories': category_distribution,
                 'structured': structured_completeness
             }
-            
-            # 缓存结果
-            self.db_manager.set_cache(cache_key, stats, timeout=900)
-            return stats
+    
+    def _get_statistics_from_papers(self, cursor) -> Dict[str, Any]:
+        """详细统计的全表聚合版本（统计表不可用时使用）"""
+        cursor.execute("""
+            SELECT processing_status, COUNT(*) as count
+            FROM arxiv_papers 
+            GROUP BY processing_status
+            ORDER BY count DESC
+        """)
+        status_stats = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT 
+                DATE_TRUNC('month', created_at) as month,
+                COUNT(*) as count
+            FROM arxiv_papers 
+            WHERE created_at >= NOW() - INTERVAL '12 months'
+            GROUP BY DATE_TRUNC('month', created_at)
+            ORDER BY month
+        """)
+        monthly_trend = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT 
+                categories,
+                COUNT(*) as count,
+                COUNT(CASE WHEN research_objectives IS NOT NULL THEN 1 END) as structured_count
+            FROM arxiv_papers 
+            WHERE categories IS NOT NULL AND categories != ''
+            GROUP BY categories
+            ORDER BY count DESC
+            LIMIT 20
+        """)
+        category_distribution = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT 
+                COUNT(*) as total,
+                COUNT(research_background) as has_background,
+                COUNT(research_objectives) as has_objectives,
+                COUNT(methods) as has_methods,
+                COUNT(key_findings) as has_findings,
+                COUNT(conclusions) as has_conclusions,
+                COUNT(keywords) as has_keywords
+            FROM arxiv_papers
+        """)
+        structured_completeness = dict(cursor.fetchone())
+        
+        return {
+            'status': status_stats,
+            'monthly': monthly_trend,
+            'categories': category_distribution,
+            'structured': structured_completeness
+        }
     
     def get_research_insights(self) -> Dict[str, Any]:
         """获取研究洞察"""
@@ -515,28 +815,14 @@ class PaperService:
         with self.db_manager.get_db_connection() as conn:
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             
-            # 关键词分析 - 先获取所有关键词字符串，然后解析
-            cursor.execute("""
-                SELECT keywords
-                FROM arxiv_papers 
-                WHERE keywords IS NOT NULL AND keywords != ''
-            """)
-            raw_keywords = cursor.fetchall()
-            
-            # 解析关键词并统计频率
-            keyword_frequency = {}
-            for row in raw_keywords:
-                keywords_string = row['keywords']  # 使用字典键访问
-                parsed_keywords = parse_keywords_string(keywords_string)
-                for keyword in parsed_keywords:
-                    if keyword:  # 确保关键词不为空
-                        keyword_frequency[keyword] = keyword_frequency.get(keyword, 0) + 1
-            
-            # 按频率排序并限制数量
-            keyword_analysis = [
-                {'keywords': keyword, 'frequency': frequency}
-                for keyword, frequency in sorted(keyword_frequency.items(), key=lambda x: x[1], reverse=True)[:50]
-            ]
+            # 关键词频率（增量统计表的 keyword 维度，按 keyword_list 去重计数；未迁移时直接聚合论文表）
+            if paper_stats_ready(cursor):
+                keyword_analysis = [
+                    {'keywords': row['bucket'], 'frequency': row['paper_count']}
+                    for row in list_stats(cursor, 'keyword', limit=50)
+                ]
+            else:
+                keyword_analysis = self._get_keyword_frequency_from_papers(cursor, limit=50)
             
             # 研究方法趋势
             cursor.execute("""
@@ -574,6 +860,40 @@ class PaperService:
             self.db_manager.set_cache(cache_key, insights, timeout=1800)
             return insights
     
+    def _get_keyword_frequency_from_papers(self, cursor, limit: int = 50) -> List[Dict[str, Any]]:
+        """关键词频率的全表聚合版本（统计表不可用时使用），没有 keyword_list 列时在Python中解析关键词字符串"""
+        cursor.execute("""
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'arxiv_papers' AND column_name = 'keyword_list'
+            ) AS has_keyword_list
+        """)
+        if cursor.fetchone()['has_keyword_list']:
+            cursor.execute("""
+                SELECT kw as keywords, COUNT(*) as frequency
+                FROM arxiv_papers, unnest(keyword_list) kw
+                GROUP BY kw
+                ORDER BY frequency DESC, kw
+                LIMIT %s
+            """, (limit,))
+            return [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT keywords
+            FROM arxiv_papers 
+            WHERE keywords IS NOT NULL AND keywords != ''
+        """)
+        keyword_frequency = {}
+        for row in cursor.fetchall():
+            # 同一篇论文中重复的关键词只计一次，与 keyword_list 口径一致
+            for keyword in set(parse_keywords_string(row['keywords'])):
+                keyword_frequency[keyword] = keyword_frequency.get(keyword, 0) + 1
+        
+        return [
+            {'keywords': keyword, 'frequency': frequency}
+            for keyword, frequency in sorted(keyword_frequency.items(), key=lambda x: x[1], reverse=True)[:limit]
+        ]
+    
     def get_available_tasks(self) -> Dict[str, Any]:
         """获取可用的任务列表"""
         cache_key = "available_tasks"
@@ -724,11 +1044,8 @@ class PaperService:
         with self.db_manager.get_db_connection() as conn:
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             
-            cursor.execute("""
-                SELECT arxiv_id, title, authors, categories, processing_status, 
-                       created_at, task_name, task_id,
-                       full_paper_relevance_score, full_paper_relevance_justification,
-                       dify_document_id
+            cursor.execute(f"""
+                SELECT {ArxivPaperModel.select_columns()}
                 FROM arxiv_papers 
                 WHERE task_name = %s
                 ORDER BY created_at DESC
@@ -737,51 +1054,75 @@ class PaperService:
             return [dict(row) for row in cursor.fetchall()]
     
     def get_task_statistics(self) -> Dict[str, Any]:
-        """获取任务统计信息"""
-        cache_key = "task_statistics"
-        cached_data = self.db_manager.get_cache(cache_key)
-        if cached_data:
-            return cached_data
-        
+        """获取任务统计信息（读取增量统计表，未迁移时直接聚合论文表）"""
         with self.db_manager.get_db_connection() as conn:
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            if not paper_stats_ready(cursor):
+                return self._get_task_statistics_from_papers(cursor)
             
-            # 按任务名称统计
+            # 按任务名称统计，首篇/最新论文时间走 (task_name, created_at) 索引
             cursor.execute("""
                 SELECT 
-                    task_name,
-                    COUNT(*) as paper_count,
-                    COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed_count,
-                    COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending_count,
-                    COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed_count,
-                    MIN(created_at) as first_paper,
-                    MAX(created_at) as last_paper
-                FROM arxiv_papers 
-                WHERE task_name IS NOT NULL AND task_name != ''
-                GROUP BY task_name
-                ORDER BY paper_count DESC, task_name
+                    s.bucket as task_name,
+                    s.paper_count,
+                    s.completed_count,
+                    s.pending_count,
+                    s.failed_count,
+                    (SELECT MIN(created_at) FROM arxiv_papers p WHERE p.task_name = s.bucket) as first_paper,
+                    (SELECT MAX(created_at) FROM arxiv_papers p WHERE p.task_name = s.bucket) as last_paper
+                FROM arxiv_paper_stats s
+                WHERE s.dimension = 'task' AND s.paper_count > 0
+                ORDER BY s.paper_count DESC, s.bucket
             """)
             task_name_stats = [dict(row) for row in cursor.fetchall()]
             
             # 总体统计
-            cursor.execute("""
-                SELECT 
-                    COUNT(CASE WHEN task_name IS NOT NULL THEN 1 END) as papers_with_task,
-                    COUNT(CASE WHEN task_name IS NULL THEN 1 END) as papers_without_task,
-                    COUNT(DISTINCT task_name) as unique_task_names,
-                    COUNT(DISTINCT task_id) as unique_task_ids
-                FROM arxiv_papers
-            """)
-            overall_stats = dict(cursor.fetchone())
+            total_papers = get_stat(cursor, 'total')['paper_count']
+            papers_with_task = get_stat(cursor, 'flag', 'has_task_name')['paper_count']
+            overall_stats = {
+                'papers_with_task': papers_with_task,
+                'papers_without_task': total_papers - papers_with_task,
+                'unique_task_names': len(task_name_stats),
+                'unique_task_ids': len(list_stats(cursor, 'task_id'))
+            }
             
-            stats = {
+            return {
                 'task_name_stats': task_name_stats,
                 'overall': overall_stats
             }
-            
-            # 缓存结果
-            self.db_manager.set_cache(cache_key, stats, timeout=600)
-            return stats
+    
+    def _get_task_statistics_from_papers(self, cursor) -> Dict[str, Any]:
+        """任务统计的全表聚合版本（统计表不可用时使用）"""
+        cursor.execute("""
+            SELECT 
+                task_name,
+                COUNT(*) as paper_count,
+                COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed_count,
+                COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending_count,
+                COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed_count,
+                MIN(created_at) as first_paper,
+                MAX(created_at) as last_paper
+            FROM arxiv_papers 
+            WHERE task_name IS NOT NULL AND task_name != ''
+            GROUP BY task_name
+            ORDER BY paper_count DESC, task_name
+        """)
+        task_name_stats = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT 
+                COUNT(CASE WHEN task_name IS NOT NULL THEN 1 END) as papers_with_task,
+                COUNT(CASE WHEN task_name IS NULL THEN 1 END) as papers_without_task,
+                COUNT(DISTINCT task_name) as unique_task_names,
+                COUNT(DISTINCT task_id) as unique_task_ids
+            FROM arxiv_papers
+        """)
+        overall_stats = dict(cursor.fetchone())
+        
+        return {
+            'task_name_stats': task_name_stats,
+            'overall': overall_stats
+        }
     
     def _clear_task_related_cache(self):
         """清除任务相关的缓存"""
@@ -790,13 +1131,14 @@ class PaperService:
             try:
                 keys_to_delete = [
                     "available_tasks",
-                    "available_tasks_migration",
-                    "task_statistics", 
-                    "overview_stats",
-                    "unassigned_papers_stats"
+                    "available_tasks_migration"
                 ]
                 for key in keys_to_delete:
                     redis_client.delete(key)
+                
+                # 任务分配变化会影响列表总数
+                for key in redis_client.scan_iter(match="paper_count_*"):
+                    redis_client.delete(key)
             except Exception as e:
                 logger.warning(f"清除缓存失败: {e}")
     
@@ -805,15 +1147,11 @@ class PaperService:
         redis_client = self.db_manager.get_redis_client()
         if redis_client:
             try:
-                # 删除统计相关缓存
+                # 删除统计相关缓存（计数类统计读取增量统计表，不再缓存）
                 keys_to_delete = [
-                    "overview_stats",
-                    "detailed_statistics",
                     "research_insights",
                     "available_tasks",
-                    "available_tasks_migration",
-                    "task_statistics",
-                    "unassigned_papers_stats"
+                    "available_tasks_migration"
                 ]
                 for key in keys_to_delete:
                     redis_client.delete(key)
@@ -821,38 +1159,38 @@ class PaperService:
                 # 删除论文详情缓存 (使用模式匹配)
                 for key in redis_client.scan_iter(match="paper_detail_*"):
                     redis_client.delete(key)
+                
+                # 删除列表总数缓存
+                for key in redis_client.scan_iter(match="paper_count_*"):
+                    redis_client.delete(key)
                     
             except Exception as e:
                 logger.warning(f"清除缓存失败: {e}")
     
     def get_papers_without_tasks(self, page: int = 1, per_page: int = 20) -> Tuple[List[Dict], int]:
-        """获取没有分配任务的论文"""
-        with self.db_manager.get_db_connection() as conn:
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            
-            # 获取总数
-            cursor.execute("""
-                SELECT COUNT(*) as total
-                FROM arxiv_papers 
-                WHERE task_name IS NULL OR task_name = ''
-            """)
-            total = cursor.fetchone()['total']
-            
-            # 获取分页数据
-            offset = (page - 1) * per_page
-            cursor.execute("""
-                SELECT arxiv_id, title, authors, categories, processing_status, 
-                       created_at, published_date, research_objectives, keywords, task_name, task_id,
-                       full_paper_relevance_score, full_paper_relevance_justification,
-                       dify_document_id
-                FROM arxiv_papers 
-                WHERE task_name IS NULL OR task_name = ''
-                ORDER BY created_at DESC
-                LIMIT %s OFFSET %s
-            """, (per_page, offset))
+        """获取没有分配任务的论文（按页码分页）"""
+        result = self.get_papers_without_tasks_page(page=page, per_page=per_page)
+        return result['papers'], result['total']
+    
+    def get_papers_without_tasks_page(self, page: int = 1, per_page: int = 20, cursor: Optional[str] = None,
+                                      exact_count: bool = False) -> Dict[str, Any]:
+        """
+        获取没有分配任务的论文，支持游标分页
+        
+        按 (created_at, id) 降序，传入 cursor 时从上一页末尾继续，不再使用 OFFSET。
+        
+        Returns:
+            Dict: papers, total, total_is_estimate, next_cursor（没有更多结果时为None）
             
-            papers = [dict(row) for row in cursor.fetchall()]
-            return papers, total
+        Raises:
+            ValueError: 游标无效
+        """
+        return self._list_papers_page(
+            ArxivPaperModel.select_columns(),
+            "task_name IS NULL OR task_name = ''",
+            [('created_at', 'timestamp'), ('id', 'uuid')],
+            page=page, per_page=per_page, cursor=cursor, exact_count=exact_count
+        )
     
     def assign_task_to_paper(self, arxiv_id: str, task_name: str, task_id: str = None) -> bool:
         """为单个论文分配任务"""
@@ -910,59 +1248,78 @@ class PaperService:
             return 0
     
     def get_unassigned_papers_stats(self) -> Dict[str, Any]:
-        """获取无任务论文统计信息"""
-        cache_key = "unassigned_papers_stats"
-        cached_data = self.db_manager.get_cache(cache_key)
-        if cached_data:
-            return cached_data
-        
+        """获取无任务论文统计信息（读取增量统计表，未迁移时直接聚合论文表）"""
         with self.db_manager.get_db_connection() as conn:
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            if not paper_stats_ready(cursor):
+                return self._get_unassigned_papers_stats_from_papers(cursor)
             
             # 基础统计
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_unassigned,
-                    COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed_unassigned,
-                    COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending_unassigned,
-                    COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed_unassigned
-                FROM arxiv_papers
-                WHERE task_name IS NULL OR task_name = ''
-            """)
-            basic_stats = dict(cursor.fetchone())
+            status_counts = {row['bucket']: row['paper_count'] for row in list_stats(cursor, 'unassigned_status')}
+            basic_stats = {
+                'total_unassigned': sum(status_counts.values()),
+                'completed_unassigned': status_counts.get('completed', 0),
+                'pending_unassigned': status_counts.get('pending', 0),
+                'failed_unassigned': status_counts.get('failed', 0)
+            }
             
             # 按分类统计无任务论文
-            cursor.execute("""
-                SELECT categories, COUNT(*) as count
-                FROM arxiv_papers 
-                WHERE (task_name IS NULL OR task_name = '') 
-                  AND categories IS NOT NULL AND categories != ''
-                GROUP BY categories 
-                ORDER BY count DESC 
-                LIMIT 10
-            """)
-            category_stats = [dict(row) for row in cursor.fetchall()]
+            category_stats = [
+                {'categories': row['bucket'], 'count': row['paper_count']}
+                for row in list_stats(cursor, 'unassigned_category', limit=10)
+            ]
             
             # 最近无任务论文趋势
-            cursor.execute("""
-                SELECT created_at::date as date, COUNT(*) as count
-                FROM arxiv_papers 
-                WHERE (task_name IS NULL OR task_name = '') 
-                  AND created_at >= NOW() - INTERVAL '7 days'
-                GROUP BY created_at::date 
-                ORDER BY date DESC
-            """)
-            recent_stats = [dict(row) for row in cursor.fetchall()]
+            recent_stats = [
+                {'date': row['day'], 'count': row['paper_count']}
+                for row in list_recent_days(cursor, 'unassigned_day', 7, descending=True)
+            ]
             
-            stats = {
+            return {
                 'basic': basic_stats,
                 'categories': category_stats,
                 'recent': recent_stats
             }
-            
-            # 缓存结果
-            self.db_manager.set_cache(cache_key, stats, timeout=600)
-            return stats
+    
+    def _get_unassigned_papers_stats_from_papers(self, cursor) -> Dict[str, Any]:
+        """无任务论文统计的全表聚合版本（统计表不可用时使用）"""
+        cursor.execute("""
+            SELECT 
+                COUNT(*) as total_unassigned,
+                COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed_unassigned,
+                COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending_unassigned,
+                COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed_unassigned
+            FROM arxiv_papers
+            WHERE task_name IS NULL OR task_name = ''
+        """)
+        basic_stats = dict(cursor.fetchone())
+        
+        cursor.execute("""
+            SELECT categories, COUNT(*) as count
+            FROM arxiv_papers 
+            WHERE (task_name IS NULL OR task_name = '') 
+              AND categories IS NOT NULL AND categories != ''
+            GROUP BY categories 
+            ORDER BY count DESC 
+            LIMIT 10
+        """)
+        category_stats = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT created_at::date as date, COUNT(*) as count
+            FROM arxiv_papers 
+            WHERE (task_name IS NULL OR task_name = '') 
+              AND created_at >= NOW() - INTERVAL '7 days'
+            GROUP BY created_at::date 
+            ORDER BY date DESC
+        """)
+        recent_stats = [dict(row) for row in cursor.fetchall()]
+        
+        return {
+            'basic': basic_stats,
+            'categories': category_stats,
+            'recent': recent_stats
+        }
     
     def update_paper_relevance(self, arxiv_id: str, relevance_score: float = None, 
                               relevance_justification: str = None) -> bool:
@@ -1438,11 +1795,7 @@ class PaperService:
                     SELECT deep_analysis_status as status,
                            deep_analysis_created_at as created_at,
                            deep_analysis_updated_at as updated_at,
-                           CASE 
-                               WHEN deep_analysis_result IS NOT NULL 
-                               THEN LENGTH(deep_analysis_result) 
-                               ELSE 0 
-                           END as result_length
+                           COALESCE(deep_analysis_length, 0) as result_length
                     FROM arxiv_papers 
                     WHERE arxiv_id = %s
                 """, (arxiv_id,))
@@ -1533,41 +1886,40 @@ class PaperService:
             Tuple: (论文列表, 总数量)
         """
         try:
-            offset = (page - 1) * per_page
-            
-            with self.db_manager.get_db_connection() as conn:
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-                
-                # 获取总数
-                cursor.execute("""
-                    SELECT COUNT(*) as total
-                    FROM arxiv_papers 
-                    WHERE deep_analysis_result IS NOT NULL 
-                    AND deep_analysis_status = 'completed'
-                """)
-                total = cursor.fetchone()['total']
-                
-                # 获取分页数据
-                cursor.execute("""
-                    SELECT arxiv_id, title, authors, categories, published_date,
-                           deep_analysis_status, deep_analysis_created_at, deep_analysis_updated_at,
-                           LENGTH(deep_analysis_result) as result_length,
-                           task_name, processing_status
-                    FROM arxiv_papers 
-                    WHERE deep_analysis_result IS NOT NULL 
-                    AND deep_analysis_status = 'completed'
-                    ORDER BY deep_analysis_updated_at DESC
-                    LIMIT %s OFFSET %s
-                """, (per_page, offset))
-                
-                papers = [dict(row) for row in cursor.fetchall()]
-                
-                return papers, total
+            result = self.get_papers_with_analysis_page(page=page, per_page=per_page)
+            return result['papers'], result['total']
                 
         except Exception as e:
             logger.error(f"Failed to get papers with analysis: {e}")
             return [], 0
     
+    def get_papers_with_analysis_page(self, page: int = 1, per_page: int = 20, cursor: Optional[str] = None,
+                                      exact_count: bool = False) -> Dict[str, Any]:
+        """
+        获取已有深度分析结果的论文列表，支持游标分页
+        
+        按 (deep_analysis_updated_at, id) 降序，传入 cursor 时从上一页末尾继续，不再使用 OFFSET。
+        
+        Returns:
+            Dict: papers, total, total_is_estimate, next_cursor（没有更多结果时为None）
+            
+        Raises:
+            ValueError: 游标无效
+        """
+        result = self._list_papers_page(
+            """arxiv_id, title, authors, categories, published_date,
+                   deep_analysis_status, deep_analysis_created_at, deep_analysis_updated_at,
+                   deep_analysis_length as result_length,
+                   task_name, processing_status, id""",
+            "deep_analysis_result IS NOT NULL AND deep_analysis_status = 'completed'",
+            [('deep_analysis_updated_at', 'timestamp?'), ('id', 'uuid')],
+            page=page, per_page=per_page, cursor=cursor, exact_count=exact_count
+        )
+        # id 只用于生成游标
+        for paper in result['papers']:
+            paper.pop('id', None)
+        return result
+    
     def delete_analysis_result(self, arxiv_id: str) -> bool:
         """
         删除深度分析结果
@@ -1635,27 +1987,38 @@ class PaperService:
             return []
     
     def get_paper_statistics(self) -> Dict[str, Any]:
-        """获取论文统计信息，包括Dify相关统计"""
+        """获取论文统计信息，包括Dify相关统计（读取增量统计表，未迁移时直接聚合论文表）"""
         try:
             with self.db_manager.get_db_connection() as conn:
                 cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
-                # 基础统计
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_papers,
-                        COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed_papers,
-                        COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending_papers,
-                        COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed_papers,
-                        COUNT(CASE WHEN research_objectives IS NOT NULL AND research_objectives != '' THEN 1 END) as analyzed_papers,
-                        COUNT(CASE WHEN task_name IS NOT NULL AND task_name != '' THEN 1 END) as papers_with_tasks,
-                        COUNT(CASE WHEN dify_document_id IS NOT NULL AND dify_document_id != '' THEN 1 END) as dify_uploaded
-                    FROM arxiv_papers
-                """)
+                if not paper_stats_ready(cursor):
+                    cursor.execute("""
+                        SELECT 
+                            COUNT(*) as total_papers,
+                            COUNT(CASE WHEN processing_status = 'completed' THEN 1 END) as completed_papers,
+                            COUNT(CASE WHEN processing_status = 'pending' THEN 1 END) as pending_papers,
+                            COUNT(CASE WHEN processing_status = 'failed' THEN 1 END) as failed_papers,
+                            COUNT(CASE WHEN research_objectives IS NOT NULL AND research_objectives != '' THEN 1 END) as analyzed_papers,
+                            COUNT(CASE WHEN task_name IS NOT NULL AND task_name != '' THEN 1 END) as papers_with_tasks,
+                            COUNT(CASE WHEN dify_document_id IS NOT NULL AND dify_document_id != '' THEN 1 END) as dify_uploaded
+                        FROM arxiv_papers
+                    """)
+                    return dict(cursor.fetchone())
                 
-                stats = dict(cursor.fetchone())
+                # 基础统计（有任务的论文 = 总数 - 未分配任务的论文）
+                total = get_stat(cursor, 'total')
+                unassigned = sum(row['paper_count'] for row in list_stats(cursor, 'unassigned_status'))
                 
-                return stats
+                return {
+                    'total_papers': total['paper_count'],
+                    'completed_papers': total['completed_count'],
+                    'pending_papers': total['pending_count'],
+                    'failed_papers': total['failed_count'],
+                    'analyzed_papers': total['structured_count'],
+                    'papers_with_tasks': total['paper_count'] - unassigned,
+                    'dify_uploaded': total['dify_uploaded_count']
+                }
                 
         except Exception as e:
             logger.error(f"获取论文统计失败: {e}")
@@ -1900,28 +2263,32 @@ class PaperService:
             with self.db_manager.get_db_connection() as conn:
                 cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
-                # 获取深度分析状态统计
-                cursor.execute("""
-                    SELECT 
-                        deep_analysis_status,
-                        COUNT(*) as count
-                    FROM arxiv_papers 
-                    WHERE deep_analysis_status IS NOT NULL
-                    GROUP BY deep_analysis_status
-                """)
-                
-                status_counts = {row['deep_analysis_status']: row['count'] for row in cursor.fetchall()}
-                
-                # 获取总体统计
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_papers,
-                        COUNT(CASE WHEN deep_analysis_status IS NOT NULL THEN 1 END) as papers_with_status,
-                        COUNT(CASE WHEN deep_analysis_result IS NOT NULL THEN 1 END) as papers_with_result
-                    FROM arxiv_papers
-                """)
-                
-                total_stats = dict(cursor.fetchone())
+                if paper_stats_ready(cursor):
+                    # 获取深度分析状态统计
+                    status_counts = {row['bucket']: row['paper_count'] for row in list_stats(cursor, 'deep_status')}
+                    total_stats = {
+                        'total_papers': get_stat(cursor, 'total')['paper_count'],
+                        'papers_with_status': sum(status_counts.values()),
+                        'papers_with_result': get_stat(cursor, 'flag', 'has_deep_analysis_result')['paper_count']
+                    }
+                else:
+                    # 统计表不可用时直接聚合论文表
+                    cursor.execute("""
+                        SELECT deep_analysis_status, COUNT(*) as count
+                        FROM arxiv_papers 
+                        WHERE deep_analysis_status IS NOT NULL
+                        GROUP BY deep_analysis_status
+                    """)
+                    status_counts = {row['deep_analysis_status']: row['count'] for row in cursor.fetchall()}
+                    
+                    cursor.execute("""
+                        SELECT 
+                            COUNT(*) as total_papers,
+                            COUNT(CASE WHEN deep_analysis_status IS NOT NULL THEN 1 END) as papers_with_status,
+                            COUNT(CASE WHEN deep_analysis_result IS NOT NULL THEN 1 END) as papers_with_result
+                        FROM arxiv_papers
+                    """)
+                    total_stats = dict(cursor.fetchone())
                 
                 return {
                     'success': True,
@@ -2620,67 +2987,44 @@ class DifyService:
             return {"success": False, "error": str(e)}
     
     def get_dify_statistics(self) -> Dict[str, Any]:
-        """获取 Dify 相关统计信息"""
-        cache_key = "dify_statistics"
-        cached_data = self.db_manager.get_cache(cache_key)
-        if cached_data:
-            return cached_data
-        
+        """获取 Dify 相关统计信息（读取增量统计表，未迁移时直接聚合论文表）"""
         try:
             with self.db_manager.get_db_connection() as conn:
                 cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+                if not paper_stats_ready(cursor):
+                    return self._get_dify_statistics_from_papers(cursor)
                 
                 # 基础统计
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_papers,
-                        COUNT(CASE WHEN dify_document_id IS NOT NULL THEN 1 END) as uploaded_papers,
-                        COUNT(CASE WHEN dify_document_id IS NULL THEN 1 END) as not_uploaded_papers,
-                        COUNT(DISTINCT dify_dataset_id) as unique_datasets,
-                        SUM(dify_character_count) as total_characters,
-                        AVG(dify_character_count) as avg_characters
-                    FROM arxiv_papers
-                """)
-                basic_stats = dict(cursor.fetchone())
+                total = get_stat(cursor, 'total')
+                basic_stats = {
+                    'total_papers': total['paper_count'],
+                    'uploaded_papers': total['dify_uploaded_count'],
+                    'not_uploaded_papers': total['paper_count'] - total['dify_uploaded_count'],
+                    'unique_datasets': len(list_stats(cursor, 'dify_dataset')),
+                    'total_characters': total['dify_characters'],
+                    # 按已上传文档平均（未上传论文的字符数为0，不计入分母）
+                    'avg_characters': (total['dify_characters'] / total['dify_uploaded_count']) if total['dify_uploaded_count'] else None
+                }
                 
                 # 按任务统计
-                cursor.execute("""
-                    SELECT 
-                        task_name,
-                        COUNT(*) as total_papers,
-                        COUNT(CASE WHEN dify_document_id IS NOT NULL THEN 1 END) as uploaded_papers,
-                        SUM(dify_character_count) as total_characters
-                    FROM arxiv_papers 
-                    WHERE task_name IS NOT NULL AND task_name != ''
-                    GROUP BY task_name
-                    ORDER BY uploaded_papers DESC, total_papers DESC
-                    LIMIT 20
-                """)
-                task_stats = [dict(row) for row in cursor.fetchall()]
+                task_stats = [
+                    {'task_name': row['bucket'], 'total_papers': row['paper_count'],
+                     'uploaded_papers': row['dify_uploaded_count'], 'total_characters': row['dify_characters']}
+                    for row in list_stats(cursor, 'task', order_by='dify_uploaded_count DESC, paper_count DESC, bucket', limit=20)
+                ]
                 
                 # 最近上传趋势
-                cursor.execute("""
-                    SELECT 
-                        dify_upload_time::date as upload_date,
-                        COUNT(*) as upload_count
-                    FROM arxiv_papers 
-                    WHERE dify_upload_time IS NOT NULL 
-                      AND dify_upload_time >= NOW() - INTERVAL '30 days'
-                    GROUP BY dify_upload_time::date
-                    ORDER BY upload_date DESC
-                """)
-                upload_trend = [dict(row) for row in cursor.fetchall()]
+                upload_trend = [
+                    {'upload_date': row['day'], 'upload_count': row['paper_count']}
+                    for row in list_recent_days(cursor, 'dify_day', 30, descending=True)
+                ]
                 
-                stats = {
+                return {
                     "basic": basic_stats,
                     "by_task": task_stats,
                     "upload_trend": upload_trend
                 }
                 
-                # 缓存结果
-                self.db_manager.set_cache(cache_key, stats, timeout=900)
-                return stats
-                
         except Exception as e:
             logger.error(f"获取 Dify 统计信息失败: {e}")
             return {
@@ -2689,6 +3033,52 @@ class DifyService:
                 "upload_trend": []
             }
     
+    def _get_dify_statistics_from_papers(self, cursor) -> Dict[str, Any]:
+        """Dify 统计的全表聚合版本（统计表不可用时使用）"""
+        cursor.execute("""
+            SELECT 
+                COUNT(*) as total_papers,
+                COUNT(CASE WHEN dify_document_id IS NOT NULL THEN 1 END) as uploaded_papers,
+                COUNT(CASE WHEN dify_document_id IS NULL THEN 1 END) as not_uploaded_papers,
+                COUNT(DISTINCT dify_dataset_id) as unique_datasets,
+                SUM(dify_character_count) as total_characters,
+                AVG(dify_character_count) FILTER (WHERE dify_document_id IS NOT NULL) as avg_characters
+            FROM arxiv_papers
+        """)
+        basic_stats = dict(cursor.fetchone())
+        
+        cursor.execute("""
+            SELECT 
+                task_name,
+                COUNT(*) as total_papers,
+                COUNT(CASE WHEN dify_document_id IS NOT NULL THEN 1 END) as uploaded_papers,
+                SUM(dify_character_count) as total_characters
+            FROM arxiv_papers 
+            WHERE task_name IS NOT NULL AND task_name != ''
+            GROUP BY task_name
+            ORDER BY uploaded_papers DESC, total_papers DESC
+            LIMIT 20
+        """)
+        task_stats = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT 
+                dify_upload_time::date as upload_date,
+                COUNT(*) as upload_count
+            FROM arxiv_papers 
+            WHERE dify_upload_time IS NOT NULL 
+              AND dify_upload_time >= NOW() - INTERVAL '30 days'
+            GROUP BY dify_upload_time::date
+            ORDER BY upload_date DESC
+        """)
+        upload_trend = [dict(row) for row in cursor.fetchall()]
+        
+        return {
+            "basic": basic_stats,
+            "by_task": task_stats,
+            "upload_trend": upload_trend
+        }
+    
     def batch_verify_all_documents(self) -> Dict[str, Any]:
         """
         批量验证所有已上传文档的状态
@@ -2860,8 +3250,8 @@ class DifyService:
                     query_params.append(filters['task_name'])
                 
                 if filters.get('category'):
-                    base_query += " AND categories LIKE %s"
-                    query_params.append(f"%{filters['category']}%")
+                    base_query += f" AND {category_filter_sql()}"
+                    query_params.append(filters['category'])
                 
                 # 排序和限制
                 base_query += " ORDER BY created_at DESC"
@@ -14,6 +14,8 @@ if homesystem_root not in sys.path:
     sys.path.insert(0, homesystem_root)
 
 from HomeSystem.integrations.database import DatabaseOperations, ArxivPaperModel
+from HomeSystem.integrations.database.paper_search import PaperSearch
+from HomeSystem.integrations.database.paper_terms import category_filter_sql
 from loguru import logger
 
 
@@ -44,15 +46,19 @@ class PaperDataService:
             where_conditions = []
             params = []
             
-            if query:
-                # 在标题、摘要、关键词中搜索
-                where_conditions.append("(title ILIKE %s OR abstract ILIKE %s OR keywords ILIKE %s)")
-                search_term = f"%{query}%"
-                params.extend([search_term, search_term, search_term])
+            # 全文检索（search_vector GIN索引 + pg_trgm子串兜底）
+            search = PaperSearch(query) if query and query.strip() else None
+            if search:
+                where_conditions.append(search.where_sql)
+                params.extend(search.where_params)
             
             if category:
-                where_conditions.append("categories ILIKE %s")
-                params.append(f"%{category}%")
+                where_conditions.append(category_filter_sql())
+                params.append(category)
+            
+            if status:
+                where_conditions.append("processing_status = %s")
+                params.append(status)
             
             # 组合WHERE子句
             where_clause = " AND ".join(where_conditions) if where_conditions else None
@@ -60,19 +66,27 @@ class PaperDataService:
             # 获取总数
             total = self.db_ops.count(ArxivPaperModel, where_clause, tuple(params) if params else None)
             
-            # 分页查询
+            # 分页查询，有搜索词时按相关度排序
             offset = (page - 1) * per_page
-            papers = self.db_ops.list_all(
-                ArxivPaperModel, 
-                limit=per_page, 
-                offset=offset,
-                order_by="created_at DESC"
-            )
+            rank_select = f", {search.rank_sql} AS search_rank" if search else ""
+            order_by = "search_rank DESC, created_at DESC" if search else "created_at DESC"
+            sql = f"""
+                SELECT {ArxivPaperModel.select_columns(ArxivPaperModel.SUMMARY_COLUMNS)}{rank_select} FROM arxiv_papers
+                {"WHERE " + where_clause if where_clause else ""}
+                ORDER BY {order_by}
+                LIMIT %s OFFSET %s
+            """
+            with self.db_ops.db_manager.get_postgres_sync() as cursor:
+                cursor.execute(sql, (search.rank_params if search else []) + params + [per_page, offset])
+                rows = [dict(row) for row in cursor.fetchall()]
+                snippets = search.fetch_snippets(cursor, [row['arxiv_id'] for row in rows]) if search else {}
             
             # 转换为字典格式
             paper_dicts = []
-            for paper in papers:
-                paper_dict = self._paper_to_dict(paper)
+            for row in rows:
+                paper_dict = self._paper_to_dict(ArxivPaperModel.from_dict(row))
+                if search:
+                    paper_dict['search_snippet'] = snippets.get(row['arxiv_id'])
                 paper_dicts.append(paper_dict)
             
             return paper_dicts, total
@@ -99,7 +113,8 @@ class PaperDataService:
             papers = self.db_ops.list_all(
                 ArxivPaperModel, 
                 limit=limit,
-                order_by="created_at DESC"
+                order_by="created_at DESC",
+                columns=ArxivPaperModel.SUMMARY_COLUMNS
             )
             return [self._paper_to_dict(paper) for paper in papers]
             
@@ -860,10 +860,21 @@ class PaperGatherService:
                 'enable_user_prompt', 'user_prompt',
                 # 远程OCR参数
                 'enable_remote_ocr', 'remote_ocr_endpoint', 'remote_ocr_timeout',
+                # 混合提取参数
+                'enable_hybrid_ocr', 'enable_partial_pdf_fetch',
                 # 视频分析参数
                 'enable_video_analysis', 'video_analysis_model',
                 # 新增搜索模式相关参数
                 'search_mode', 'start_year', 'end_year', 'after_year',
+                # 流水线并发参数
+                'pipeline_abstract_workers', 'pipeline_download_workers',
+                'pipeline_ocr_workers', 'pipeline_analysis_workers', 'pipeline_queue_size',
+                # 搜索结果缓存参数
+                'enable_search_cache',
+                # 时间水位增量搜索参数
+                'enable_watermark_search', 'watermark_max_results',
+                # 摘要筛选记录参数
+                'enable_screening_ledger', 'screening_ledger_ttl_days',
                 # 任务追踪相关参数
                 'task_name', 'task_id'
             }
@@ -1059,10 +1070,21 @@ class PaperGatherService:
                 'enable_user_prompt', 'user_prompt',
                 # 远程OCR参数
                 'enable_remote_ocr', 'remote_ocr_endpoint', 'remote_ocr_timeout',
+                # 混合提取参数
+                'enable_hybrid_ocr', 'enable_partial_pdf_fetch',
                 # 视频分析参数
                 'enable_video_analysis', 'video_analysis_model',
                 # 新增搜索模式相关参数
                 'search_mode', 'start_year', 'end_year', 'after_year',
+                # 流水线并发参数
+                'pipeline_abstract_workers', 'pipeline_download_workers',
+                'pipeline_ocr_workers', 'pipeline_analysis_workers', 'pipeline_queue_size',
+                # 搜索结果缓存参数
+                'enable_search_cache',
+                # 时间水位增量搜索参数
+                'enable_watermark_search', 'watermark_max_results',
+                # 摘要筛选记录参数
+                'enable_screening_ledger', 'screening_ledger_ttl_days',
                 # 任务追踪相关参数
                 'task_name', 'task_id'
             }
@@ -1,6 +1,34 @@
 -- 创建 HomeSystem 数据库表结构
 -- 基于 HomeSystem/integrations/database/models.py
 
+-- 关键词/分类字符串解析函数（keyword_list / category_list 生成列使用，
+-- 与 HomeSystem/integrations/database/paper_terms.py 保持一致）
+CREATE OR REPLACE FUNCTION arxiv_parse_terms(raw TEXT)
+RETURNS TEXT[] AS $$
+    SELECT ARRAY(
+        SELECT term FROM (
+            SELECT btrim(btrim(part), '"''') AS term, MIN(ord) AS ord
+            FROM unnest(
+                CASE
+                    WHEN btrim(raw) ~ '^\{.*\}$' THEN ARRAY(
+                        SELECT COALESCE(m[1], m[2])
+                        FROM regexp_matches(btrim(raw), '"((?:[^"\\]|\\.)*)"|([^,{}"]+)', 'g') AS m)
+                    WHEN btrim(raw) ~ '^\[.*\]$' THEN ARRAY(
+                        SELECT COALESCE(m[1], m[2])
+                        FROM regexp_matches(btrim(raw), '"((?:[^"\\]|\\.)*)"|([^,\[\]"]+)', 'g') AS m)
+                    WHEN raw LIKE '%,%' THEN string_to_array(raw, ',')
+                    WHEN raw LIKE '%;%' THEN string_to_array(raw, ';')
+                    WHEN raw LIKE '%|%' THEN string_to_array(raw, '|')
+                    ELSE ARRAY[raw]
+                END
+            ) WITH ORDINALITY AS u(part, ord)
+            GROUP BY 1
+        ) t
+        WHERE term <> ''
+        ORDER BY ord
+    )
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
 -- 创建 arxiv_papers 表（主要论文数据表）
 CREATE TABLE IF NOT EXISTS arxiv_papers (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -48,6 +76,24 @@ CREATE TABLE IF NOT EXISTS arxiv_papers (
     deep_analysis_created_at TIMESTAMP DEFAULT NULL,
     deep_analysis_updated_at TIMESTAMP DEFAULT NULL,
     
+    -- 深度分析摘要列（自动维护，列表查询无需读取深度分析全文）
+    has_deep_analysis BOOLEAN GENERATED ALWAYS AS (
+        deep_analysis_result IS NOT NULL AND deep_analysis_result <> ''
+    ) STORED,
+    deep_analysis_length INTEGER GENERATED ALWAYS AS (length(deep_analysis_result)) STORED,
+    
+    -- 关键词/分类数组（自动维护，用于按关键词/分类的索引查询）
+    keyword_list TEXT[] GENERATED ALWAYS AS (arxiv_parse_terms(keywords)) STORED,
+    category_list TEXT[] GENERATED ALWAYS AS (arxiv_parse_terms(categories)) STORED,
+    
+    -- 全文检索向量（自动维护，权重：标题A、关键词B、研究目标C、摘要D）
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(keywords, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(research_objectives, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(abstract, '')), 'D')
+    ) STORED,
+    
     -- 时间戳字段
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -60,6 +106,10 @@ CREATE INDEX IF NOT EXISTS idx_arxiv_papers_categories ON arxiv_papers(categorie
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_created_at ON arxiv_papers(created_at);
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_published_date ON arxiv_papers(published_date);
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_status_created ON arxiv_papers(processing_status, created_at);
+-- 列表游标分页的排序键索引
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_created_at_id ON arxiv_papers(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_unassigned_created ON arxiv_papers(created_at DESC, id DESC) WHERE task_name IS NULL OR task_name = '';
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_analysis_updated ON arxiv_papers(deep_analysis_updated_at DESC, id DESC) WHERE deep_analysis_status = 'completed';
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_keywords ON arxiv_papers(keywords);
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_research_objectives ON arxiv_papers(research_objectives);
 
@@ -67,6 +117,7 @@ CREATE INDEX IF NOT EXISTS idx_arxiv_papers_research_objectives ON arxiv_papers(
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_name ON arxiv_papers(task_name);
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_id ON arxiv_papers(task_id);
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_name_id ON arxiv_papers(task_name, task_id);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_task_name_created ON arxiv_papers(task_name, created_at);
 
 -- 完整论文相关性评分字段索引
 CREATE INDEX IF NOT EXISTS idx_arxiv_papers_full_paper_relevance_score ON arxiv_papers(full_paper_relevance_score);
@@ -100,11 +151,27 @@ CREATE TRIGGER update_arxiv_papers_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
--- 全文搜索索引（可选，用于高级搜索功能）
-CREATE INDEX IF NOT EXISTS idx_arxiv_papers_title_fts 
-    ON arxiv_papers USING gin(to_tsvector('english', title));
-CREATE INDEX IF NOT EXISTS idx_arxiv_papers_abstract_fts 
-    ON arxiv_papers USING gin(to_tsvector('english', abstract));
+-- 全文搜索索引（search_vector 排序检索 + pg_trgm 子串/中文兜底）
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_search_vector 
+    ON arxiv_papers USING gin(search_vector);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_keyword_list 
+    ON arxiv_papers USING gin(keyword_list);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_category_list 
+    ON arxiv_papers USING gin(category_list);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_title_trgm 
+    ON arxiv_papers USING gin(title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_authors_trgm 
+    ON arxiv_papers USING gin(authors gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_abstract_trgm 
+    ON arxiv_papers USING gin(abstract gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_keywords_trgm 
+    ON arxiv_papers USING gin(keywords gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_arxiv_papers_research_objectives_trgm 
+    ON arxiv_papers USING gin(research_objectives gin_trgm_ops);
+
+-- 统计接口读取的增量统计表 arxiv_paper_stats 及其触发器只由
+-- HomeSystem/integrations/database/migrations/add_paper_stats.py 创建和重建；
+-- 未执行该迁移时统计接口回退为直接聚合 arxiv_papers（读取路径不执行DDL）
 
 -- 创建用于统计的视图（可选）
 CREATE OR REPLACE VIEW arxiv_papers_stats AS
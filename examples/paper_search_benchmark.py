@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+论文搜索基准测试
+在合成数据上对比旧的 ILIKE '%关键词%' 搜索与 search_vector 全文检索 + pg_trgm 子串兜底的查询耗时
+
+测试数据写入会话级临时表 pg_temp.arxiv_papers（同名临时表会遮蔽正式表，事务结束时自动删除），
+不会读写正式的 arxiv_papers 表。需要数据库已启用 pg_trgm 扩展（见 migrations/add_paper_search_vector.py）。
+
+用法:
+    python examples/paper_search_benchmark.py                      # 默认50万行
+    python examples/paper_search_benchmark.py --rows 100000        # 指定行数
+    python examples/paper_search_benchmark.py --query "robot grasp" --query 强化学习
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+
+# 添加项目根目录到路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from HomeSystem.integrations.database.connection import get_database_manager
+from HomeSystem.integrations.database.paper_search import PaperSearch, SEARCH_VECTOR_SQL, SUBSTRING_FIELDS
+
+# 领域词放在词表前部，按平方分布抽样时出现频率更高
+DOMAIN_WORDS = [
+    'learning', 'model', 'neural', 'network', 'transformer', 'diffusion', 'policy', 'robot',
+    'reinforcement', 'language', 'vision', 'graph', 'attention', 'generative', 'grasp',
+    'manipulation', 'benchmark', 'dataset', 'optimization', 'inference', 'retrieval', 'agent'
+]
+CHINESE_PHRASES = ['强化学习', '机器人抓取', '扩散模型', '大语言模型', '图神经网络', '视觉导航']
+DEFAULT_QUERIES = ['diffusion policy', 'transformer', '"robot manipulation"', '强化学习', 'zq']
+
+
+def build_vocabulary(size: int) -> list:
+    """生成伪英文词表"""
+    rng = random.Random(42)
+    consonants, vowels = 'bcdfghklmnprstvz', 'aeiou'
+    words = list(DOMAIN_WORDS)
+    seen = set(words)
+    while len(words) < size:
+        word = ''.join(rng.choice(consonants) + rng.choice(vowels) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def create_dataset(cursor, rows: int, vocab_size: int):
+    """在临时表中生成合成论文数据并建立索引"""
+    print(f"生成 {rows} 行合成数据...")
+    start = time.perf_counter()
+
+    cursor.execute(f"""
+        CREATE TEMP TABLE arxiv_papers (
+            arxiv_id VARCHAR(50) PRIMARY KEY,
+            title TEXT NOT NULL,
+            authors TEXT DEFAULT '',
+            abstract TEXT DEFAULT '',
+            keywords TEXT DEFAULT NULL,
+            research_objectives TEXT DEFAULT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED
+        ) ON COMMIT DROP
+    """)
+
+    # 词的序号按 random()^2 抽样，形成常用词多、罕见词少的分布；LATERAL 引用 g 保证每行重新抽样
+    cursor.execute("""
+        INSERT INTO pg_temp.arxiv_papers (arxiv_id, title, authors, abstract, keywords, research_objectives, created_at)
+        SELECT 'bench.' || g,
+               t.title, a.authors, ab.abstract, k.keywords,
+               CASE WHEN g %% 3 = 0 THEN (%(cn)s::text[])[1 + (g %% array_length(%(cn)s, 1))] || '方法研究：' || t.title
+                    ELSE t.title END,
+               now() - (g || ' minutes')::interval
+        FROM generate_series(1, %(rows)s) AS g
+        CROSS JOIN LATERAL (
+            SELECT string_agg((%(vocab)s::text[])[1 + floor(power(random(), 2) * %(size)s)::int], ' ') AS title
+            FROM generate_series(1, 8 + g %% 5)
+        ) t
+        CROSS JOIN LATERAL (
+            SELECT string_agg(initcap((%(vocab)s::text[])[1 + floor(random() * %(size)s)::int]), ', ') AS authors
+            FROM generate_series(1, 3 + g %% 4)
+        ) a
+        CROSS JOIN LATERAL (
+            SELECT string_agg((%(vocab)s::text[])[1 + floor(power(random(), 2) * %(size)s)::int], ' ') AS abstract
+            FROM generate_series(1, 120 + g %% 60)
+        ) ab
+        CROSS JOIN LATERAL (
+            SELECT string_agg((%(vocab)s::text[])[1 + floor(power(random(), 2) * %(size)s)::int], ', ') AS keywords
+            FROM generate_series(1, 4 + g %% 3)
+        ) k
+    """, {
+        'rows': rows,
+        'vocab': build_vocabulary(vocab_size),
+        'size': vocab_size,
+        'cn': CHINESE_PHRASES
+    })
+    print(f"   数据生成耗时 {time.perf_counter() - start:.1f} 秒")
+
+    start = time.perf_counter()
+    cursor.execute("CREATE INDEX ON pg_temp.arxiv_papers USING gin(search_vector)")
+    for field in SUBSTRING_FIELDS:
+        cursor.execute(f"CREATE INDEX ON pg_temp.arxiv_papers USING gin({field} gin_trgm_ops)")
+    cursor.execute("CREATE INDEX ON pg_temp.arxiv_papers(created_at)")
+    cursor.execute("ANALYZE pg_temp.arxiv_papers")
+    print(f"   索引创建耗时 {time.perf_counter() - start:.1f} 秒")
+
+
+def run_ilike(cursor, query: str, per_page: int) -> int:
+    """旧实现：五个字段 ILIKE 前后通配"""
+    condition = ("(title ILIKE %s OR abstract ILIKE %s OR authors ILIKE %s "
+                 "OR research_objectives ILIKE %s OR keywords ILIKE %s)")
+    params = [f"%{query}%"] * 5
+    cursor.execute(f"SELECT COUNT(*) AS total FROM pg_temp.arxiv_papers WHERE {condition}", params)
+    total = cursor.fetchone()['total']
+    cursor.execute(f"""
+        SELECT arxiv_id, title FROM pg_temp.arxiv_papers WHERE {condition}
+        ORDER BY created_at DESC LIMIT %s
+    """, params + [per_page])
+    cursor.fetchall()
+    return total
+
+
+def run_fulltext(cursor, query: str, per_page: int) -> int:
+    """新实现：search_vector 检索按 ts_rank 排序，附带摘要片段"""
+    search = PaperSearch(query)
+    cursor.execute(f"SELECT COUNT(*) AS total FROM pg_temp.arxiv_papers WHERE {search.where_sql}", search.where_params)
+    total = cursor.fetchone()['total']
+    cursor.execute(f"""
+        SELECT arxiv_id, title, {search.rank_sql} AS search_rank FROM pg_temp.arxiv_papers
+        WHERE {search.where_sql}
+        ORDER BY search_rank DESC, created_at DESC LIMIT %s
+    """, search.rank_params + search.where_params + [per_page])
+    arxiv_ids = [row['arxiv_id'] for row in cursor.fetchall()]
+    search.fetch_snippets(cursor, arxiv_ids)
+    return total
+
+
+def best_time(func, cursor, query: str, per_page: int, repeat: int) -> tuple:
+    """重复执行取最佳耗时（秒）"""
+    best, total = None, 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        total = func(cursor, query, per_page)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="论文搜索基准测试")
+    parser.add_argument('--rows', type=int, default=500000, help="合成数据行数")
+    parser.add_argument('--vocab', type=int, default=20000, help="词表大小")
+    parser.add_argument('--query', action='append', help="测试查询，可重复指定")
+    parser.add_argument('--per-page', type=int, default=20, help="每页数量")
+    parser.add_argument('--repeat', type=int, default=3, help="每个查询的重复次数（取最佳）")
+    args = parser.parse_args()
+    queries = args.query or DEFAULT_QUERIES
+
+    print("=== 论文搜索基准测试 ===")
+
+    db_manager = get_database_manager()
+    with db_manager.get_postgres_sync() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        if not cursor.fetchone():
+            print("❌ 数据库未启用 pg_trgm 扩展，请先执行 migrations/add_paper_search_vector.py")
+            return
+
+        try:
+            create_dataset(cursor, args.rows, args.vocab)
+
+            print(f"\n{'查询':<24}{'ILIKE(ms)':>12}{'全文检索(ms)':>14}{'加速':>8}{'ILIKE命中':>12}{'全文命中':>10}")
+            for query in queries:
+                ilike_seconds, ilike_total = best_time(run_ilike, cursor, query, args.per_page, args.repeat)
+                fts_seconds, fts_total = best_time(run_fulltext, cursor, query, args.per_page, args.repeat)
+                speedup = ilike_seconds / fts_seconds if fts_seconds else 0
+                print(f"{query:<24}{ilike_seconds * 1000:>12.1f}{fts_seconds * 1000:>14.1f}"
+                      f"{speedup:>7.1f}x{ilike_total:>12}{fts_total:>10}")
+        finally:
+            # 测试数据只存在于本事务，回滚后临时表随之删除
+            cursor.connection.rollback()
+
+    print("\n=== 测试完成 ===")
+    print("说明: 全文检索的耗时包含计数、按相关度取一页和生成摘要片段；命中数不同是因为")
+    print("      全文检索按词匹配（含词形还原），ILIKE 按字符子串匹配")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+PDF 内存占用基准测试
+对比 ArxivData 旧的PDF处理方式（bytearray累积 + bytes复制 + 临时文件）与
+内存映射方式（mmap + 直接打开文件）在大PDF上的峰值内存和耗时
+
+用法:
+    python examples/pdf_memory_benchmark.py                 # 自动生成约40MB的测试PDF
+    python examples/pdf_memory_benchmark.py --pdf paper.pdf # 使用指定PDF
+"""
+
+import sys
+import os
+import argparse
+import json
+import resource
+import subprocess
+import tempfile
+import time
+
+# 添加项目根目录到路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def generate_large_pdf(path: str, target_mb: int = 40):
+    """生成包含随机图片（不可压缩）和文本的测试PDF"""
+    import fitz
+
+    width, height = 1000, 1000
+    image_pdf_bytes = width * height * 3
+    pages = max(1, int(target_mb * 1024 * 1024 / image_pdf_bytes))
+
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        pixmap = fitz.Pixmap(fitz.csRGB, width, height, os.urandom(image_pdf_bytes), False)
+        page.insert_image(fitz.Rect(50, 200, 550, 700), pixmap=pixmap)
+        page.insert_text((50, 80), f"Benchmark page {page_num + 1}\n" + "lorem ipsum " * 40)
+    doc.save(path)
+    doc.close()
+
+
+def max_rss_mb() -> float:
+    """当前进程峰值常驻内存（MB）"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_legacy(pdf_path: str, max_pages: int) -> dict:
+    """旧方式：1KB分块累积到bytearray，bytes()复制，写临时文件后再打开"""
+    import fitz
+
+    start = time.perf_counter()
+    content = bytearray()
+    with open(pdf_path, 'rb') as f:
+        while True:
+            chunk = f.read(1024)
+            if not chunk:
+                break
+            content.extend(chunk)
+    pdf = bytes(content)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tmp_pdf_path = os.path.join(temp_dir, 'input.pdf')
+        with open(tmp_pdf_path, 'wb') as f:
+            f.write(pdf)
+        document = fitz.open(tmp_pdf_path)
+        text = [document[i].get_text() for i in range(min(max_pages, len(document)))]
+        document.close()
+
+    return {'seconds': time.perf_counter() - start, 'chars': sum(len(t) for t in text)}
+
+
+def run_mmap(pdf_path: str, max_pages: int) -> dict:
+    """新方式：ArxivData 内存映射加载，PyMuPDF直接打开文件"""
+    from HomeSystem.utility.arxiv.arxiv import ArxivData
+
+    start = time.perf_counter()
+    paper = ArxivData({'title': 'benchmark', 'link': 'http://arxiv.org/abs/0000.00000'})
+    paper.pdf_path = pdf_path
+    paper.load_from_pdf()
+    ocr_result, _ = paper._performOCR_pymupdf(max_pages=max_pages)
+    paper.clearPdf()
+
+    return {'seconds': time.perf_counter() - start, 'chars': len(ocr_result or '')}
+
+
+def run_child(mode: str, pdf_path: str, max_pages: int):
+    """在独立子进程中运行单个模式，保证峰值内存互不影响"""
+    # 两种模式先导入相同的模块，基线只包含模块本身的内存
+    import fitz  # noqa: F401
+    from HomeSystem.utility.arxiv.arxiv import ArxivData  # noqa: F401
+    baseline = max_rss_mb()
+    result = run_legacy(pdf_path, max_pages) if mode == 'legacy' else run_mmap(pdf_path, max_pages)
+    result['peak_rss_mb'] = max_rss_mb()
+    result['baseline_rss_mb'] = baseline
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 内存占用基准测试")
+    parser.add_argument('--pdf', help="测试用PDF路径，不指定时自动生成")
+    parser.add_argument('--size-mb', type=int, default=40, help="自动生成PDF的目标大小（MB）")
+    parser.add_argument('--max-pages', type=int, default=25, help="文本提取页数")
+    parser.add_argument('--child', choices=['legacy', 'mmap'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.pdf, args.max_pages)
+        return
+
+    print("=== PDF 内存占用基准测试 ===")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        pdf_path = args.pdf
+        if not pdf_path:
+            pdf_path = os.path.join(work_dir, 'benchmark.pdf')
+            print(f"\n📄 生成测试PDF (~{args.size_mb}MB)...")
+            generate_large_pdf(pdf_path, args.size_mb)
+        print(f"📄 PDF大小: {os.path.getsize(pdf_path) / 1024 / 1024:.1f} MB")
+
+        for mode in ('legacy', 'mmap'):
+            output = subprocess.run(
+                [sys.executable, __file__, '--child', mode, '--pdf', pdf_path,
+                 '--max-pages', str(args.max_pages)],
+                capture_output=True, text=True, check=True
+            )
+            result = json.loads(output.stdout.strip().splitlines()[-1])
+            print(f"\n🔍 {mode}:")
+            print(f"   峰值内存: {result['peak_rss_mb']:.1f} MB "
+                  f"(导入后基线 {result['baseline_rss_mb']:.1f} MB, "
+                  f"增量 {result['peak_rss_mb'] - result['baseline_rss_mb']:.1f} MB)")
+            print(f"   耗时: {result['seconds']:.3f} 秒, 提取字符: {result['chars']}")
+
+    print("\n=== 测试完成 ===")
+    print("说明: mmap 映射的页由内核按需载入，作为文件缓存可随时回收，不计入Python堆")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+PyMuPDF 并行文本提取基准测试
+对比 ArxivData._performOCR_pymupdf 串行提取与多进程按页段提取在不同页数下的吞吐量（页/秒）
+
+用法:
+    python examples/pymupdf_parallel_benchmark.py                        # 自动生成测试PDF
+    python examples/pymupdf_parallel_benchmark.py --pages 100 400 1000   # 指定页数
+    python examples/pymupdf_parallel_benchmark.py --pdf book.pdf         # 使用指定PDF
+"""
+
+import sys
+import os
+import argparse
+import tempfile
+import time
+
+# 添加项目根目录到路径
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def generate_text_pdf(path: str, pages: int):
+    """生成文字密集的测试PDF"""
+    import fitz
+
+    paragraph = ("Parallel extraction benchmark text with   multiple   spaces.\n\n\n"
+                 "Lorem ipsum dolor sit amet, consectetur adipiscing elit. ") * 6
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(40, 40, 560, 800), f"Page {page_num + 1}\n" + paragraph * 4, fontsize=7)
+    doc.save(path)
+    doc.close()
+
+
+def run_extraction(pdf_path: str, max_pages: int, workers: int, repeat: int) -> dict:
+    """运行文本提取，返回最佳耗时和结果"""
+    from HomeSystem.utility.arxiv.arxiv import ArxivData
+
+    paper = ArxivData({'title': 'benchmark', 'link': 'http://arxiv.org/abs/0000.00000'})
+    paper.pdf_path = pdf_path
+    paper.load_from_pdf()
+
+    # 预热一次，进程池创建开销不计入结果
+    paper._performOCR_pymupdf(max_pages=max_pages, workers=workers)
+
+    best = None
+    ocr_result, status_info = None, {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ocr_result, status_info = paper._performOCR_pymupdf(max_pages=max_pages, workers=workers)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    paper.clearPdf()
+
+    return {
+        'seconds': best,
+        'pages': status_info.get('processed_pages', 0),
+        'result': ocr_result or ''
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyMuPDF 并行文本提取基准测试")
+    parser.add_argument('--pdf', help="测试用PDF路径，不指定时按 --pages 自动生成")
+    parser.add_argument('--pages', type=int, nargs='+', default=[64, 256, 1024], help="自动生成PDF的页数")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help="对比的工作进程数")
+    parser.add_argument('--repeat', type=int, default=3, help="每种配置的重复次数（取最佳）")
+    args = parser.parse_args()
+
+    print("=== PyMuPDF 并行文本提取基准测试 ===")
+    print(f"CPU核心数: {os.cpu_count()}")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if args.pdf:
+            import fitz
+            with fitz.open(args.pdf) as doc:
+                cases = [(args.pdf, len(doc))]
+        else:
+            cases = []
+            for pages in args.pages:
+                pdf_path = os.path.join(work_dir, f'benchmark_{pages}.pdf')
+                generate_text_pdf(pdf_path, pages)
+                cases.append((pdf_path, pages))
+
+        for pdf_path, pages in cases:
+            print(f"\n📄 {pages} 页:")
+            serial_result = None
+            for workers in args.workers:
+                result = run_extraction(pdf_path, pages, workers, args.repeat)
+                if serial_result is None:
+                    serial_result = result
+                same = "一致" if result['result'] == serial_result['result'] else "不一致!"
+                pages_per_sec = result['pages'] / result['seconds'] if result['seconds'] else 0
+                print(f"   workers={workers}: {result['seconds']:.3f} 秒, "
+                      f"{pages_per_sec:.0f} 页/秒, 结果与首个配置{same}")
+
+    print("\n=== 测试完成 ===")
+    print("说明: 页数低于 PYMUPDF_PARALLEL_MIN_PAGES 时始终串行提取")
+
+
+if __name__ == "__main__":
+    main()
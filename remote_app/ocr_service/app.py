@@ -2,19 +2,24 @@
 Remote OCR Service - Flask application for PaddleOCR processing.
 """
 import os
+import io
 import sys
+import json
 import uuid
+import tarfile
 import traceback
 import base64
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
 from werkzeug.utils import secure_filename
 
 from shared.config import OCRServiceConfig
 from shared.logging import setup_logging
 from shared.auth import require_api_key, get_client_ip
 from processor import OCRProcessor
+from job_queue import OCRJobQueue, QueueFullError, JOB_COMPLETED, FINISHED_STATES
 from utils.file_handler import FileHandler
+from utils.ocr_cache import OCRResultCache
 
 
 # Initialize Flask app
@@ -27,6 +32,34 @@ logger = setup_logging('ocr_service', OCRServiceConfig.LOG_LEVEL, OCRServiceConf
 # Initialize components
 file_handler = FileHandler(OCRServiceConfig.TEMP_DIR, OCRServiceConfig.RESULTS_DIR)
 ocr_processor = OCRProcessor()
+ocr_cache = (OCRResultCache(OCRServiceConfig.CACHE_DIR, OCRServiceConfig.CACHE_MAX_MB)
+             if OCRServiceConfig.CACHE_ENABLED else None)
+
+
+def process_and_cache(cache_key=None, pdf_sha256=None, page_range=None, **kwargs):
+    """Run OCR for a queued job and store a successful result in the cache."""
+    ocr_result, status_info = ocr_processor.process_pdf(**kwargs)
+    if ocr_cache and cache_key and ocr_result is not None and status_info.get('saved_files'):
+        ocr_cache.put(cache_key, pdf_sha256, tuple(page_range), ocr_processor.pipeline_version,
+                      status_info['saved_files'][0], status_info)
+    return ocr_result, status_info
+
+
+def purge_expired_jobs():
+    """Remove finished jobs past the retention period together with their results."""
+    for results_dir in job_queue.purge_finished(OCRServiceConfig.JOB_RETENTION_HOURS):
+        file_handler.remove_directory(results_dir)
+
+
+job_queue = OCRJobQueue(
+    process_func=process_and_cache,
+    db_path=OCRServiceConfig.JOB_DB_PATH,
+    workers=OCRServiceConfig.JOB_WORKERS,
+    max_pending=OCRServiceConfig.JOB_QUEUE_MAX,
+    cleanup_func=file_handler.cleanup_temp_files
+)
+purge_expired_jobs()
+job_queue.start()
 
 
 @app.route('/api/health', methods=['GET'])
@@ -35,97 +68,255 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'service': 'ocr_service',
-        'version': '1.0.0'
+        'version': '1.0.0',
+        'pipeline_pool': ocr_processor.get_pool_stats(),
+        'job_queue': job_queue.get_stats(),
+        'page_scheduler': ocr_processor.get_scheduler_stats(),
+        'result_cache': ocr_cache.get_stats() if ocr_cache else None
     })
 
 
+class BadRequest(Exception):
+    """Invalid OCR request, reported to the client as HTTP 400."""
+
+
+def _parse_page_params():
+    """Read max_pages/start_page/end_page from the form."""
+    try:
+        max_pages = int(request.form.get('max_pages', OCRServiceConfig.MAX_PAGES))
+        start_page = int(request.form.get('start_page', 1))
+        end_page = request.form.get('end_page')
+        end_page = int(end_page) if end_page not in (None, '') else None
+    except ValueError:
+        raise BadRequest('max_pages, start_page and end_page must be integers')
+    
+    if max_pages < 1 or start_page < 1 or (end_page is not None and end_page < start_page):
+        raise BadRequest('Invalid page range')
+    
+    return {'max_pages': max_pages, 'start_page': start_page, 'end_page': end_page}
+
+
+def _submit_uploaded_pdf():
+    """
+    Validate the uploaded PDF and queue it for OCR.
+    
+    Identical PDFs and page ranges already OCR'd by the current pipeline are answered
+    from the result cache and recorded as completed jobs straight away.
+    
+    Returns:
+        Job ID
+    """
+    if 'file' not in request.files:
+        raise BadRequest('No file uploaded')
+    
+    file = request.files['file']
+    if file.filename == '':
+        raise BadRequest('No file selected')
+    
+    page_params = _parse_page_params()
+    arxiv_id = request.form.get('arxiv_id', 'unknown')
+    
+    logger.info(f"Processing PDF: {file.filename}, max_pages: {page_params['max_pages']}, "
+                f"pages: {page_params['start_page']}-{page_params['end_page'] or 'auto'}, arxiv_id: {arxiv_id}")
+    
+    purge_expired_jobs()
+    
+    job_id = str(uuid.uuid4())
+    file_data = file.read()
+    temp_file_path = file_handler.save_uploaded_file(file_data, file.filename)
+    
+    try:
+        is_valid, error_msg = file_handler.validate_pdf(temp_file_path)
+        if not is_valid:
+            raise BadRequest(error_msg)
+        
+        page_range = ocr_processor.resolve_page_range(
+            file_handler.get_page_count(temp_file_path), **page_params
+        )
+        if page_range[0] > page_range[1]:
+            raise BadRequest('start_page is beyond the end of the document')
+        
+        results_dir = file_handler.create_job_directory(job_id)
+        
+        cache_params = {}
+        if ocr_cache:
+            pdf_sha256 = OCRResultCache.hash_pdf(file_data)
+            cache_key = OCRResultCache.make_key(pdf_sha256, page_range, ocr_processor.pipeline_version)
+            cached = ocr_cache.lookup(cache_key, results_dir, arxiv_id)
+            if cached:
+                ocr_result_path, status_info = cached
+                logger.info(f"OCR cache hit for {arxiv_id} (pages {page_range[0]}-{page_range[1]})")
+                file_handler.cleanup_temp_files([temp_file_path])
+                return job_queue.add_completed(
+                    results_dir=results_dir,
+                    ocr_result_path=ocr_result_path,
+                    status_info=status_info,
+                    arxiv_id=arxiv_id,
+                    job_id=job_id,
+                    **page_params
+                )
+            cache_params = {'cache_key': cache_key, 'pdf_sha256': pdf_sha256, 'page_range': list(page_range)}
+        
+        # The worker removes the uploaded file once the job finishes
+        return job_queue.submit(
+            pdf_path=temp_file_path,
+            results_dir=results_dir,
+            arxiv_id=arxiv_id,
+            job_id=job_id,
+            **page_params,
+            **cache_params
+        )
+    except Exception:
+        file_handler.cleanup_temp_files([temp_file_path])
+        raise
+
+
+def _job_status_payload(job):
+    """Public view of a job record."""
+    payload = {
+        'job_id': job['job_id'],
+        'arxiv_id': job['arxiv_id'],
+        'status': job['status'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at'],
+        'status_info': job['status_info'],
+        'error': job['error']
+    }
+    if 'queue_position' in job:
+        payload['queue_position'] = job['queue_position']
+    if job['status'] == 'running':
+        payload['progress'] = ocr_processor.get_job_progress(job['job_id'])
+    return payload
+
+
+RESULT_TAR_MIMETYPE = 'application/x-tar'
+
+
+def _job_image_files(job):
+    """Images produced for a job, in a stable order."""
+    imgs_dir = Path(job['results_dir']) / "imgs"
+    return sorted(imgs_dir.glob("*.jpg")) if imgs_dir.exists() else []
+
+
+def _wants_tar_stream():
+    """Whether the client explicitly asked for the streamed tar result (old clients send */*)."""
+    return any(mimetype == RESULT_TAR_MIMETYPE and quality > 0
+               for mimetype, quality in request.accept_mimetypes)
+
+
+class _StreamBuffer:
+    """Write-only file object that hands written bytes to a generator."""
+    
+    def __init__(self):
+        self._chunks = []
+    
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _stream_job_result_tar(job):
+    """
+    Yield the job result as an uncompressed tar stream.
+    
+    The first member is result.json (same fields as the JSON response, without
+    images); each image follows as imgs/<name>, read from disk one at a time.
+    """
+    buffer = _StreamBuffer()
+    with tarfile.open(fileobj=buffer, mode='w|') as tar:
+        metadata = json.dumps({
+            'job_id': job['job_id'],
+            'arxiv_id': job['arxiv_id'],
+            'ocr_result': job_queue.read_result(job),
+            'status_info': job['status_info'],
+            'success': True
+        }, ensure_ascii=False).encode('utf-8')
+        info = tarfile.TarInfo('result.json')
+        info.size = len(metadata)
+        tar.addfile(info, io.BytesIO(metadata))
+        yield buffer.drain()
+        
+        for img_file in _job_image_files(job):
+            try:
+                tar.add(str(img_file), arcname=f"imgs/{img_file.name}")
+            except Exception as e:
+                logger.warning(f"Failed to stream image {img_file}: {e}")
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+def _job_result_response(job):
+    """Completed job result, streamed as tar when the client accepts it, JSON otherwise."""
+    if _wants_tar_stream():
+        return Response(stream_with_context(_stream_job_result_tar(job)), mimetype=RESULT_TAR_MIMETYPE)
+    return jsonify(_job_result_payload(job))
+
+
+def _job_result_payload(job):
+    """Full OCR result of a completed job, with images embedded as base64."""
+    images_data = {}
+    for img_file in _job_image_files(job):
+        try:
+            with open(img_file, 'rb') as f:
+                img_base64 = base64.b64encode(f.read()).decode('utf-8')
+                images_data[img_file.name] = img_base64
+        except Exception as e:
+            logger.warning(f"Failed to encode image {img_file}: {e}")
+    
+    return {
+        'job_id': job['job_id'],
+        'arxiv_id': job['arxiv_id'],
+        'ocr_result': job_queue.read_result(job),
+        'status_info': job['status_info'],
+        'images': images_data,
+        'success': True
+    }
+
+
 @app.route('/api/ocr/process', methods=['POST'])
 @require_api_key
 def process_ocr():
     """
-    Process PDF file using PaddleOCR.
+    Process PDF file using PaddleOCR and wait for the result.
+    
+    Kept for clients that do not use the job API; the work still goes through
+    the job queue, so concurrent requests share the bounded worker pool.
     
     Expected form data:
     - file: PDF file
     - max_pages: (optional) Maximum pages to process
+    - start_page: (optional) First page to process, 1-based (default 1)
+    - end_page: (optional) Last page to process, 1-based inclusive
     - arxiv_id: (optional) ArXiv paper ID for naming
     """
     client_ip = get_client_ip()
     logger.info(f"OCR processing request from {client_ip}")
     
     try:
-        # Check if file was uploaded
-        if 'file' not in request.files:
-            return jsonify({'error': 'No file uploaded'}), 400
-        
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
-        
-        # Get parameters
-        max_pages = int(request.form.get('max_pages', OCRServiceConfig.MAX_PAGES))
-        arxiv_id = request.form.get('arxiv_id', 'unknown')
-        
-        logger.info(f"Processing PDF: {file.filename}, max_pages: {max_pages}, arxiv_id: {arxiv_id}")
+        job_id = _submit_uploaded_pdf()
+        job = job_queue.wait(job_id)
         
-        # Generate job ID
-        job_id = str(uuid.uuid4())
+        if job['status'] != JOB_COMPLETED:
+            return jsonify({
+                'error': job['error'] or 'OCR processing failed',
+                'status_info': job['status_info']
+            }), 500
         
-        # Save uploaded file
-        file_data = file.read()
-        temp_file_path = file_handler.save_uploaded_file(file_data, file.filename)
+        logger.info(f"OCR processing completed successfully for job {job_id}")
         
-        try:
-            # Validate PDF
-            is_valid, error_msg = file_handler.validate_pdf(temp_file_path)
-            if not is_valid:
-                return jsonify({'error': error_msg}), 400
-            
-            # Create results directory using arxiv_id for consistency
-            results_dir = file_handler.create_results_directory(arxiv_id, job_id)
-            
-            # Process PDF with OCR
-            ocr_result, status_info = ocr_processor.process_pdf(
-                pdf_path=temp_file_path,
-                max_pages=max_pages,
-                output_path=results_dir,
-                arxiv_id=arxiv_id
-            )
-            
-            if ocr_result is None:
-                return jsonify({
-                    'error': 'OCR processing failed',
-                    'status_info': status_info
-                }), 500
-            
-            # Read and encode images for transmission
-            images_data = {}
-            imgs_dir = Path(results_dir) / "imgs"
-            if imgs_dir.exists():
-                for img_file in imgs_dir.glob("*.jpg"):
-                    try:
-                        with open(img_file, 'rb') as f:
-                            img_base64 = base64.b64encode(f.read()).decode('utf-8')
-                            images_data[img_file.name] = img_base64
-                    except Exception as e:
-                        logger.warning(f"Failed to encode image {img_file}: {e}")
-            
-            logger.info(f"OCR processing completed successfully for job {job_id}, images: {len(images_data)}")
-            
-            # Return response with embedded images for remote transmission
-            return jsonify({
-                'job_id': job_id,
-                'arxiv_id': arxiv_id,
-                'ocr_result': ocr_result,
-                'status_info': status_info,
-                'images': images_data,
-                'success': True
-            })
-            
-        finally:
-            # Cleanup temporary file
-            file_handler.cleanup_temp_files([temp_file_path])
+        # Stream images as tar when the client accepts it, otherwise embed them in JSON
+        return _job_result_response(job)
     
+    except BadRequest as e:
+        return jsonify({'error': str(e)}), 400
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 503
     except Exception as e:
         logger.error(f"OCR processing error: {str(e)}")
         logger.error(traceback.format_exc())
@@ -135,24 +326,87 @@ def process_ocr():
         }), 500
 
 
+@app.route('/api/ocr/jobs', methods=['POST'])
+@require_api_key
+def submit_ocr_job():
+    """
+    Queue a PDF for OCR and return immediately.
+    
+    Accepts the same form data as /api/ocr/process. Responds with 202 and the
+    job_id; poll /api/ocr/jobs/<job_id> and fetch /api/ocr/jobs/<job_id>/result.
+    """
+    client_ip = get_client_ip()
+    logger.info(f"OCR job submission from {client_ip}")
+    
+    try:
+        job_id = _submit_uploaded_pdf()
+        return jsonify(_job_status_payload(job_queue.get(job_id))), 202
+    
+    except BadRequest as e:
+        return jsonify({'error': str(e)}), 400
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    except Exception as e:
+        logger.error(f"OCR job submission error: {str(e)}")
+        logger.error(traceback.format_exc())
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+
+@app.route('/api/ocr/jobs/<job_id>', methods=['GET'])
+@require_api_key
+def get_ocr_job(job_id):
+    """
+    Job status. With ?wait=<seconds> the request long-polls until the job
+    finishes or the wait (capped at OCR_JOB_MAX_WAIT) expires.
+    """
+    try:
+        wait = min(float(request.args.get('wait', 0)), OCRServiceConfig.JOB_MAX_WAIT)
+    except ValueError:
+        return jsonify({'error': 'wait must be a number'}), 400
+    
+    job = job_queue.wait(job_id, timeout=wait) if wait > 0 else job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(_job_status_payload(job))
+
+
+@app.route('/api/ocr/jobs/<job_id>/result', methods=['GET'])
+@require_api_key
+def get_ocr_job_result(job_id):
+    """
+    OCR result of a finished job (same body as /api/ocr/process).
+    
+    Clients sending "Accept: application/x-tar" receive a streamed tar with
+    result.json followed by imgs/*; others get JSON with base64 images.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if job['status'] not in FINISHED_STATES:
+        return jsonify({'error': 'Job not finished', **_job_status_payload(job)}), 409
+    if job['status'] != JOB_COMPLETED:
+        return jsonify({
+            'error': job['error'] or 'OCR processing failed',
+            'status_info': job['status_info'],
+            'success': False
+        }), 500
+    return _job_result_response(job)
+
+
 @app.route('/api/ocr/download/<job_id>', methods=['GET'])
 @require_api_key
 def download_results(job_id):
-    """Download OCR results for a job."""
+    """Download the OCR markdown of a completed job."""
     try:
-        results_dir = os.path.join(OCRServiceConfig.RESULTS_DIR, job_id)
-        
-        if not os.path.exists(results_dir):
+        job = job_queue.get(job_id)
+        if job is None:
             return jsonify({'error': 'Job not found'}), 404
         
-        # Find the analysis markdown file
-        analysis_files = [f for f in os.listdir(results_dir) if f.endswith('_analysis.md')]
-        
-        if not analysis_files:
+        result_path = job.get('ocr_result_path')
+        if job['status'] != JOB_COMPLETED or not result_path or not os.path.exists(result_path):
             return jsonify({'error': 'No results available'}), 404
         
-        analysis_file = os.path.join(results_dir, analysis_files[0])
-        return send_file(analysis_file, as_attachment=True)
+        return send_file(result_path, as_attachment=True)
         
     except Exception as e:
         logger.error(f"Download error: {str(e)}")
@@ -175,7 +429,8 @@ def handle_exception(e):
 
 if __name__ == '__main__':
     logger.info("Starting OCR Service...")
-    logger.info(f"Config: Max pages={OCRServiceConfig.MAX_PAGES}, GPU={OCRServiceConfig.USE_GPU}")
+    logger.info(f"Config: Max pages={OCRServiceConfig.MAX_PAGES}, GPU={OCRServiceConfig.USE_GPU}, "
+                f"job workers={OCRServiceConfig.JOB_WORKERS}")
     
     # Cleanup old files on startup
     file_handler.cleanup_old_files()
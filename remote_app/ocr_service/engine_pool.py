@@ -0,0 +1,187 @@
+"""
+Warm PPStructureV3 pipeline pool for the OCR service.
+
+Mirrors HomeSystem.utility.arxiv.ocr_engine_pool: loading PPStructureV3 reloads every
+detection, layout and recognition model, so pipelines are created once, handed out
+through checkout/checkin and evicted after being idle for a configurable time.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger('ocr_service')
+
+
+class OCREnginePool:
+    """Thread-safe pool of warm OCR pipeline instances."""
+
+    def __init__(self, factory: Callable[[], Any], size: int = 1, idle_timeout: float = 1800,
+                 on_create: Optional[Callable[[Any], None]] = None):
+        """
+        Args:
+            factory: Callable creating a pipeline instance
+            size: Maximum number of live instances
+            idle_timeout: Seconds before an idle instance is evicted, 0 disables eviction
+            on_create: Called with each newly created instance; must not keep a strong reference
+        """
+        self.factory = factory
+        self.on_create = on_create
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self._condition = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []  # (instance, returned at)
+        self._created = 0  # live instances, including ones being created
+        self._reaper: Optional[threading.Thread] = None
+        self._stats = {'created': 0, 'evicted': 0, 'checkouts': 0, 'waits': 0}
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a pipeline, waiting if none is idle and the pool is full.
+
+        Args:
+            timeout: Maximum seconds to wait, None waits forever
+
+        Returns:
+            Pipeline instance
+
+        Raises:
+            TimeoutError: No instance became available in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._idle and self._created >= self.size:
+                self._stats['waits'] += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Timed out waiting for an OCR pipeline")
+                self._condition.wait(remaining)
+
+            self._stats['checkouts'] += 1
+            if self._idle:
+                # LIFO keeps the most recently used instance hot
+                engine, _ = self._idle.pop()
+                return engine
+            self._created += 1
+
+        # Create outside the lock so other threads can still check in
+        try:
+            engine = self._create_engine()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+        return engine
+
+    def checkin(self, engine: Any):
+        """Return a pipeline to the pool."""
+        with self._condition:
+            self._idle.append((engine, time.monotonic()))
+            self._condition.notify()
+
+    def discard(self, engine: Any):
+        """Drop a broken pipeline and free its slot."""
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def engine(self, timeout: Optional[float] = None):
+        """Context manager that checks a pipeline out, back in on success and discards it on error."""
+        engine = self.checkout(timeout)
+        try:
+            yield engine
+        except BaseException:
+            # A pipeline that raised may be left in a broken state, do not hand it to the next caller
+            self.discard(engine)
+            raise
+        self.checkin(engine)
+
+    def prewarm(self, count: Optional[int] = None) -> int:
+        """
+        Create instances ahead of the first request.
+
+        Args:
+            count: Number of instances to warm, defaults to the pool size
+
+        Returns:
+            Number of idle instances ready after warming
+        """
+        count = self.size if count is None else min(count, self.size)
+        engines = []
+        try:
+            # Check out and back in, so existing idle instances are reused
+            for _ in range(count):
+                engines.append(self.checkout(timeout=0))
+        except TimeoutError:
+            pass
+        except Exception as e:
+            logger.error(f"OCR pipeline prewarm failed: {e}")
+        for engine in engines:
+            self.checkin(engine)
+        logger.info(f"OCR pipeline pool warmed: {len(engines)}/{self.size} idle")
+        return len(engines)
+
+    def evict_idle(self) -> int:
+        """Evict instances idle longer than idle_timeout, returns the count."""
+        if not self.idle_timeout:
+            return 0
+        now = time.monotonic()
+        with self._condition:
+            expired = [item for item in self._idle if now - item[1] >= self.idle_timeout]
+            if not expired:
+                return 0
+            self._idle = [item for item in self._idle if now - item[1] < self.idle_timeout]
+            self._created -= len(expired)
+            self._stats['evicted'] += len(expired)
+            self._condition.notify_all()
+        evicted = len(expired)
+        expired.clear()  # drop references so model memory can be reclaimed
+        logger.info(f"Evicted {evicted} idle OCR pipeline(s)")
+        return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics."""
+        with self._condition:
+            return {
+                'size': self.size,
+                'alive': self._created,
+                'idle': len(self._idle),
+                'idle_timeout': self.idle_timeout,
+                **self._stats
+            }
+
+    def _create_engine(self) -> Any:
+        start = time.perf_counter()
+        engine = self.factory()
+        with self._condition:
+            self._stats['created'] += 1
+        logger.info(f"OCR pipeline created in {time.perf_counter() - start:.1f}s")
+        if self.on_create:
+            try:
+                self.on_create(engine)
+            except Exception as e:
+                logger.warning(f"OCR pipeline on_create hook failed: {e}")
+        self._start_reaper()
+        return engine
+
+    def _start_reaper(self):
+        """Start the background eviction thread once."""
+        if not self.idle_timeout:
+            return
+        with self._condition:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name="ocr-engine-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        interval = max(1.0, self.idle_timeout / 2)
+        while True:
+            time.sleep(interval)
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Failed to evict idle OCR pipelines: {e}")
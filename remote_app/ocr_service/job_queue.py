@@ -0,0 +1,316 @@
+"""
+Persistent OCR job queue for the remote OCR service.
+
+Uploads are stored on disk and recorded in SQLite; a bounded pool of worker
+threads drains the queue through OCRProcessor. Jobs that were queued or running
+when the service stopped are re-queued on start, so clients can keep polling the
+same job_id across restarts.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger('ocr_service')
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+FINISHED_STATES = (JOB_COMPLETED, JOB_FAILED)
+
+
+class QueueFullError(Exception):
+    """Raised when the queue already holds the maximum number of pending jobs."""
+
+
+class OCRJobQueue:
+    """SQLite-backed OCR job queue with a bounded worker pool."""
+
+    def __init__(
+        self,
+        process_func: Callable[..., Any],
+        db_path: str,
+        workers: int = 1,
+        max_pending: int = 100,
+        cleanup_func: Optional[Callable[[List[str]], None]] = None
+    ):
+        """
+        Args:
+            process_func: OCRProcessor.process_pdf compatible callable
+            db_path: SQLite file holding the job table
+            workers: Number of worker threads
+            max_pending: Maximum queued jobs before submissions are rejected
+            cleanup_func: Called with the uploaded file path once a job finishes
+        """
+        self.process_func = process_func
+        self.db_path = db_path
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.cleanup_func = cleanup_func
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ocr_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    arxiv_id TEXT,
+                    pdf_path TEXT NOT NULL,
+                    results_dir TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    ocr_result_path TEXT,
+                    status_info TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_jobs_status ON ocr_jobs(status, created_at)")
+
+    def start(self):
+        """Re-queue interrupted jobs and start the worker threads."""
+        with self._condition, self._connect() as conn:
+            requeued = conn.execute(
+                "UPDATE ocr_jobs SET status = ?, started_at = NULL WHERE status = ?",
+                (JOB_QUEUED, JOB_RUNNING)
+            ).rowcount
+        if requeued:
+            logger.info(f"Re-queued {requeued} interrupted OCR job(s)")
+
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"ocr-job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"OCR job queue started with {self.workers} worker(s)")
+
+    def submit(
+        self,
+        pdf_path: str,
+        results_dir: str,
+        arxiv_id: str = "unknown",
+        job_id: Optional[str] = None,
+        **params
+    ) -> str:
+        """
+        Queue a PDF for OCR.
+
+        Args:
+            pdf_path: Uploaded PDF, removed via cleanup_func after processing
+            results_dir: Output directory for markdown and images
+            arxiv_id: ArXiv paper ID for naming
+            job_id: Optional pre-generated job ID
+            **params: Extra process_func arguments (max_pages, start_page, end_page)
+
+        Returns:
+            Job ID
+
+        Raises:
+            QueueFullError: Too many jobs are already pending
+        """
+        job_id = job_id or str(uuid.uuid4())
+        with self._condition:
+            with self._connect() as conn:
+                pending = conn.execute(
+                    "SELECT COUNT(*) FROM ocr_jobs WHERE status = ?", (JOB_QUEUED,)
+                ).fetchone()[0]
+                if pending >= self.max_pending:
+                    raise QueueFullError(f"OCR queue is full ({pending} pending jobs)")
+                conn.execute(
+                    "INSERT INTO ocr_jobs (job_id, status, arxiv_id, pdf_path, results_dir, params, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, JOB_QUEUED, arxiv_id, pdf_path, results_dir, json.dumps(params), time.time())
+                )
+            self._condition.notify_all()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job record without the OCR text, None if unknown."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM ocr_jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            job = self._row_to_dict(row)
+            if job['status'] == JOB_QUEUED:
+                job['queue_position'] = conn.execute(
+                    "SELECT COUNT(*) FROM ocr_jobs WHERE status = ? AND created_at < ?",
+                    (JOB_QUEUED, row['created_at'])
+                ).fetchone()[0]
+        return job
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Long-poll until the job finishes or the timeout expires.
+
+        Returns:
+            Latest job record, None if unknown
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                job = self.get(job_id)
+                if job is None or job['status'] in FINISHED_STATES:
+                    return job
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return job
+                self._condition.wait(remaining)
+
+    def read_result(self, job: Dict[str, Any]) -> Optional[str]:
+        """OCR markdown of a completed job."""
+        path = job.get('ocr_result_path')
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Job counts by status."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM ocr_jobs GROUP BY status").fetchall()
+        counts = {status: count for status, count in rows}
+        return {
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            **{state: counts.get(state, 0) for state in (JOB_QUEUED, JOB_RUNNING, JOB_COMPLETED, JOB_FAILED)}
+        }
+
+    def add_completed(
+        self,
+        results_dir: str,
+        ocr_result_path: str,
+        status_info: Dict[str, Any],
+        arxiv_id: str = "unknown",
+        job_id: Optional[str] = None,
+        **params
+    ) -> str:
+        """
+        Record a job that was answered without running OCR (e.g. from the result cache).
+
+        Returns:
+            Job ID
+        """
+        job_id = job_id or str(uuid.uuid4())
+        now = time.time()
+        with self._condition:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO ocr_jobs (job_id, status, arxiv_id, pdf_path, results_dir, params, "
+                    "ocr_result_path, status_info, created_at, started_at, finished_at) "
+                    "VALUES (?, ?, ?, '', ?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, JOB_COMPLETED, arxiv_id, results_dir, json.dumps(params),
+                     ocr_result_path, json.dumps(status_info), now, now, now)
+                )
+            self._condition.notify_all()
+        return job_id
+
+    def purge_finished(self, max_age_hours: int = 24) -> List[str]:
+        """
+        Drop finished job records older than max_age_hours.
+
+        Returns:
+            Results directories of the purged jobs, for the caller to remove
+        """
+        cutoff = time.time() - max_age_hours * 3600
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT job_id, results_dir FROM ocr_jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*FINISHED_STATES, cutoff)
+            ).fetchall()
+            conn.executemany("DELETE FROM ocr_jobs WHERE job_id = ?", [(row['job_id'],) for row in rows])
+        return [row['results_dir'] for row in rows]
+
+    def _claim_next(self) -> Optional[sqlite3.Row]:
+        """Atomically move the oldest queued job to running."""
+        conn = self._connect()
+        try:
+            # BEGIN IMMEDIATE takes the write lock before reading, so two workers
+            # (even in different processes) never claim the same job
+            conn.isolation_level = None
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM ocr_jobs WHERE status = ? ORDER BY created_at LIMIT 1", (JOB_QUEUED,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE ocr_jobs SET status = ?, started_at = ? WHERE job_id = ?",
+                    (JOB_RUNNING, time.time(), row['job_id'])
+                )
+            conn.execute("COMMIT")
+            return row
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                row = self._claim_next()
+                while row is None:
+                    self._condition.wait()
+                    row = self._claim_next()
+            self._run_job(row)
+
+    def _run_job(self, row: sqlite3.Row):
+        job_id = row['job_id']
+        params = json.loads(row['params'])
+        logger.info(f"Running OCR job {job_id} (arxiv_id: {row['arxiv_id']})")
+
+        ocr_result, status_info, error = None, {}, None
+        try:
+            if not os.path.exists(row['pdf_path']):
+                raise FileNotFoundError(f"Uploaded PDF is missing: {row['pdf_path']}")
+            ocr_result, status_info = self.process_func(
+                pdf_path=row['pdf_path'],
+                output_path=row['results_dir'],
+                arxiv_id=row['arxiv_id'],
+                job_id=job_id,
+                **params
+            )
+            if ocr_result is None:
+                error = status_info.get('error', 'OCR processing failed')
+        except Exception as e:
+            logger.error(f"OCR job {job_id} failed: {e}")
+            error = str(e)
+
+        # The processor writes the markdown file first in saved_files
+        saved_files = status_info.get('saved_files') or []
+        ocr_result_path = saved_files[0] if ocr_result is not None and saved_files else None
+
+        with self._condition:
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE ocr_jobs SET status = ?, ocr_result_path = ?, status_info = ?, error = ?, "
+                    "finished_at = ? WHERE job_id = ?",
+                    (JOB_FAILED if error else JOB_COMPLETED, ocr_result_path, json.dumps(status_info),
+                     error, time.time(), job_id)
+                )
+            self._condition.notify_all()
+
+        if self.cleanup_func:
+            self.cleanup_func([row['pdf_path']])
+        logger.info(f"OCR job {job_id} {'failed' if error else 'completed'}")
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['status_info'] = json.loads(job['status_info']) if job['status_info'] else None
+        return job
@@ -0,0 +1,253 @@
+"""
+Page-batched inference scheduler for the OCR service.
+
+Instead of running PPStructureV3 over one PDF per request, PDFs are split into page
+tasks. Dispatcher threads (one per warm pipeline) collect pending pages from all
+running jobs, render them and run them through the pipeline as a single batch, then
+hand each page result back to its job. Jobs are served round-robin so a long
+document does not starve short ones, and per-job progress and pages/sec are tracked.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from engine_pool import OCREnginePool
+
+logger = logging.getLogger('ocr_service')
+
+# Matches the rendering PaddleX uses for PDF input (2x zoom, BGR)
+RENDER_ZOOM = 2.0
+
+
+class PageJob:
+    """Pages of one PDF going through the scheduler."""
+
+    def __init__(self, job_id: str, pdf_path: str, pages: List[int]):
+        self.job_id = job_id
+        self.pdf_path = pdf_path
+        self.pages = pages  # 0-based page numbers
+        self.pending: Deque[int] = deque(pages)
+        self.results: Dict[int, Any] = {}
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.done = threading.Event()
+        self._document = None
+        self._document_lock = threading.Lock()
+
+    def render(self, page_num: int) -> np.ndarray:
+        """Render one page as a BGR image array."""
+        with self._document_lock:
+            if self._document is None:
+                self._document = fitz.open(self.pdf_path)
+            pixmap = self._document[page_num].get_pixmap(matrix=fitz.Matrix(RENDER_ZOOM, RENDER_ZOOM), alpha=False)
+        image = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(pixmap.height, pixmap.width, pixmap.n)
+        return np.ascontiguousarray(image[:, :, ::-1])
+
+    def close(self):
+        with self._document_lock:
+            if self._document is not None:
+                self._document.close()
+                self._document = None
+
+    def progress(self) -> Dict[str, Any]:
+        """Completed pages and throughput of this job."""
+        done_pages = len(self.results)
+        elapsed = ((self.finished_at or time.time()) - self.started_at) if self.started_at else 0
+        return {
+            'total_pages': len(self.pages),
+            'completed_pages': done_pages,
+            'percent': round(done_pages * 100 / len(self.pages), 1) if self.pages else 100.0,
+            'pages_per_sec': round(done_pages / elapsed, 2) if elapsed > 0 else 0.0
+        }
+
+
+class PageBatchScheduler:
+    """Batches pages from concurrent jobs onto the warm pipeline pool."""
+
+    def __init__(self, pool: OCREnginePool, max_batch_pages: int = 8, batch_wait_ms: int = 50):
+        """
+        Args:
+            pool: Warm pipeline pool; one dispatcher thread runs per pipeline
+            max_batch_pages: Largest batch sent to the pipeline, halved automatically
+                when the device runs out of memory
+            batch_wait_ms: How long a dispatcher waits for more pages before running
+                a partial batch
+        """
+        self.pool = pool
+        self.max_batch_pages = max(1, max_batch_pages)
+        self.batch_pages = self.max_batch_pages
+        self.batch_wait = batch_wait_ms / 1000
+        self._condition = threading.Condition()
+        self._jobs: "OrderedDict[str, PageJob]" = OrderedDict()  # jobs with pending pages, round-robin order
+        self._progress: Dict[str, PageJob] = {}
+        self._completed_pages: Deque[Tuple[float, int]] = deque()  # (timestamp, pages) for the last minute
+        self._stats = {'pages': 0, 'batches': 0, 'failed_batches': 0, 'jobs': 0}
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """Start one dispatcher per pipeline in the pool."""
+        for index in range(self.pool.size):
+            thread = threading.Thread(target=self._dispatch_loop, name=f"ocr-page-dispatcher-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Page scheduler started: {self.pool.size} dispatcher(s), batch up to {self.max_batch_pages} pages")
+
+    def run(self, job_id: str, pdf_path: str, first_page: int, last_page: int) -> List[Any]:
+        """
+        OCR pages first_page..last_page (1-based, inclusive) and wait for the result.
+
+        Returns:
+            Pipeline results in page order
+
+        Raises:
+            RuntimeError: A batch containing one of the pages failed
+        """
+        job = PageJob(job_id, pdf_path, list(range(first_page - 1, last_page)))
+        with self._condition:
+            self._jobs[job_id] = job
+            self._progress[job_id] = job
+            self._stats['jobs'] += 1
+            self._condition.notify_all()
+
+        try:
+            job.done.wait()
+            if job.error:
+                raise RuntimeError(job.error)
+            return [job.results[page_num] for page_num in job.pages]
+        finally:
+            job.close()
+            with self._condition:
+                self._jobs.pop(job_id, None)
+                self._progress.pop(job_id, None)
+
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Progress of a job currently in the scheduler."""
+        with self._condition:
+            job = self._progress.get(job_id)
+            return job.progress() if job else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler throughput metrics."""
+        with self._condition:
+            now = time.time()
+            while self._completed_pages and now - self._completed_pages[0][0] > 60:
+                self._completed_pages.popleft()
+            recent_pages = sum(pages for _, pages in self._completed_pages)
+            return {
+                'dispatchers': len(self._threads),
+                'batch_pages': self.batch_pages,
+                'max_batch_pages': self.max_batch_pages,
+                'active_jobs': len(self._progress),
+                'pending_pages': sum(len(job.pending) for job in self._jobs.values()),
+                'pages_per_sec_1m': round(recent_pages / 60, 2),
+                'avg_batch_pages': round(self._stats['pages'] / self._stats['batches'], 2) if self._stats['batches'] else 0.0,
+                **self._stats
+            }
+
+    def _next_batch(self) -> List[Tuple[PageJob, int]]:
+        """Take up to batch_pages pages, one job at a time in round-robin order."""
+        batch = []
+        while len(batch) < self.batch_pages and self._jobs:
+            job_id, job = next(iter(self._jobs.items()))
+            page_num = job.pending.popleft()
+            if job.started_at is None:
+                job.started_at = time.time()
+            batch.append((job, page_num))
+            # Move the job to the back so other jobs get the next slot
+            self._jobs.move_to_end(job_id)
+            if not job.pending:
+                self._jobs.pop(job_id)
+        return batch
+
+    def _pending_pages(self) -> int:
+        return sum(len(job.pending) for job in self._jobs.values())
+
+    def _dispatch_loop(self):
+        while True:
+            with self._condition:
+                while not self._jobs:
+                    self._condition.wait()
+                # Give concurrent jobs a moment to add pages so the batch fills up
+                deadline = time.monotonic() + self.batch_wait
+                while self._pending_pages() < self.batch_pages:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._next_batch()
+            if batch:
+                self._run_batch(batch)
+
+    @staticmethod
+    def _is_out_of_memory(error: Exception) -> bool:
+        return 'out of memory' in str(error).lower()
+
+    def _predict(self, images: List[Any]) -> List[Any]:
+        """
+        Run one batch on a pooled pipeline.
+
+        A pipeline that raised is discarded, since it may be left in a broken state
+        and would fail the next batch too. Out-of-memory errors keep the instance:
+        the batch is shrunk and retried on it.
+        """
+        pipeline = self.pool.checkout()
+        try:
+            outputs = list(pipeline.predict(input=images))
+        except Exception as e:
+            if self._is_out_of_memory(e):
+                self.pool.checkin(pipeline)
+            else:
+                self.pool.discard(pipeline)
+            raise
+        self.pool.checkin(pipeline)
+        return outputs
+
+    def _run_batch(self, batch: List[Tuple[PageJob, int]]):
+        try:
+            images = [job.render(page_num) for job, page_num in batch]
+            outputs = self._predict(images)
+            if len(outputs) != len(batch):
+                raise RuntimeError(f"Pipeline returned {len(outputs)} results for {len(batch)} pages")
+        except Exception as e:
+            if self._is_out_of_memory(e) and len(batch) > 1:
+                self._shrink_and_requeue(batch)
+                return
+            logger.error(f"OCR page batch failed: {e}")
+            with self._condition:
+                self._stats['failed_batches'] += 1
+            for job in {job for job, _ in batch}:
+                job.error = f"OCR page batch failed: {e}"
+                with self._condition:
+                    self._jobs.pop(job.job_id, None)  # drop the job's remaining pages
+                job.done.set()
+            return
+
+        now = time.time()
+        with self._condition:
+            self._stats['pages'] += len(batch)
+            self._stats['batches'] += 1
+            self._completed_pages.append((now, len(batch)))
+        for (job, page_num), output in zip(batch, outputs):
+            job.results[page_num] = output
+            if len(job.results) == len(job.pages) and not job.done.is_set():
+                job.finished_at = now
+                job.done.set()
+
+    def _shrink_and_requeue(self, batch: List[Tuple[PageJob, int]]):
+        """Halve the batch size after an out-of-memory error and put the pages back."""
+        with self._condition:
+            self.batch_pages = max(1, min(self.batch_pages, len(batch)) // 2)
+            logger.warning(f"Out of memory with {len(batch)} pages per batch, reducing to {self.batch_pages}")
+            for job, page_num in reversed(batch):
+                job.pending.appendleft(page_num)
+                if job.job_id not in self._jobs:
+                    self._jobs[job.job_id] = job
+                    self._jobs.move_to_end(job.job_id, last=False)
+            self._condition.notify_all()
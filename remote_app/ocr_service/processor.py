@@ -3,11 +3,16 @@ OCR processor using PaddleOCR PPStructureV3 for remote service.
 Simplified to match local _performOCR_paddleocr implementation.
 """
 import os
+import uuid
+import weakref
 import tempfile
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 import fitz  # PyMuPDF
 from pathlib import Path
 
+from engine_pool import OCREnginePool
+from page_scheduler import PageBatchScheduler
+
 # Check if PaddleOCR is available
 print("DEBUG: Testing PaddleOCR import...")
 try:
@@ -28,40 +33,104 @@ class OCRProcessor:
     """PaddleOCR PPStructureV3 processor for document analysis."""
     
     def __init__(self):
-        """Initialize OCR processor."""
-        self.pipeline = None
+        """Initialize OCR processor and pre-warm the pipeline pool."""
+        from shared.config import OCRServiceConfig
+        self.pool = None
+        self.scheduler = None
+        self._markdown_merger = None  # weak reference to a pipeline's concatenate_markdown_pages
+        self.pipeline_version = OCRServiceConfig.PIPELINE_VERSION or self._detect_pipeline_version()
         if OCR_AVAILABLE:
-            try:
-                from shared.config import OCRServiceConfig
-                # Initialize PaddleOCR PPStructureV3 - matches local implementation
-                self.pipeline = PPStructureV3()
-                print(f"PPStructureV3 initialized successfully (GPU: {OCRServiceConfig.USE_GPU})")
-            except Exception as e:
-                print(f"Failed to initialize PPStructureV3: {e}")
-                self.pipeline = None
+            # PPStructureV3 instances are shared across requests instead of rebuilt per call
+            self.pool = OCREnginePool(
+                factory=PPStructureV3,
+                size=OCRServiceConfig.POOL_SIZE,
+                idle_timeout=OCRServiceConfig.POOL_IDLE_TIMEOUT,
+                on_create=self._capture_markdown_merger
+            )
+            warmed = self.pool.prewarm(OCRServiceConfig.POOL_PREWARM)
+            print(f"PPStructureV3 pool ready: {warmed} warm / {self.pool.size} max (GPU: {OCRServiceConfig.USE_GPU})")
+            if OCRServiceConfig.PAGE_BATCHING:
+                # Pages from concurrent requests are batched onto the pool
+                self.scheduler = PageBatchScheduler(
+                    self.pool,
+                    max_batch_pages=OCRServiceConfig.PAGE_BATCH_SIZE,
+                    batch_wait_ms=OCRServiceConfig.PAGE_BATCH_WAIT_MS
+                )
+                self.scheduler.start()
         else:
             print("PPStructureV3 not available - missing dependencies")
     
+    @staticmethod
+    def _detect_pipeline_version() -> str:
+        """Identifier of the installed pipeline, part of the result cache key."""
+        try:
+            from importlib.metadata import version
+            return f"PPStructureV3/paddleocr-{version('paddleocr')}"
+        except Exception:
+            return "PPStructureV3/unknown"
+    
+    def _capture_markdown_merger(self, pipeline):
+        """Remember the markdown merger of a new pipeline without keeping the pipeline alive."""
+        if hasattr(pipeline, 'concatenate_markdown_pages'):
+            self._markdown_merger = weakref.WeakMethod(pipeline.concatenate_markdown_pages)
+    
+    def _concatenate_markdown(self, markdown_list: List[Any], pipeline=None) -> str:
+        """
+        Merge per-page markdown - matches local implementation.
+        
+        Uses the given pipeline, or in scheduler mode the merger captured at pipeline
+        creation, so finished jobs never wait for (or block) a pooled pipeline.
+        Falls back to a plain join if no live pipeline is available.
+        """
+        if pipeline is not None and hasattr(pipeline, 'concatenate_markdown_pages'):
+            return pipeline.concatenate_markdown_pages(markdown_list)
+        merger = self._markdown_merger() if self._markdown_merger else None
+        if merger is not None:
+            return merger(markdown_list)
+        # Backup method: manual merge
+        return "\n\n".join([str(md) for md in markdown_list if md])
+    
+    def get_pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Pipeline pool statistics, None if OCR is unavailable."""
+        return self.pool.get_stats() if self.pool else None
+    
+    def get_scheduler_stats(self) -> Optional[Dict[str, Any]]:
+        """Page scheduler metrics (pages/sec, batch sizes), None if batching is off."""
+        return self.scheduler.get_stats() if self.scheduler else None
+    
+    def get_job_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Page progress of a running job, None if it is not in the scheduler."""
+        return self.scheduler.get_progress(job_id) if self.scheduler else None
+    
     def process_pdf(
         self, 
         pdf_path: str, 
         max_pages: int = 25,
         output_path: Optional[str] = None,
-        arxiv_id: str = "unknown"
+        arxiv_id: str = "unknown",
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        job_id: Optional[str] = None
     ) -> Tuple[Optional[str], Dict[str, Any]]:
         """
         Process PDF using PaddleOCR PPStructureV3 (matches local _performOCR_paddleocr).
         
+        Only the requested page range is passed to the pipeline, so large documents
+        can be split into several requests via start_page/end_page.
+        
         Args:
             pdf_path: Path to PDF file
-            max_pages: Maximum pages to process (unused but kept for API compatibility)
+            max_pages: Maximum pages to process
             output_path: Output directory path
             arxiv_id: ArXiv paper ID for naming
+            start_page: First page to process (1-based, inclusive)
+            end_page: Last page to process (1-based, inclusive), defaults to start_page + max_pages - 1
+            job_id: Job identifier used for progress reporting by the page scheduler
             
         Returns:
             Tuple of (OCR markdown text, status info dict)
         """
-        if not OCR_AVAILABLE or self.pipeline is None:
+        if not OCR_AVAILABLE or self.pool is None:
             return None, {
                 'error': 'PPStructureV3 not available or failed to initialize',
                 'total_pages': 0,
@@ -72,6 +141,8 @@ class OCRProcessor:
                 'saved_files': []
             }
         
+        sliced_pdf_path = None
+        pipeline = None
         try:
             # Check total pages using PyMuPDF - matches local implementation
             pdf_document = fitz.open(pdf_path)
@@ -80,12 +151,15 @@ class OCRProcessor:
             
             print(f"PDF总页数: {total_pages}")
             
+            first_page, last_page = self.resolve_page_range(total_pages, max_pages, start_page, end_page)
+            if first_page > last_page:
+                raise ValueError(f"起始页({start_page})超出文档页数({total_pages})")
+            pages_to_process = last_page - first_page + 1
+            
             # Check if document is oversized - matches local implementation
             is_oversized = total_pages > max_pages
-            if is_oversized:
-                print(f"文档页数({total_pages})超过限制({max_pages})，将只处理前{max_pages}页")
-            
-            pages_to_process = min(max_pages, total_pages)
+            if pages_to_process < total_pages:
+                print(f"文档共{total_pages}页，本次只处理第{first_page}-{last_page}页")
             
             # Create output directory - matches local implementation  
             if output_path:
@@ -96,9 +170,20 @@ class OCRProcessor:
                 
             print(f"输出目录: {output_dir}")
             
-            # Execute structured recognition - EXACTLY like local implementation
             print("开始执行结构化文档识别...")
-            output = self.pipeline.predict(input=pdf_path)
+            if self.scheduler:
+                # Pages are rendered and batched with other jobs' pages by the scheduler
+                output = self.scheduler.run(job_id or str(uuid.uuid4()), pdf_path, first_page, last_page)
+            else:
+                # Slice the requested pages so the pipeline never sees the rest of the document
+                input_path = pdf_path
+                if pages_to_process < total_pages:
+                    sliced_pdf_path = self.slice_pdf(pdf_path, first_page, last_page)
+                    input_path = sliced_pdf_path
+                
+                # Execute structured recognition - EXACTLY like local implementation
+                pipeline = self.pool.checkout()
+                output = pipeline.predict(input=input_path)
             
             # Process results and extract markdown and images - matches local implementation
             markdown_list = []
@@ -111,11 +196,12 @@ class OCRProcessor:
                     markdown_images.append(md_info.get("markdown_images", {}))
             
             # Merge markdown pages - matches local implementation
-            if hasattr(self.pipeline, 'concatenate_markdown_pages'):
-                markdown_texts = self.pipeline.concatenate_markdown_pages(markdown_list)
-            else:
-                # Backup method: manual merge
-                markdown_texts = "\n\n".join([str(md) for md in markdown_list if md])
+            markdown_texts = self._concatenate_markdown(markdown_list, pipeline)
+            
+            # Return the pipeline before writing files so other requests can use it
+            if pipeline is not None:
+                self.pool.checkin(pipeline)
+                pipeline = None
             
             if not markdown_texts:
                 markdown_texts = f"# OCR Analysis for {arxiv_id}\n\nPPStructureV3 processing completed but no text content was extracted."
@@ -156,6 +242,9 @@ class OCRProcessor:
             status_info = {
                 'total_pages': total_pages,
                 'processed_pages': pages_to_process,
+                'start_page': first_page,
+                'end_page': last_page,
+                'has_more_pages': last_page < total_pages,
                 'is_oversized': is_oversized,
                 'char_count': total_chars,
                 'method': 'paddleocr',
@@ -163,7 +252,7 @@ class OCRProcessor:
                 'saved_files': saved_files
             }
             
-            print(f"PaddleOCR结构化识别完成，处理了 {pages_to_process}/{total_pages} 页，提取Markdown文本 {total_chars} 个字符，提取图片 {images_saved} 张")
+            print(f"PaddleOCR结构化识别完成，处理了第{first_page}-{last_page}页（共{total_pages}页），提取Markdown文本 {total_chars} 个字符，提取图片 {images_saved} 张")
             
             return markdown_texts, status_info
             
@@ -179,4 +268,44 @@ class OCRProcessor:
                 'char_count': 0,
                 'method': 'paddleocr',
                 'saved_files': []
-            }
\ No newline at end of file
+            }
+        finally:
+            if pipeline is not None:
+                # Still checked out here only if recognition failed, the instance may be broken
+                self.pool.discard(pipeline)
+            if sliced_pdf_path and os.path.exists(sliced_pdf_path):
+                os.remove(sliced_pdf_path)
+    
+    @staticmethod
+    def resolve_page_range(
+        total_pages: int,
+        max_pages: int,
+        start_page: int = 1,
+        end_page: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Resolve the 1-based inclusive page range to process.
+        
+        The range starts at start_page and is capped by end_page, max_pages and
+        the document length. An empty range is returned as first > last.
+        """
+        first_page = max(1, start_page)
+        last_page = first_page + max(1, max_pages) - 1
+        if end_page is not None:
+            last_page = min(last_page, end_page)
+        return first_page, min(last_page, total_pages)
+    
+    @staticmethod
+    def slice_pdf(pdf_path: str, first_page: int, last_page: int) -> str:
+        """
+        Copy pages first_page..last_page (1-based, inclusive) into a temporary PDF.
+        
+        Returns:
+            Path to the sliced PDF, to be removed by the caller
+        """
+        fd, sliced_path = tempfile.mkstemp(suffix='.pdf', dir=os.path.dirname(pdf_path) or None)
+        os.close(fd)
+        with fitz.open(pdf_path) as source, fitz.open() as sliced:
+            sliced.insert_pdf(source, from_page=first_page - 1, to_page=last_page - 1)
+            sliced.save(sliced_path)
+        return sliced_path
\ No newline at end of file
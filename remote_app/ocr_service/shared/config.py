@@ -54,4 +54,27 @@ class OCRServiceConfig(Config):
     # PaddleOCR settings
     USE_ANGLE_CLS = os.getenv('PADDLEOCR_USE_ANGLE_CLS', 'True').lower() in ('true', '1', 'yes', 'on')
     USE_GPU = os.getenv('PADDLEOCR_USE_GPU', 'False').lower() in ('true', '1', 'yes', 'on')
-    LANG = os.getenv('PADDLEOCR_LANG', 'ch')
\ No newline at end of file
+    LANG = os.getenv('PADDLEOCR_LANG', 'ch')
+    
+    # Warm pipeline pool settings
+    POOL_SIZE = int(os.getenv('PADDLEOCR_POOL_SIZE', '1'))
+    POOL_IDLE_TIMEOUT = int(os.getenv('PADDLEOCR_POOL_IDLE_TIMEOUT', '1800'))  # Seconds, 0 disables eviction
+    POOL_PREWARM = int(os.getenv('PADDLEOCR_POOL_PREWARM', '1'))  # Instances loaded at service start
+    
+    # Job queue settings
+    JOB_WORKERS = int(os.getenv('OCR_JOB_WORKERS', '4'))  # Jobs feeding pages to the scheduler concurrently
+    JOB_QUEUE_MAX = int(os.getenv('OCR_JOB_QUEUE_MAX', '100'))  # Pending jobs before new submissions get 503
+    JOB_DB_PATH = os.getenv('OCR_JOB_DB_PATH', os.path.join(RESULTS_DIR, 'ocr_jobs.sqlite3'))
+    JOB_RETENTION_HOURS = int(os.getenv('OCR_JOB_RETENTION_HOURS', '24'))
+    JOB_MAX_WAIT = int(os.getenv('OCR_JOB_MAX_WAIT', '60'))  # Longest long-poll in seconds
+    
+    # Page-batched inference (pages from concurrent jobs share pipeline batches)
+    PAGE_BATCHING = os.getenv('OCR_PAGE_BATCHING', 'True').lower() in ('true', '1', 'yes', 'on')
+    PAGE_BATCH_SIZE = int(os.getenv('OCR_PAGE_BATCH_SIZE', '8'))  # Halved automatically on out-of-memory
+    PAGE_BATCH_WAIT_MS = int(os.getenv('OCR_PAGE_BATCH_WAIT_MS', '50'))
+    
+    # Result cache settings (keyed by PDF SHA-256 + page range + pipeline version)
+    CACHE_ENABLED = os.getenv('OCR_CACHE_ENABLED', 'True').lower() in ('true', '1', 'yes', 'on')
+    CACHE_DIR = os.getenv('OCR_CACHE_DIR', '/tmp/ocr_cache')
+    CACHE_MAX_MB = int(os.getenv('OCR_CACHE_MAX_MB', '2048'))
+    PIPELINE_VERSION = os.getenv('OCR_PIPELINE_VERSION', '')  # Defaults to the installed paddleocr version
\ No newline at end of file
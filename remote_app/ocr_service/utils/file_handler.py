@@ -71,6 +71,42 @@ class FileHandler:
         except Exception as e:
             return False, f"Invalid PDF file: {str(e)}"
     
+    def get_page_count(self, pdf_path: str) -> int:
+        """
+        Number of pages in a PDF.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Page count
+        """
+        with fitz.open(pdf_path) as doc:
+            return len(doc)
+    
+    def create_job_directory(self, job_id: str) -> str:
+        """
+        Create a per-job directory for OCR output, removed when the job is purged.
+        
+        Args:
+            job_id: Unique job identifier
+            
+        Returns:
+            Path to results directory
+        """
+        results_path = self.results_dir / job_id
+        (results_path / "imgs").mkdir(parents=True, exist_ok=True)
+        return str(results_path)
+    
+    def remove_directory(self, dir_path: str) -> None:
+        """
+        Remove a results directory, ignoring errors.
+        
+        Args:
+            dir_path: Directory to remove
+        """
+        shutil.rmtree(dir_path, ignore_errors=True)
+    
     def create_results_directory(self, arxiv_id: str, job_id: str = None) -> str:
         """
         Create directory for storing OCR results.
@@ -137,7 +173,10 @@ class FileHandler:
     
     def cleanup_old_files(self, max_age_hours: int = 24) -> None:
         """
-        Clean up old temporary and result files.
+        Clean up stale uploads left in the temporary directory.
+        
+        Job results are removed together with their jobs and cached OCR results
+        are bounded by LRU eviction, so only the temp directory is swept by age.
         
         Args:
             max_age_hours: Maximum age of files to keep in hours
@@ -146,7 +185,7 @@ class FileHandler:
         current_time = time.time()
         max_age_seconds = max_age_hours * 3600
         
-        for directory in [self.temp_dir, self.results_dir]:
+        for directory in [self.temp_dir]:
             if not directory.exists():
                 continue
                 
@@ -0,0 +1,227 @@
+"""
+Content-addressed OCR result cache for the OCR service.
+
+Results are keyed by (SHA-256 of the PDF bytes, page range, pipeline version), so the
+same paper sent again by a different client is answered from disk without running
+PPStructureV3. Each entry holds the markdown, its images and the status info; the
+total size is bounded and least recently used entries are evicted first.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger('ocr_service')
+
+
+class OCRResultCache:
+    """Disk-backed LRU cache of OCR results."""
+
+    MARKDOWN_FILE = "result.md"
+    STATUS_FILE = "status_info.json"
+    IMAGES_DIR = "imgs"
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 2048):
+        """
+        Args:
+            cache_dir: Directory holding cache entries and the index database
+            max_size_mb: Maximum total size of cached entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.db_path = self.cache_dir / "index.sqlite3"
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=30)
+
+    def _init_db(self):
+        with self._lock, self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ocr_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    pdf_sha256 TEXT NOT NULL,
+                    first_page INTEGER NOT NULL,
+                    last_page INTEGER NOT NULL,
+                    pipeline_version TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_cache_last_access ON ocr_cache(last_access)")
+
+    @staticmethod
+    def hash_pdf(data: bytes) -> str:
+        """SHA-256 of the uploaded PDF bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def make_key(pdf_sha256: str, page_range: Tuple[int, int], pipeline_version: str) -> str:
+        """Cache key for a PDF, a resolved (first, last) page range and a pipeline version."""
+        raw = f"{pdf_sha256}:{page_range[0]}-{page_range[1]}:{pipeline_version}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _entry_dir(self, cache_key: str) -> Path:
+        return self.cache_dir / cache_key[:2] / cache_key
+
+    def lookup(self, cache_key: str, output_dir: str, arxiv_id: str = "unknown") -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Copy a cached result into output_dir.
+
+        Args:
+            cache_key: Key from make_key
+            output_dir: Job results directory to materialise the entry into
+            arxiv_id: ArXiv paper ID used to name the markdown file
+
+        Returns:
+            Tuple of (markdown file path, status info), None on a miss
+        """
+        entry_dir = self._entry_dir(cache_key)
+        with self._lock:
+            with self._connect() as conn:
+                row = conn.execute("SELECT 1 FROM ocr_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+                if row is None or not (entry_dir / self.MARKDOWN_FILE).exists():
+                    self._misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE ocr_cache SET last_access = ?, hits = hits + 1 WHERE cache_key = ?",
+                    (time.time(), cache_key)
+                )
+            self._hits += 1
+
+        try:
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            base_filename = arxiv_id if (arxiv_id and arxiv_id != "unknown") else "unknown"
+            markdown_path = output_path / f"{base_filename}_paddleocr.md"
+            shutil.copyfile(entry_dir / self.MARKDOWN_FILE, markdown_path)
+
+            saved_files = [str(markdown_path)]
+            images_src = entry_dir / self.IMAGES_DIR
+            if images_src.exists():
+                shutil.copytree(images_src, output_path / self.IMAGES_DIR, dirs_exist_ok=True)
+                saved_files.extend(
+                    str(output_path / self.IMAGES_DIR / image.relative_to(images_src))
+                    for image in sorted(images_src.rglob("*")) if image.is_file()
+                )
+
+            with open(entry_dir / self.STATUS_FILE, 'r', encoding='utf-8') as f:
+                status_info = json.load(f)
+            status_info['saved_files'] = saved_files
+            status_info['cache_hit'] = True
+            return str(markdown_path), status_info
+
+        except Exception as e:
+            logger.warning(f"Failed to read OCR cache entry {cache_key}: {e}")
+            self.remove(cache_key)
+            return None
+
+    def put(
+        self,
+        cache_key: str,
+        pdf_sha256: str,
+        page_range: Tuple[int, int],
+        pipeline_version: str,
+        markdown_path: str,
+        status_info: Dict[str, Any]
+    ) -> bool:
+        """
+        Store a finished OCR result, then evict LRU entries over the size limit.
+
+        Args:
+            markdown_path: Markdown file written by the processor; images are read from
+                the imgs/ directory next to it
+
+        Returns:
+            True if the entry was stored
+        """
+        entry_dir = self._entry_dir(cache_key)
+        staging_dir = entry_dir.with_name(f"{cache_key}.tmp-{os.getpid()}-{threading.get_ident()}")
+        try:
+            staging_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(markdown_path, staging_dir / self.MARKDOWN_FILE)
+            images_src = Path(markdown_path).parent / self.IMAGES_DIR
+            if images_src.exists():
+                shutil.copytree(images_src, staging_dir / self.IMAGES_DIR, dirs_exist_ok=True)
+            cached_status = {k: v for k, v in status_info.items() if k != 'saved_files'}
+            with open(staging_dir / self.STATUS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cached_status, f, ensure_ascii=False)
+
+            size_bytes = sum(p.stat().st_size for p in staging_dir.rglob("*") if p.is_file())
+            now = time.time()
+            with self._lock:
+                # Swap the staged entry in, replacing any concurrent copy of the same key
+                if entry_dir.exists():
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                os.replace(staging_dir, entry_dir)
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO ocr_cache (cache_key, pdf_sha256, first_page, last_page, "
+                        "pipeline_version, size_bytes, created_at, last_access, hits) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                        (cache_key, pdf_sha256, page_range[0], page_range[1], pipeline_version,
+                         size_bytes, now, now)
+                    )
+            self.evict()
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to store OCR cache entry {cache_key}: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return False
+
+    def remove(self, cache_key: str):
+        """Drop a single entry."""
+        with self._lock:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM ocr_cache WHERE cache_key = ?", (cache_key,))
+            shutil.rmtree(self._entry_dir(cache_key), ignore_errors=True)
+
+    def evict(self) -> int:
+        """Evict least recently used entries until the cache fits max_size_mb."""
+        evicted: List[str] = []
+        with self._lock:
+            with self._connect() as conn:
+                total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM ocr_cache").fetchone()[0]
+                if total <= self.max_size_bytes:
+                    return 0
+                for cache_key, size_bytes in conn.execute(
+                    "SELECT cache_key, size_bytes FROM ocr_cache ORDER BY last_access"
+                ).fetchall():
+                    if total <= self.max_size_bytes:
+                        break
+                    evicted.append(cache_key)
+                    total -= size_bytes
+                conn.executemany("DELETE FROM ocr_cache WHERE cache_key = ?", [(key,) for key in evicted])
+            for cache_key in evicted:
+                shutil.rmtree(self._entry_dir(cache_key), ignore_errors=True)
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} OCR cache entries")
+        return len(evicted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cache size."""
+        with self._lock, self._connect() as conn:
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM ocr_cache"
+            ).fetchone()
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 3) if lookups else 0.0,
+                'entries': entries,
+                'size_mb': round(total / 1024 / 1024, 1),
+                'max_size_mb': round(self.max_size_bytes / 1024 / 1024, 1)
+            }
@@ -5,6 +5,9 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- 启用随机UUID生成（PostgreSQL 13+）
 CREATE EXTENSION IF NOT EXISTS pgcrypto;
 
+-- 启用三元组索引（论文搜索的子串和中文匹配）
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- 创建数据库用户和权限设置
 DO $$
 BEGIN